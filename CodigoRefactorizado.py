@@ -5,13 +5,23 @@ from __future__ import annotations
 import argparse
 import cProfile
 import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
 import timeit
-from dataclasses import dataclass
-from typing import Dict, List
+import tracemalloc
+import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, Iterator, List, Sequence, Tuple
 
 import numpy as np
 import pstats
 import unittest
+from statistics import NormalDist
 
 
 try:  # pragma: no cover - fallback para line_profiler en entornos sin la librería
@@ -22,16 +32,54 @@ except NameError:  # pragma: no cover
 
 
 FACES = np.arange(1, 7)
+BATCH_MEANS_GROUPS = 32
+MAX_JOINT_OUTCOMES = 2**16  # Casillas máximas del histograma conjunto; por encima se cuentan sumas por jugador.
+CONFIDENCE_LEVEL = 0.95
+
+
+@dataclass
+class ConfidenceInterval:
+	"""Estimación puntual con error estándar e intervalo de confianza (batch means)."""
+
+	estimate: float
+	std_error: float
+	low: float
+	high: float
+
+	def contains(self, value: float) -> bool:
+		"""Indica si ``value`` cae dentro del intervalo."""
+
+		return self.low <= value <= self.high
+
+
+@dataclass
+class PlayerConfidence:
+	"""Incertidumbre de las estadísticas de un jugador.
+
+	``most_common_distinguishable`` es ``False`` cuando la cara más frecuente no se
+	distingue estadísticamente de la segunda (el intervalo de su diferencia incluye 0).
+	"""
+
+	face_probabilities: Dict[int, ConfidenceInterval]
+	mean_points_per_round: ConfidenceInterval
+	most_common_distinguishable: bool
 
 
 @dataclass
 class PlayerStats:
-	"""Representa las estadísticas agregadas de un jugador."""
+	"""Representa las estadísticas agregadas de un jugador.
+
+	Si no se contaron caras (``sums_only``), ``frequencies`` queda en cero y
+	``most_common_value`` en ``None``.
+	"""
 
 	player_id: int
 	total_points: int
 	frequencies: Dict[int, int]
-	most_common_value: int
+	most_common_value: int | None
+	configured_probabilities: Dict[int, float] | None = None
+	confidence: PlayerConfidence | None = None
+	turn_sum_frequencies: Dict[int, int] | None = None
 
 	@classmethod
 	def from_arrays(
@@ -39,16 +87,23 @@ class PlayerStats:
 		player_id: int,
 		frequency_row: np.ndarray,
 		total_points: int,
+		configured_row: np.ndarray | None = None,
 	) -> "PlayerStats":
 		"""Refactorización (Extract Factory Method): crea instancias coherentes desde arreglos numpy."""
 
-		freq_dict = {int(face): int(count) for face, count in zip(FACES, frequency_row)}
-		most_common_value = int(np.argmax(frequency_row) + 1)
+		# ``tolist`` convierte a ``int``/``float`` de Python de una vez; por elemento domina en corridas cortas.
+		counts = frequency_row.tolist()
+		freq_dict = dict(zip(range(1, 7), counts))
+		most_common_value = counts.index(max(counts)) + 1 if any(counts) else None
+		configured = None
+		if configured_row is not None:
+			configured = dict(zip(range(1, 7), configured_row.tolist()))
 		return cls(
 			player_id=player_id,
 			total_points=int(total_points),
 			frequencies=freq_dict,
 			most_common_value=most_common_value,
+			configured_probabilities=configured,
 		)
 
 	def probability_distribution(self) -> Dict[int, float]:
@@ -62,143 +117,2692 @@ class PlayerStats:
 			for face in range(1, 7)
 		}
 
+	def deviation_from_weights(self) -> Dict[int, float] | None:
+		"""Diferencia entre la probabilidad empírica y la configurada (dado justo si no hay pesos).
+
+		``None`` si no se contaron caras: no hay probabilidad empírica que comparar.
+		"""
+
+		if not any(self.frequencies.values()):
+			return None
+		empirical = self.probability_distribution()
+		configured = self.configured_probabilities or {face: 1 / 6 for face in range(1, 7)}
+		return {face: empirical[face] - configured.get(face, 0.0) for face in range(1, 7)}
+
+
+@dataclass
+class GameStatistics:
+	"""Agrupa el resultado completo de una simulación.
+
+	``arrays`` conserva los vectores ``(totales, frecuencias)`` consolidados por el
+	motor, de los que ``ResultsWriter`` exporta sin recorrer los ``PlayerStats``.
+	"""
+
+	total_rounds: int
+	players: List[PlayerStats]
+	winner: PlayerStats
+	winner_margin: ConfidenceInterval | None = None
+	round_wins: Dict[int, int] | None = None
+	tied_rounds: int | None = None
+	dice_per_turn: int = 1
+	trajectory: "ScoreTrajectory | None" = None
+	arrays: Tuple[np.ndarray, np.ndarray] | None = field(default=None, repr=False, compare=False)
+
+	def to_dict(self) -> Dict[str, object]:
+		"""Serializa la estadística del juego a un diccionario estándar.
+
+		Con varios dados por turno agrega ``turn_sum_frequencies`` a cada jugador.
+		"""
+
+		players = []
+		for p in self.players:
+			player = {
+				"player_id": p.player_id,
+				"total_points": p.total_points,
+				"frequencies": p.frequencies,
+				"most_common_value": p.most_common_value,
+			}
+			if p.turn_sum_frequencies is not None:
+				player["turn_sum_frequencies"] = p.turn_sum_frequencies
+			players.append(player)
+		return {
+			"total_rounds": self.total_rounds,
+			"players": players,
+			"winner": {
+				"player_id": self.winner.player_id,
+				"total_points": self.winner.total_points,
+			},
+		}
+
+
+def _validate_inputs(num_players: int, num_rounds: int, batch_size: int) -> None:
+	"""Valida los parámetros de entrada de la simulación.
+
+	Refactorización: Introduce Parameter Validation.
+
+	Args:
+		num_players: Número de jugadores a simular (1-4).
+		num_rounds: Cantidad total de rondas por jugador.
+		batch_size: Tamaño de lote para la simulación.
+
+	Raises:
+		ValueError: Si algún parámetro queda fuera de los límites aceptados.
+	"""
+
+	if not 1 <= num_players <= 4:
+		raise ValueError("El número de jugadores debe estar entre 1 y 4")
+	if num_rounds <= 0:
+		raise ValueError("Las rondas deben ser mayores a cero")
+	if batch_size <= 0:
+		raise ValueError("El tamaño de lote debe ser mayor a cero")
+
+
+def _seed_sequence(seed: int | None) -> np.random.SeedSequence:
+	"""Construye la ``SeedSequence`` raíz compartida por todos los flujos de tiradas.
+
+	Con ``seed=None`` se toma entropía fresca una única vez, de modo que todos los
+	hilos de una misma simulación derivan del mismo estado inicial.
+	"""
+
+	return np.random.SeedSequence(seed)
+
+
+def _stream_bit_generator(
+	seed_sequence: np.random.SeedSequence,
+	start_round: int,
+	words_per_round: int,
+) -> np.random.PCG64:
+	"""Devuelve un ``PCG64`` posicionado al comienzo de ``start_round``.
+
+	Refactorización: Introduce Jump-Ahead Stream. Cada dado consume exactamente una
+	palabra de 64 bits, por lo que la ronda ``r`` empieza en la palabra
+	``r * words_per_round`` (una palabra por jugador con un dado por turno) y
+	``advance`` permite saltar allí en O(log n).
+	"""
+
+	bit_generator = np.random.PCG64(seed_sequence)
+	if start_round:
+		bit_generator.advance(start_round * words_per_round)
+	return bit_generator
+
+
+@dataclass
+class _AliasTable:
+	"""Tablas de alias de Vose por jugador, listas para muestreo vectorizado.
+
+	Las columnas son las caras 0-5, o las sumas posibles de un turno de varios dados.
+	Las tablas están aplanadas con índice ``jugador * columns + columna``, de modo que
+	cada tirada hace dos ``take`` 1-D en lugar de indexado avanzado 2-D con difusión.
+	"""
+
+	probabilities: np.ndarray  # (jugadores, columnas) pesos normalizados.
+	thresholds: np.ndarray  # (jugadores * columnas,) umbrales enteros sobre 32 bits.
+	# (jugadores * columnas * 2,) en ``2 * índice``: la columna; en ``2 * índice + 1``: su alias.
+	choices: np.ndarray
+	_offsets: Dict[int, np.ndarray] = field(default_factory=dict, repr=False, compare=False)
+
+	@property
+	def columns(self) -> int:
+		"""Columnas por jugador."""
+
+		return self.probabilities.shape[1]
+
+	def row_offsets(self, size: int, dice_per_turn: int = 1) -> np.ndarray:
+		"""Desplazamiento ``jugador * columns`` de cada dado de un bloque aplanado de ``size`` dados.
+
+		Se memoriza el bloque más grande pedido y se devuelve un prefijo: sumar un
+		arreglo contiguo es ~3x más rápido que difundir un vector de un elemento por
+		jugador sobre cada ronda.
+		"""
+
+		offsets = self._offsets.get(dice_per_turn)
+		if offsets is None or offsets.size < size:
+			pattern = np.repeat(np.arange(self.probabilities.shape[0], dtype=np.int64) * self.columns, dice_per_turn)
+			offsets = np.tile(pattern, size // pattern.size)
+			self._offsets[dice_per_turn] = offsets
+		return offsets[:size]
+
+
+def _normalize_face_weights(face_weights: Sequence[float] | Sequence[Sequence[float]], num_players: int) -> np.ndarray:
+	"""Convierte los pesos recibidos en una matriz ``(num_players, 6)`` normalizada.
+
+	Acepta un único vector de 6 pesos (compartido por todos) o uno por jugador.
+
+	Raises:
+		ValueError: Si la forma no es válida, hay pesos negativos o alguno suma cero.
+	"""
+
+	weights = np.asarray(face_weights, dtype=np.float64)
+	if weights.shape == (6,):
+		weights = np.tile(weights, (num_players, 1))
+	if weights.shape != (num_players, 6):
+		raise ValueError("Los pesos deben tener 6 valores, o 6 valores por jugador")
+	if not np.all(np.isfinite(weights)) or np.any(weights < 0):
+		raise ValueError("Los pesos de las caras deben ser finitos y no negativos")
+	sums = weights.sum(axis=1, keepdims=True)
+	if np.any(sums <= 0):
+		raise ValueError("Cada jugador necesita al menos una cara con peso positivo")
+	return weights / sums
+
+
+def _build_alias_table(probabilities: np.ndarray) -> _AliasTable:
+	"""Construye las tablas de alias (método de Vose) para cada fila de ``probabilities``.
+
+	Refactorización: Replace Algorithm. En lugar de ``rng.choice(p=...)`` por lote
+	(búsqueda sobre la CDF en cada tirada) se precalcula una tabla O(1) por tirada.
+	"""
+
+	num_players, columns = probabilities.shape
+	thresholds = np.zeros((num_players, columns), dtype=np.uint64)
+	aliases = np.tile(np.arange(columns, dtype=np.int64), (num_players, 1))
+	for player_idx in range(num_players):
+		scaled = list(probabilities[player_idx] * columns)
+		small = [face for face, value in enumerate(scaled) if value < 1.0]
+		large = [face for face, value in enumerate(scaled) if value >= 1.0]
+		keep = [1.0] * columns
+		while small and large:
+			less, more = small.pop(), large.pop()
+			keep[less] = scaled[less]
+			aliases[player_idx, less] = more
+			scaled[more] -= 1.0 - scaled[less]
+			(small if scaled[more] < 1.0 else large).append(more)
+		# Lo que queda en cualquiera de las listas es 1.0 salvo redondeo.
+		thresholds[player_idx] = [min(int(round(value * 2**32)), 2**32) for value in keep]
+	choices = np.stack((np.tile(np.arange(columns, dtype=np.int64), num_players), aliases.ravel()), axis=1)
+	return _AliasTable(probabilities=probabilities, thresholds=thresholds.ravel(), choices=choices.ravel())
+
+
+def _roll_face_indices(
+	bit_generator: np.random.PCG64,
+	rounds: int,
+	num_players: int,
+	alias_table: _AliasTable | None = None,
+	dice_per_turn: int = 1,
+) -> np.ndarray:
+	"""Genera un bloque ``(rounds, num_players)`` de índices de cara en el rango 0-5.
+
+	Cada tirada se obtiene de una palabra cruda con ``palabra % 6``; el sesgo de
+	esa reducción es menor a 2**-61 y, a cambio, el consumo fijo de una palabra por
+	dado hace que el flujo no dependa del tamaño de lote.
+
+	Con ``alias_table`` la misma palabra se divide en dos: los 32 bits altos eligen la
+	columna de la tabla de alias y los 32 bajos deciden entre la cara y su alias, de
+	modo que los dados cargados también consumen una única palabra. Si la tabla es
+	de sumas de turno, los índices devueltos son ``suma - dice_per_turn``. Con cuatro
+	jugadores este camino cuesta ~1.5x el de dados justos y la simulación completa ~1.8x.
+
+	Con ``dice_per_turn > 1`` el bloque es ``(rounds, num_players, dice_per_turn)``.
+	"""
+
+	shape = (rounds, num_players) if dice_per_turn == 1 else (rounds, num_players, dice_per_turn)
+	raw = bit_generator.random_raw(shape)
+	if alias_table is None:
+		np.remainder(raw, np.uint64(6), out=raw)
+		return raw.view(np.int64)  # Valores < 6: la vista int64 es exacta y evita copiar.
+
+	columns = raw >> np.uint64(32)
+	columns *= np.uint64(alias_table.columns)
+	columns >>= np.uint64(32)
+	raw &= np.uint64(0xFFFFFFFF)
+	index = columns.view(np.int64)
+	index += alias_table.row_offsets(raw.size, dice_per_turn).reshape(shape)
+	rejected = raw >= alias_table.thresholds.take(index)
+	index <<= 1
+	index += rejected
+	return alias_table.choices.take(index)
+
+
+def _roll_dice(
+	bit_generator: np.random.PCG64,
+	rounds: int,
+	num_players: int,
+	alias_table: _AliasTable | None = None,
+) -> np.ndarray:
+	"""Genera un bloque ``(rounds, num_players)`` de tiradas en el rango 1-6."""
+
+	faces = _roll_face_indices(bit_generator, rounds, num_players, alias_table)
+	faces += 1
+	return faces
+
+
+@dataclass
+class _JointLayout:
+	"""Decodificación del índice conjunto de una ronda.
+
+	Con ``S = 5 * dice_per_turn + 1`` sumas posibles por turno, la ronda con
+	símbolos ``(c_1, ..., c_p)`` (``c = suma - dice_per_turn``; con un dado, la cara
+	0-5) se codifica como ``c_1 * S**(p-1) + ... + c_p``; cada matriz tiene una fila
+	por código.
+	"""
+
+	outright_winner: np.ndarray  # (S**p, p) 1 si el jugador tiene la única suma máxima.
+	tied: np.ndarray  # (S**p,) 1 si la suma máxima está repetida.
+	# (S**p, p*S + p + 1) en float64: marginales, ganadores y empates en un solo producto.
+	# ``None`` si la matriz superaría ``_PROJECTION_LIMIT`` celdas.
+	projection: np.ndarray | None = None
+
+
+_JOINT_LAYOUTS: Dict[Tuple[int, int], _JointLayout] = {}
+_PROJECTION_LIMIT = 2**18  # Celdas máximas de ``_JointLayout.projection`` (2 MB).
+
+
+def _joint_layout(num_players: int, dice_per_turn: int = 1) -> _JointLayout:
+	"""Devuelve (y memoriza) la tabla de decodificación para la configuración dada."""
+
+	layout = _JOINT_LAYOUTS.get((num_players, dice_per_turn))
+	if layout is None:
+		symbols = np.indices((5 * dice_per_turn + 1,) * num_players).reshape(num_players, -1).T
+		top = symbols == symbols.max(axis=1, keepdims=True)
+		tied = top.sum(axis=1) > 1
+		layout = _JointLayout(
+			outright_winner=(top & ~tied[:, None]).astype(np.int64),
+			tied=tied.astype(np.int64),
+		)
+		width = 5 * dice_per_turn + 1
+		if len(symbols) * (num_players * (width + 1) + 1) <= _PROJECTION_LIMIT:
+			# Los conteos son enteros < 2**53, así que el producto en float64 es exacto.
+			marginals = np.zeros((len(symbols), num_players * width))
+			marginals[np.arange(len(symbols))[:, None], np.arange(num_players) * width + symbols] = 1
+			layout.projection = np.hstack((marginals, layout.outright_winner, layout.tied[:, None])).astype(np.float64)
+		_JOINT_LAYOUTS[(num_players, dice_per_turn)] = layout
+	return layout
+
+
+def _joint_codes(symbols: np.ndarray, base: int = 6) -> np.ndarray:
+	"""Codifica cada fila de símbolos ``< base`` en un único entero ``< base**jugadores``."""
+
+	codes = symbols[:, 0].copy()
+	for column in range(1, symbols.shape[1]):
+		codes *= base
+		codes += symbols[:, column]
+	return codes
+
+
+def _dice_sum_probabilities(face_probabilities: np.ndarray, dice_per_turn: int) -> np.ndarray:
+	"""Distribución de la suma de ``dice_per_turn`` dados por jugador.
+
+	Returns:
+		Matriz ``(jugadores, 5 * dice_per_turn + 1)``; la columna ``i`` es la
+		probabilidad de sumar ``dice_per_turn + i``.
+	"""
+
+	sums = np.ones((face_probabilities.shape[0], 1))
+	for _ in range(dice_per_turn):
+		sums = np.stack([np.convolve(row, faces) for row, faces in zip(sums, face_probabilities)])
+	return sums
+
+
+def _validate_turn(num_players: int, dice_per_turn: int) -> None:
+	"""Valida la cantidad de dados por turno.
+
+	Raises:
+		ValueError: Si no es positiva.
+	"""
+
+	if dice_per_turn <= 0:
+		raise ValueError("Los dados por turno deben ser mayores a cero")
+
+
+def _uses_marginals(num_players: int, dice_per_turn: int, sums_only: bool) -> bool:
+	"""``True`` si los grupos cuentan sumas por jugador en lugar del histograma conjunto.
+
+	Con ``sums_only`` el costo no debe crecer con los dados por turno, y el histograma
+	de ``(5 * dice_per_turn + 1) ** jugadores`` casillas sí crece; por encima de
+	``MAX_JOINT_OUTCOMES`` casillas tampoco entra en memoria por grupo y por hilo.
+	"""
+
+	return sums_only or (5 * dice_per_turn + 1) ** num_players > MAX_JOINT_OUTCOMES
+
+
+@dataclass
+class _GroupSummary:
+	"""Arreglos por grupo derivados de ``_BatchGroups`` (ver ``_BatchGroups.summary``)."""
+
+	sizes: np.ndarray  # (grupos,) rondas por grupo.
+	dice_per_turn: int
+	turn_sums: np.ndarray  # (grupos, jugadores, S); la columna i cuenta la suma dice_per_turn + i.
+	totals: np.ndarray  # (grupos, jugadores)
+	frequencies: np.ndarray | None  # (grupos, jugadores, 6); None si sólo se muestrearon sumas.
+	round_wins: np.ndarray  # (grupos, jugadores) rondas ganadas sin empate.
+	tied_rounds: np.ndarray  # (grupos,) rondas con la suma máxima repetida.
+
+
+@dataclass
+class _BatchGroups:
+	"""Acumuladores por grupo para el método de *batch means*.
+
+	Las rondas ``[0, num_rounds)`` se dividen en hasta ``BATCH_MEANS_GROUPS`` tramos
+	contiguos de igual tamaño (independientes de ``batch_size``), o en uno solo si no
+	se piden intervalos de confianza. Los totales y
+	frecuencias globales son la suma de los grupos, así que el método sólo agrega
+	O(grupos) de memoria y ninguna tirada extra.
+
+	Refactorización: Replace Derived Data with Query. Cada grupo guarda sólo el
+	histograma conjunto de resultados de ronda (``6**jugadores`` casillas, 1296 con
+	cuatro jugadores); totales, frecuencias, ganadores por ronda y empates se
+	derivan de él. Con varios dados por turno el histograma es de sumas de turno y
+	las caras se cuentan aparte en ``face_counts`` (``None`` si sólo se muestrean sumas).
+
+	Con ``marginal`` (ver ``_uses_marginals``) cada grupo guarda directamente las
+	columnas de ``_JointLayout.projection``: ``jugadores * S`` conteos de sumas por
+	jugador, las rondas ganadas sin empate por jugador y las empatadas. Ocupa
+	O(jugadores * dados) por grupo en lugar de ``S**jugadores``.
+	"""
+
+	bounds: np.ndarray  # (grupos + 1,) límites de ronda.
+	outcomes: np.ndarray  # (grupos, S**jugadores) rondas por resultado conjunto, o (grupos, jugadores*S + jugadores + 1).
+	num_players: int
+	dice_per_turn: int = 1
+	face_counts: np.ndarray | None = None  # (grupos, jugadores, 6), sólo con dice_per_turn > 1.
+	marginal: bool = False
+
+	@classmethod
+	def empty(
+		cls,
+		num_rounds: int,
+		num_players: int,
+		dice_per_turn: int = 1,
+		track_faces: bool = True,
+		marginal: bool = False,
+		batch_means: bool = True,
+	) -> "_BatchGroups":
+		"""Crea acumuladores vacíos para una simulación de ``num_rounds`` rondas.
+
+		Con ``batch_means=False`` hay un único grupo: alcanza para los totales y evita
+		el costo por grupo en las llamadas cortas que no piden intervalos.
+		"""
+
+		groups = min(BATCH_MEANS_GROUPS, num_rounds) if batch_means else 1
+		bounds = np.array([idx * num_rounds // groups for idx in range(groups + 1)], dtype=np.int64)
+		face_counts = None
+		if dice_per_turn > 1 and track_faces:
+			face_counts = np.zeros((groups, num_players, 6), dtype=np.int64)
+		width = 5 * dice_per_turn + 1
+		cells = num_players * (width + 1) + 1 if marginal else width**num_players
+		return cls(
+			bounds=bounds,
+			outcomes=np.zeros((groups, cells), dtype=np.int64),
+			num_players=num_players,
+			dice_per_turn=dice_per_turn,
+			face_counts=face_counts,
+			marginal=marginal,
+		)
+
+	@property
+	def sizes(self) -> np.ndarray:
+		"""Rondas por grupo."""
+
+		return self.bounds[1:] - self.bounds[:-1]
+
+	@property
+	def symbols(self) -> int:
+		"""Sumas de turno posibles por jugador."""
+
+		return 5 * self.dice_per_turn + 1
+
+	@property
+	def layout(self) -> _JointLayout:
+		"""Tabla de decodificación según jugadores y dados por turno."""
+
+		return _joint_layout(self.num_players, self.dice_per_turn)
+
+	def round_codes(self, symbols: np.ndarray) -> np.ndarray:
+		"""Códigos que ``outcomes`` cuenta para las rondas ``symbols`` ``(rondas, jugadores)``.
+
+		Un índice conjunto por ronda (ver ``_joint_codes``) o, con ``marginal``,
+		``jugadores + 1`` columnas: la suma de cada jugador y el ganador sin empate
+		(la columna de empates si la suma máxima está repetida).
+		"""
+
+		if not self.marginal:
+			return _joint_codes(symbols, self.symbols)
+		players, width = self.num_players, self.symbols
+		codes = np.empty((len(symbols), players + 1), dtype=np.int64)
+		np.add(symbols, width * np.arange(players), out=codes[:, :players])
+		tied = (symbols == symbols.max(axis=1, keepdims=True)).sum(axis=1) > 1
+		codes[:, players] = np.where(tied, players, symbols.argmax(axis=1)) + players * width
+		return codes
+
+	def summary(self) -> _GroupSummary:
+		"""Deriva del histograma conjunto todos los arreglos por grupo en una sola pasada.
+
+		Con ``_JointLayout.projection`` es un único producto matricial; si no, una
+		reducción por jugador. Quien necesite varios arreglos debe pedir el resumen
+		una vez: marginalizar el histograma domina el costo fijo de las corridas cortas.
+		Con ``marginal`` los grupos ya guardan la proyección y no hay nada que reducir.
+		"""
+
+		players, width = self.num_players, self.symbols
+		projected = None
+		if self.marginal:
+			projected = self.outcomes
+		elif self.layout.projection is not None:
+			projection = self.layout.projection
+			if len(self.outcomes) == 1 and self.bounds[-1] * 8 < self.outcomes.size:
+				# Un único grupo corto (sin *batch means*): ``take`` evita el indexado avanzado.
+				cells = np.flatnonzero(self.outcomes[0])
+				projected = (self.outcomes[0].take(cells).astype(np.float64) @ projection.take(cells, axis=0))[None]
+			elif self.bounds[-1] * 8 < self.outcomes.size:
+				# Corridas cortas: hay a lo sumo una casilla ocupada por ronda; se proyectan sólo esas.
+				rows, cells = np.divmod(np.flatnonzero(self.outcomes != 0), self.outcomes.shape[1])
+				weighted = projection[cells] * self.outcomes[rows, cells][:, None]
+				starts = np.flatnonzero(np.diff(rows, prepend=-1))
+				projected = np.zeros((len(self.outcomes), projection.shape[1]))
+				projected[rows[starts]] = np.add.reduceat(weighted, starts)
+			else:
+				projected = self.outcomes.astype(np.float64) @ projection
+			projected = np.rint(projected).astype(np.int64)
+		if projected is not None:
+			turn_sums = projected[:, : players * width].reshape(-1, players, width)
+			round_wins = projected[:, players * width : -1]
+			tied_rounds = projected[:, -1]
+		else:
+			layout = self.layout
+			joint = self.outcomes.reshape((-1,) + (width,) * players)
+			turn_sums = np.stack(
+				[joint.sum(axis=tuple(1 + other for other in range(players) if other != idx)) for idx in range(players)],
+				axis=1,
+			)
+			round_wins = self.outcomes @ layout.outright_winner
+			tied_rounds = self.outcomes @ layout.tied
+		return _GroupSummary(
+			sizes=self.sizes,
+			dice_per_turn=self.dice_per_turn,
+			turn_sums=turn_sums,
+			totals=turn_sums @ np.arange(self.dice_per_turn, 6 * self.dice_per_turn + 1),
+			frequencies=turn_sums if self.dice_per_turn == 1 else self.face_counts,
+			round_wins=round_wins,
+			tied_rounds=tied_rounds,
+		)
+
+	def merge(self, other: "_BatchGroups") -> "_BatchGroups":
+		"""Suma acumuladores de rangos disjuntos de la misma simulación."""
+
+		return _BatchGroups(
+			bounds=self.bounds,
+			outcomes=self.outcomes + other.outcomes,
+			num_players=self.num_players,
+			dice_per_turn=self.dice_per_turn,
+			face_counts=None if self.face_counts is None else self.face_counts + other.face_counts,
+			marginal=self.marginal,
+		)
+
+	def segments(self, start_round: int, rounds: int) -> Tuple[np.ndarray, slice]:
+		"""Divide el lote ``[start_round, start_round + rounds)`` según los grupos.
+
+		Returns:
+			``(lengths, span)``: largo de cada segmento del lote y el tramo de grupos
+			que cubren, en el mismo orden.
+		"""
+
+		if len(self.bounds) == 2:
+			# Un único grupo (sin *batch means*): el lote entero cae en él.
+			return np.array([rounds]), slice(0, 1)
+		first = int(np.searchsorted(self.bounds, start_round, side="right")) - 1
+		inner = self.bounds[(self.bounds > start_round) & (self.bounds < start_round + rounds)]
+		edges = np.concatenate(([start_round], inner, [start_round + rounds]))
+		return np.diff(edges), slice(first, first + len(edges) - 1)
+
+
+@dataclass
+class ScoreTrajectory:
+	"""Evolución submuestreada de una simulación, de tamaño fijo sin importar las rondas.
+
+	Cada punto ``i`` cierra el tramo de rondas ``(rounds[i - 1], rounds[i]]``:
+	``totals`` y ``probabilities`` son los valores acumulados al cierre, y
+	``deviation_low``/``deviation_high`` la envolvente mínima/máxima dentro del tramo
+	de ``total - esperado`` (puntos acumulados menos la esperanza a esa ronda).
+	``probabilities[..., c]`` es la frecuencia empírica del resultado de turno ``c``
+	(la cara ``c + 1`` con un dado por turno, la suma ``dice_per_turn + c`` con varios).
+	"""
+
+	rounds: np.ndarray  # (puntos,)
+	totals: np.ndarray  # (puntos, jugadores)
+	deviation_low: np.ndarray  # (puntos, jugadores)
+	deviation_high: np.ndarray  # (puntos, jugadores)
+	probabilities: np.ndarray  # (puntos, jugadores, resultados posibles)
+
+
+class _TrajectoryRecorder:
+	"""Acumula ``ScoreTrajectory`` lote a lote con memoria O(puntos)."""
+
+	def __init__(
+		self,
+		num_rounds: int,
+		points: int,
+		expected_per_round: np.ndarray,
+		dice_per_turn: int,
+		marginal: bool = False,
+	) -> None:
+		points = min(points, num_rounds)
+		self.checkpoints = np.unique(np.ceil(np.arange(1, points + 1) * num_rounds / points).astype(np.int64))
+		num_players = len(expected_per_round)
+		# Debe contar los mismos códigos que los grupos de la simulación (ver ``round_codes``).
+		self.layout = _BatchGroups.empty(1, num_players, dice_per_turn, track_faces=False, marginal=marginal)
+		self.step_offset = dice_per_turn - expected_per_round
+		self.deviation = np.zeros(num_players)
+		self.low = np.full(num_players, np.inf)
+		self.high = np.full(num_players, -np.inf)
+		self.segment = 0
+		points = len(self.checkpoints)
+		self.trajectory = ScoreTrajectory(
+			rounds=self.checkpoints,
+			totals=np.zeros((points, num_players), dtype=np.int64),
+			deviation_low=np.zeros((points, num_players)),
+			deviation_high=np.zeros((points, num_players)),
+			probabilities=np.zeros((points, num_players, self.layout.symbols)),
+		)
+
+	def record(self, symbols: np.ndarray, codes: np.ndarray, position: int) -> None:
+		"""Procesa un lote que empieza en la ronda ``position``.
+
+		Args:
+			symbols: Símbolos de turno ``(rondas, jugadores)``.
+			codes: Códigos de esas rondas (ver ``_BatchGroups.round_codes``).
+			position: Ronda global de la primera fila.
+		"""
+
+		running = self.layout.outcomes[0]
+		begin = 0
+		while begin < len(codes):
+			checkpoint = int(self.checkpoints[self.segment])
+			end = min(len(codes), checkpoint - position)
+			# Desvío acumulado: suma de (resultado - esperado) ronda a ronda. Se trabaja
+			# con (jugadores, rondas) contiguo porque reducir sobre el eje corto es lento.
+			steps = np.ascontiguousarray(symbols[begin:end].T, dtype=np.float64)
+			steps += self.step_offset[:, None]
+			np.cumsum(steps, axis=1, out=steps)
+			steps += self.deviation[:, None]
+			np.minimum(self.low, steps.min(axis=1), out=self.low)
+			np.maximum(self.high, steps.max(axis=1), out=self.high)
+			self.deviation = steps[:, -1].copy()
+			running += np.bincount(codes[begin:end].ravel(), minlength=len(running))
+			if position + end == checkpoint:
+				trajectory, summary = self.trajectory, self.layout.summary()
+				trajectory.totals[self.segment] = summary.totals[0]
+				trajectory.deviation_low[self.segment] = self.low
+				trajectory.deviation_high[self.segment] = self.high
+				trajectory.probabilities[self.segment] = summary.turn_sums[0] / checkpoint
+				self.low[:] = np.inf
+				self.high[:] = -np.inf
+				self.segment += 1
+			begin = end
+
+
+def _grouped_bincount(values: np.ndarray, lengths: np.ndarray, cells: int) -> np.ndarray:
+	"""Cuenta ``values`` (``< cells``) por tramos consecutivos de filas de largo ``lengths``.
+
+	Un solo ``bincount`` con el tramo como dígito más significativo: en corridas cortas
+	un lote cruza todos los grupos y un ``bincount`` por grupo dominaría el costo.
+
+	Returns:
+		Matriz ``(len(lengths), cells)``.
+	"""
+
+	if len(lengths) > 1:
+		labels = np.repeat(np.arange(len(lengths)) * cells, lengths)
+		values = values + labels.reshape((-1,) + (1,) * (values.ndim - 1))
+	return np.bincount(values.ravel(), minlength=len(lengths) * cells).reshape(len(lengths), cells)
+
+
+def _accumulate_rounds(
+	seed_sequence: np.random.SeedSequence,
+	start_round: int,
+	stop_round: int,
+	num_players: int,
+	batch_size: int,
+	alias_table: _AliasTable | None,
+	groups: _BatchGroups,
+	trajectory: _TrajectoryRecorder | None = None,
+) -> _BatchGroups:
+	"""Acumula en ``groups`` el histograma conjunto de ``[start_round, stop_round)``.
+
+	Refactorización: Extract Function para compartir el bucle por lotes entre el motor
+	secuencial y el motor con hilos. Cada ronda se codifica en un índice base 6 y un
+	único ``bincount`` por segmento reemplaza la comparación ``(lote, jugadores, 6)``
+	y la suma separada de totales.
+
+	Con ``groups.dice_per_turn > 1`` hay dos caminos: si ``groups.face_counts``
+	existe se tiran todos los dados (una palabra por dado) y se cuentan sus caras;
+	si no, ``alias_table`` es la tabla de sumas de turno y cada turno consume una
+	sola palabra, así que el costo no crece con la cantidad de dados.
+
+	``trajectory``, si se indica, recibe cada lote para registrar la evolución
+	submuestreada de la simulación.
+
+	Returns:
+		El mismo ``groups`` recibido, ya actualizado.
+	"""
+
+	dice_per_turn = groups.dice_per_turn
+	roll_every_die = dice_per_turn > 1 and groups.face_counts is not None
+	words_per_round = num_players * (dice_per_turn if roll_every_die else 1)
+	bit_generator = _stream_bit_generator(seed_sequence, start_round, words_per_round)
+	player_offsets = 6 * np.arange(num_players)[:, None]
+
+	bins = groups.outcomes.shape[1]
+	position = start_round
+	while position < stop_round:
+		current_batch = min(batch_size, stop_round - position)
+		lengths, span = groups.segments(position, current_batch)
+		if roll_every_die:
+			faces = _roll_face_indices(bit_generator, current_batch, num_players, alias_table, dice_per_turn)
+			symbols = faces.sum(axis=2)
+			faces += player_offsets
+			groups.face_counts[span] += _grouped_bincount(faces, lengths, num_players * 6).reshape(-1, num_players, 6)
+		else:
+			symbols = _roll_face_indices(bit_generator, current_batch, num_players, alias_table)
+		codes = groups.round_codes(symbols)
+		if trajectory is not None:
+			trajectory.record(symbols, codes, position)
+		groups.outcomes[span] += _grouped_bincount(codes, lengths, bins)
+		position += current_batch
+	return groups
+
+
+def _student_t_quantile(probability: float, dof: int) -> float:
+	"""Cuantil de la t de Student por expansión de Cornish-Fisher (error < 1e-3 para dof >= 3)."""
+
+	z = NormalDist().inv_cdf(probability)
+	return (
+		z
+		+ (z**3 + z) / (4 * dof)
+		+ (5 * z**5 + 16 * z**3 + 3 * z) / (96 * dof**2)
+		+ (3 * z**7 + 19 * z**5 + 17 * z**3 - 15 * z) / (384 * dof**3)
+	)
+
+
+def _batch_means_intervals(estimates: np.ndarray, group_values: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+	"""Error estándar e intervalo de confianza por *batch means* sobre el eje 0.
+
+	Returns:
+		``(std_error, low, high)`` con la forma de ``estimates``; ``nan`` si hay un solo grupo.
+	"""
+
+	groups = group_values.shape[0]
+	if groups < 2:
+		nan = np.full(np.shape(estimates), np.nan)
+		return nan, nan, nan
+	std_error = group_values.std(axis=0, ddof=1) / np.sqrt(groups)
+	half_width = _student_t_quantile(0.5 + CONFIDENCE_LEVEL / 2, groups - 1) * std_error
+	return std_error, estimates - half_width, estimates + half_width
+
+
+def _interval(estimate: float, std_error: float, low: float, high: float) -> ConfidenceInterval:
+	return ConfidenceInterval(float(estimate), float(std_error), float(low), float(high))
+
+
+def _player_confidence(groups: _GroupSummary, num_rounds: int) -> List[PlayerConfidence]:
+	"""Calcula los intervalos de cada jugador a partir de los grupos."""
+
+	sizes = groups.sizes.astype(np.float64)
+	group_frequencies, group_totals = groups.frequencies, groups.totals
+	group_probabilities = group_frequencies / (sizes[:, None, None] * groups.dice_per_turn)
+	probabilities = group_frequencies.sum(axis=0) / (num_rounds * groups.dice_per_turn)
+	prob_se, prob_low, prob_high = _batch_means_intervals(probabilities, group_probabilities)
+	group_means = group_totals / sizes[:, None]
+	means = group_totals.sum(axis=0) / num_rounds
+	mean_se, mean_low, mean_high = _batch_means_intervals(means, group_means)
+
+	# Diferencia entre la cara más frecuente y la segunda, de todos los jugadores a la vez.
+	ranked = np.argsort(probabilities, axis=1)[:, ::-1]
+	players = np.arange(len(ranked))
+	top, second = ranked[:, 0], ranked[:, 1]
+	difference = group_probabilities[:, players, top] - group_probabilities[:, players, second]
+	_, diff_lows, _ = _batch_means_intervals(probabilities[players, top] - probabilities[players, second], difference)
+
+	confidences = []
+	for idx, diff_low in enumerate(diff_lows):
+		confidences.append(
+			PlayerConfidence(
+				face_probabilities={
+					face: _interval(
+						probabilities[idx, face - 1],
+						prob_se[idx, face - 1],
+						prob_low[idx, face - 1],
+						prob_high[idx, face - 1],
+					)
+					for face in range(1, 7)
+				},
+				mean_points_per_round=_interval(means[idx], mean_se[idx], mean_low[idx], mean_high[idx]),
+				most_common_distinguishable=bool(diff_low > 0),
+			)
+		)
+	return confidences
+
+
+def _build_game_statistics(
+	num_rounds: int,
+	totals: np.ndarray,
+	frequencies: np.ndarray | None,
+	face_probabilities: np.ndarray | None = None,
+	groups: _GroupSummary | None = None,
+	confidence: bool = False,
+) -> GameStatistics:
+	"""Arma el ``GameStatistics`` final a partir de los acumuladores consolidados.
+
+	Con ``groups`` agrega las rondas ganadas y empatadas que surgen del histograma
+	conjunto y, si además ``confidence``, intervalos de confianza por *batch means* a
+	cada jugador y al margen del ganador sobre el segundo. ``frequencies=None`` (sólo sumas de turno) deja
+	las frecuencias por cara en cero y omite sus intervalos.
+	"""
+
+	if frequencies is None:
+		frequencies = np.zeros((len(totals), 6), dtype=np.int64)
+	player_stats = _build_player_stats(totals, frequencies, face_probabilities)
+	winner = max(player_stats, key=lambda p: p.total_points)
+	stats = GameStatistics(
+		total_rounds=num_rounds,
+		players=player_stats,
+		winner=winner,
+		arrays=(np.asarray(totals, dtype=np.int64), np.asarray(frequencies, dtype=np.int64)),
+	)
+	if groups is None:
+		return stats
+
+	stats.dice_per_turn = groups.dice_per_turn
+	if confidence and groups.frequencies is not None:
+		for player, player_confidence in zip(player_stats, _player_confidence(groups, num_rounds)):
+			player.confidence = player_confidence
+	if groups.dice_per_turn > 1:
+		sums = groups.turn_sums.sum(axis=0)
+		for player, row in zip(player_stats, sums):
+			player.turn_sum_frequencies = {
+				groups.dice_per_turn + idx: int(count) for idx, count in enumerate(row) if count
+			}
+	round_wins = groups.round_wins.sum(axis=0)
+	stats.round_wins = {idx + 1: int(wins) for idx, wins in enumerate(round_wins)}
+	stats.tied_rounds = int(groups.tied_rounds.sum())
+	if confidence and len(player_stats) > 1:
+		winner_idx = winner.player_id - 1
+		runner_up_idx = max(
+			(p for p in player_stats if p is not winner), key=lambda p: p.total_points
+		).player_id - 1
+		group_totals = groups.totals
+		group_margins = (group_totals[:, winner_idx] - group_totals[:, runner_up_idx]) / groups.sizes
+		margin = (totals[winner_idx] - totals[runner_up_idx]) / num_rounds
+		se, low, high = _batch_means_intervals(np.float64(margin), group_margins)
+		# Se reporta en puntos totales: margen por ronda × rondas.
+		stats.winner_margin = _interval(margin * num_rounds, se * num_rounds, low * num_rounds, high * num_rounds)
+	return stats
+
+
+def _game_statistics_from_groups(
+	num_rounds: int,
+	groups: _BatchGroups,
+	face_probabilities: np.ndarray | None = None,
+	confidence: bool = False,
+) -> GameStatistics:
+	"""Consolida los grupos y arma el resultado, con intervalos de confianza si se piden."""
+
+	summary = groups.summary()
+	frequencies = summary.frequencies
+	return _build_game_statistics(
+		num_rounds,
+		summary.totals.sum(axis=0),
+		None if frequencies is None else frequencies.sum(axis=0),
+		face_probabilities,
+		summary,
+		confidence,
+	)
+
+
+@profile
+def simulate_dice_game(
+	num_players: int,
+	num_rounds: int,
+	*,
+	batch_size: int = 100_000,
+	seed: int | None = None,
+	face_weights: Sequence[float] | Sequence[Sequence[float]] | None = None,
+	dice_per_turn: int = 1,
+	sums_only: bool = False,
+	trajectory_points: int | None = None,
+	confidence: bool = False,
+) -> GameStatistics:
+	"""Simula un juego de dados vectorizado usando lotes.
+
+	Refactorización: Introduce Batch Processing + Vectorization.
+
+	El resultado para una semilla dada no depende de ``batch_size``: las tiradas
+	provienen de un único flujo ``PCG64`` que consume una palabra por dado.
+
+	Args:
+		num_players: Número de jugadores a simular.
+		num_rounds: Cantidad de rondas que ejecutará cada jugador.
+		batch_size: Tamaño máximo del bloque procesado en cada iteración.
+		seed: Semilla opcional para reproducibilidad.
+		face_weights: Pesos de las caras 1-6 para dados cargados, uno compartido o
+			uno por jugador. Se muestrean con tablas de alias; ``None`` usa dados justos.
+		dice_per_turn: Dados que tira cada jugador por ronda (p. ej. 3 para 3d6).
+		sums_only: Con ``dice_per_turn > 1``, muestrea directamente la suma del turno
+			desde su distribución (una palabra por turno). Las frecuencias por cara
+			quedan en cero; ``PlayerStats.turn_sum_frequencies`` se completa igual.
+		trajectory_points: Si se indica, registra en ``GameStatistics.trajectory`` a
+			lo sumo esa cantidad de puntos equiespaciados (totales, probabilidades y
+			envolvente de desvíos); la memoria no depende de ``num_rounds``.
+		confidence: Si es ``True``, agrega intervalos de confianza por *batch means*
+			(``PlayerStats.confidence`` y ``GameStatistics.winner_margin``). Es opcional
+			porque en llamadas cortas cuesta varias veces más que la simulación.
+
+	Returns:
+		Instancia `GameStatistics` con los resultados consolidados.
+
+	Raises:
+		ValueError: Si algún parámetro es inválido.
+	"""
+
+	_validate_inputs(num_players, num_rounds, batch_size)
+	_validate_turn(num_players, dice_per_turn)
+	if trajectory_points is not None and trajectory_points <= 0:
+		raise ValueError("Los puntos de la trayectoria deben ser mayores a cero")
+	alias_table, face_probabilities = _turn_tables(face_weights, num_players, dice_per_turn, sums_only)
+	marginal = _uses_marginals(num_players, dice_per_turn, sums_only)
+	recorder = None
+	if trajectory_points is not None:
+		face_means = np.full(num_players, 3.5) if face_probabilities is None else face_probabilities @ FACES
+		recorder = _TrajectoryRecorder(
+			num_rounds, trajectory_points, face_means * dice_per_turn, dice_per_turn, marginal
+		)
+
+	groups = _accumulate_rounds(
+		_seed_sequence(seed),
+		0,
+		num_rounds,
+		num_players,
+		batch_size,
+		alias_table,
+		_BatchGroups.empty(num_rounds, num_players, dice_per_turn, not sums_only, marginal, confidence),
+		recorder,
+	)
+	stats = _game_statistics_from_groups(num_rounds, groups, face_probabilities, confidence)
+	if recorder is not None:
+		stats.trajectory = recorder.trajectory
+	return stats
+
+
+def _turn_tables(
+	face_weights: Sequence[float] | Sequence[Sequence[float]] | None,
+	num_players: int,
+	dice_per_turn: int,
+	sums_only: bool,
+) -> Tuple[_AliasTable | None, np.ndarray | None]:
+	"""Prepara el muestreo de un turno.
+
+	Returns:
+		``(tabla, probabilidades)``: la tabla de alias a usar (de caras, de sumas de
+		turno con ``sums_only``, o ``None`` para dados justos tirados uno a uno) y las
+		probabilidades configuradas por cara (``None`` para dados justos).
+	"""
+
+	face_probabilities = None if face_weights is None else _normalize_face_weights(face_weights, num_players)
+	if dice_per_turn > 1 and sums_only:
+		faces = np.full((num_players, 6), 1 / 6) if face_probabilities is None else face_probabilities
+		return _build_alias_table(_dice_sum_probabilities(faces, dice_per_turn)), face_probabilities
+	return (None if face_probabilities is None else _build_alias_table(face_probabilities)), face_probabilities
+
+
+def _alias_table_for(
+	face_weights: Sequence[float] | Sequence[Sequence[float]] | None,
+	num_players: int,
+) -> _AliasTable | None:
+	"""Devuelve la tabla de alias para ``face_weights`` o ``None`` para dados justos."""
+
+	if face_weights is None:
+		return None
+	return _build_alias_table(_normalize_face_weights(face_weights, num_players))
+
+
+def rolls_for_rounds(
+	num_players: int,
+	start_round: int,
+	stop_round: int,
+	*,
+	seed: int,
+	face_weights: Sequence[float] | Sequence[Sequence[float]] | None = None,
+) -> np.ndarray:
+	"""Devuelve las tiradas exactas de las rondas ``[start_round, stop_round)``.
+
+	Refactorización: Introduce Jump-Ahead Stream para auditoría. Como cada dado
+	consume una palabra del flujo ``PCG64``, ``advance`` salta al inicio del rango
+	en O(log n) y sólo se generan las rondas pedidas: el costo es O(rango) aunque
+	el rango esté en la ronda 7e9. El resultado coincide con lo que
+	``simulate_dice_game`` (o sus variantes con hilos o shards) usó con la misma
+	semilla y pesos, para cualquier ``batch_size``, siempre que esa simulación haya
+	sido de un dado por turno: con ``dice_per_turn > 1`` cada ronda consume otra
+	cantidad de palabras y los rangos no se corresponden.
+
+	Args:
+		num_players: Número de jugadores de la simulación auditada.
+		start_round: Primera ronda (desde 0).
+		stop_round: Ronda final, exclusiva.
+		seed: Semilla de la simulación auditada.
+		face_weights: Pesos usados en la simulación, si los hubo.
+
+	Returns:
+		Matriz ``(stop_round - start_round, num_players)`` con caras 1-6.
+
+	Raises:
+		ValueError: Si el rango es vacío o negativo, o los parámetros son inválidos.
+	"""
+
+	if start_round < 0 or stop_round <= start_round:
+		raise ValueError("El rango de rondas debe cumplir 0 <= inicio < fin")
+	_validate_inputs(num_players, stop_round, 1)
+	bit_generator = _stream_bit_generator(_seed_sequence(seed), start_round, num_players)
+	return _roll_dice(
+		bit_generator, stop_round - start_round, num_players, _alias_table_for(face_weights, num_players)
+	)
+
+
+@dataclass
+class SmallGameResult:
+	"""Resultado liviano de ``SmallGameSimulator.play``: sólo arreglos, sin diccionarios."""
+
+	totals: np.ndarray  # (jugadores,)
+	frequencies: np.ndarray  # (jugadores, 6), conteos de las caras 1-6
+
+	@property
+	def winner(self) -> int:
+		"""Jugador (desde 1) con más puntos; ante empate, el primero, como ``GameStatistics``."""
+
+		return int(self.totals.argmax()) + 1
+
+
+class SmallGameSimulator:
+	"""Simulador reutilizable para muchas partidas cortas (decenas a miles de rondas).
+
+	Refactorización: Replace Function with Command. Con pocas rondas el costo de
+	``simulate_dice_game`` es fijo (validación, ``SeedSequence``, grupos de medias por
+	lotes, diccionarios y dataclasses). Este objeto valida y arma el generador una vez
+	y genera las tiradas de a ``buffer_rounds`` rondas ya reducidas a códigos
+	``6 * jugador + cara``; cada ``play`` es un ``bincount`` sobre una porción del búfer.
+
+	Las partidas consumen el flujo ``PCG64`` de la semilla en orden: las rondas de
+	llamadas sucesivas son las mismas que ``rolls_for_rounds`` devuelve para ese rango,
+	de modo que la suma de varias partidas coincide con ``simulate_dice_game`` sobre
+	el total de rondas. Sólo modela un dado por turno; la equivalencia no vale contra
+	corridas con ``dice_per_turn > 1``.
+	"""
+
+	def __init__(
+		self,
+		num_players: int,
+		*,
+		seed: int | None = None,
+		face_weights: Sequence[float] | Sequence[Sequence[float]] | None = None,
+		buffer_rounds: int = 16_384,
+	) -> None:
+		"""Prepara el generador y la tabla de alias.
+
+		Args:
+			num_players: Jugadores de cada partida (1-4).
+			seed: Semilla opcional; fija toda la secuencia de partidas.
+			face_weights: Pesos de dados cargados, como en ``simulate_dice_game``.
+			buffer_rounds: Rondas generadas por cada recarga del búfer. El costo medio
+				no cambia; valores menores hacen la pausa de recarga más corta y frecuente.
+
+		Raises:
+			ValueError: Si algún parámetro es inválido.
+		"""
+
+		_validate_inputs(num_players, 1, buffer_rounds)
+		self.num_players = num_players
+		self.buffer_rounds = buffer_rounds
+		self._bit_generator = _stream_bit_generator(_seed_sequence(seed), 0, num_players)
+		self._alias_table = _alias_table_for(face_weights, num_players)
+		self._offsets = np.arange(num_players) * len(FACES)
+		self._cells = num_players * len(FACES)
+		self._codes = np.empty(0, dtype=np.intp)
+		self._position = 0
+
+	def _refill(self, num_rounds: int) -> None:
+		"""Conserva lo no usado del búfer y agrega al menos ``num_rounds`` rondas nuevas."""
+
+		rounds = max(self.buffer_rounds, num_rounds)
+		fresh = _roll_face_indices(self._bit_generator, rounds, self.num_players, self._alias_table)
+		fresh += self._offsets
+		self._codes = np.concatenate((self._codes[self._position:], fresh.ravel()))
+		self._position = 0
+
+	def play(self, num_rounds: int) -> SmallGameResult:
+		"""Juega una partida de ``num_rounds`` rondas con las siguientes rondas del flujo.
+
+		Raises:
+			ValueError: Si ``num_rounds`` no es positivo.
+		"""
+
+		if num_rounds <= 0:
+			raise ValueError("Las rondas deben ser mayores a cero")
+		stop = self._position + num_rounds * self.num_players
+		if stop > len(self._codes):
+			self._refill(num_rounds)
+			stop = num_rounds * self.num_players
+		counts = np.bincount(self._codes[self._position:stop], minlength=self._cells)
+		self._position = stop
+		frequencies = counts.reshape(self.num_players, len(FACES))
+		return SmallGameResult(frequencies @ FACES, frequencies)
+
+
+def _split_rounds(start_round: int, stop_round: int, parts: int) -> List[Tuple[int, int]]:
+	"""Divide ``[start_round, stop_round)`` en ``parts`` rangos contiguos casi iguales y no vacíos."""
+
+	span = stop_round - start_round
+	parts = max(1, min(parts, span))
+	bounds = [start_round + idx * span // parts for idx in range(parts + 1)]
+	return list(zip(bounds[:-1], bounds[1:]))
+
+
+def _accumulate_parallel(
+	seed_sequence: np.random.SeedSequence,
+	start_round: int,
+	stop_round: int,
+	num_players: int,
+	batch_size: int,
+	threads: int,
+	alias_table: _AliasTable | None,
+	num_rounds: int,
+	dice_per_turn: int = 1,
+	track_faces: bool = True,
+	batch_means: bool = True,
+) -> _BatchGroups:
+	"""Versión con hilos de ``_accumulate_rounds``: un rango y acumuladores por hilo.
+
+	``num_rounds`` es el total de la simulación completa, que define los grupos.
+	``track_faces=False`` corresponde a ``sums_only``; ``batch_means`` se pasa a
+	``_BatchGroups.empty``.
+	"""
+
+	marginal = _uses_marginals(num_players, dice_per_turn, not track_faces)
+	ranges = _split_rounds(start_round, stop_round, threads)
+	with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+		partials = list(
+			executor.map(
+				lambda bounds: _accumulate_rounds(
+					seed_sequence,
+					bounds[0],
+					bounds[1],
+					num_players,
+					batch_size,
+					alias_table,
+					_BatchGroups.empty(num_rounds, num_players, dice_per_turn, track_faces, marginal, batch_means),
+				),
+				ranges,
+			)
+		)
+
+	merged = partials[0]
+	for partial in partials[1:]:
+		merged = merged.merge(partial)
+	return merged
+
+
+@dataclass
+class RoundCounts:
+	"""Conteos de caras y de resultados conjuntos de un rango de rondas."""
+
+	frequencies: np.ndarray  # (jugadores, 6)
+	joint: np.ndarray  # (6 ** jugadores,) con códigos en base 6, el jugador 1 como dígito más significativo
+
+
+def count_round_outcomes(
+	num_players: int,
+	start_round: int,
+	stop_round: int,
+	*,
+	seed: int,
+	batch_size: int = 100_000,
+	threads: int = 1,
+) -> RoundCounts:
+	"""Cuenta las rondas ``[start_round, stop_round)`` con los acumuladores del motor con hilos.
+
+	Es el mismo recorrido que hace ``simulate_dice_game_threaded`` (flujo saltado con
+	``advance``, lotes y acumuladores por hilo), expuesto para que herramientas
+	externas puedan contrastarlo con ``rolls_for_rounds`` sin tocar funciones privadas.
+	Las caras salen del resumen de grupos y el histograma conjunto de sumar los grupos.
+
+	Args:
+		num_players: Número de jugadores (1-4), un dado justo por turno.
+		start_round: Primera ronda (desde 0).
+		stop_round: Ronda final, exclusiva.
+		seed: Semilla del flujo.
+		batch_size: Rondas por lote dentro de cada hilo.
+		threads: Hilos entre los que se reparte el rango.
+
+	Returns:
+		``RoundCounts`` con frecuencias por jugador e histograma conjunto.
+
+	Raises:
+		ValueError: Si el rango es vacío o negativo, o los parámetros son inválidos.
+	"""
+
+	if start_round < 0 or stop_round <= start_round:
+		raise ValueError("El rango de rondas debe cumplir 0 <= inicio < fin")
+	_validate_inputs(num_players, stop_round, batch_size)
+	if threads <= 0:
+		raise ValueError("La cantidad de hilos debe ser mayor a cero")
+	groups = _accumulate_parallel(
+		_seed_sequence(seed), start_round, stop_round, num_players, batch_size, threads, None, stop_round
+	)
+	return RoundCounts(frequencies=groups.summary().frequencies.sum(axis=0), joint=groups.outcomes.sum(axis=0))
+
+
+def simulate_dice_game_threaded(
+	num_players: int,
+	num_rounds: int,
+	*,
+	threads: int | None = None,
+	batch_size: int = 100_000,
+	seed: int | None = None,
+	face_weights: Sequence[float] | Sequence[Sequence[float]] | None = None,
+	dice_per_turn: int = 1,
+	sums_only: bool = False,
+	confidence: bool = False,
+) -> GameStatistics:
+	"""Simula el juego repartiendo las rondas entre un pool de hilos.
+
+	Refactorización: Introduce Parallel Accumulators. Cada hilo recibe un rango
+	contiguo de rondas, su propio ``PCG64`` saltado con ``advance`` al inicio del
+	rango y acumuladores privados que se suman al final. ``random_raw`` y las
+	reducciones de NumPy liberan el GIL, así que los hilos avanzan en paralelo sin
+	el costo de crear procesos ni serializar resultados.
+
+	Como todos los hilos leen tramos disjuntos del mismo flujo que usa
+	``simulate_dice_game``, el resultado con semilla es idéntico al secuencial
+	para cualquier número de hilos.
+
+	Args:
+		num_players: Número de jugadores a simular.
+		num_rounds: Cantidad de rondas que ejecutará cada jugador.
+		threads: Hilos a utilizar; por defecto ``os.cpu_count()``.
+		batch_size: Tamaño máximo del bloque procesado por cada hilo.
+		seed: Semilla opcional para reproducibilidad.
+		face_weights: Pesos de dados cargados, igual que en ``simulate_dice_game``.
+		dice_per_turn: Dados por jugador y ronda, igual que en ``simulate_dice_game``.
+		sums_only: Muestreo directo de sumas de turno, igual que en ``simulate_dice_game``.
+		confidence: Intervalos de confianza, igual que en ``simulate_dice_game``.
+
+	Returns:
+		Instancia `GameStatistics` con los resultados consolidados.
+
+	Raises:
+		ValueError: Si ``threads`` no es positivo o los parámetros son inválidos.
+	"""
+
+	_validate_inputs(num_players, num_rounds, batch_size)
+	_validate_turn(num_players, dice_per_turn)
+	threads = threads if threads is not None else (os.cpu_count() or 1)
+	if threads <= 0:
+		raise ValueError("La cantidad de hilos debe ser mayor a cero")
+
+	alias_table, face_probabilities = _turn_tables(face_weights, num_players, dice_per_turn, sums_only)
+	groups = _accumulate_parallel(
+		_seed_sequence(seed),
+		0,
+		num_rounds,
+		num_players,
+		batch_size,
+		threads,
+		alias_table,
+		num_rounds,
+		dice_per_turn,
+		not sums_only,
+		confidence,
+	)
+	return _game_statistics_from_groups(num_rounds, groups, face_probabilities, confidence)
+
+
+@dataclass
+class ShardResult:
+	"""Resultado parcial de un fragmento (*shard*) de una simulación distribuida.
+
+	Guarda sólo los acumuladores del rango ``[start_round, stop_round)`` junto con
+	los metadatos necesarios para validar la fusión posterior. Los acumuladores se
+	guardan por grupo de *batch means* (definidos sobre la simulación completa) para
+	que el resultado fusionado conserve sus intervalos de confianza; cada grupo es el
+	histograma conjunto de resultados de ronda, del que se derivan el resto de las
+	estadísticas (o sus sumas por jugador, ganadores y empates; ver ``_uses_marginals``). ``face_probabilities`` registra los dados cargados (``None`` si son
+	justos) y ``dice_per_turn``/``sums_only`` el modo de turno, para que la fusión
+	rechace parciales de configuraciones distintas. Con varios dados por turno
+	``group_face_counts`` guarda además las caras por grupo (``None`` con ``sums_only``).
+	"""
+
+	seed: int
+	num_players: int
+	total_rounds: int
+	start_round: int
+	stop_round: int
+	group_outcomes: np.ndarray
+	face_probabilities: np.ndarray | None = None  # (jugadores, 6), normalizadas.
+	dice_per_turn: int = 1
+	sums_only: bool = False
+	group_face_counts: np.ndarray | None = None  # (grupos, jugadores, 6)
+
+	def save(self, path: str) -> None:
+		"""Escribe el parcial como archivo ``.npz`` compacto."""
+
+		extra = {"turn": np.array([self.dice_per_turn, int(self.sums_only)], dtype=np.int64)}
+		if self.face_probabilities is not None:
+			extra["face_probabilities"] = self.face_probabilities
+		if self.group_face_counts is not None:
+			extra["group_face_counts"] = self.group_face_counts
+		with open(path, "wb") as handle:
+			np.savez(
+				handle,
+				meta=np.array(
+					[self.num_players, self.total_rounds, self.start_round, self.stop_round],
+					dtype=np.int64,
+				),
+				seed=np.array(str(self.seed)),
+				group_outcomes=self.group_outcomes,
+				**extra,
+			)
+
+	@classmethod
+	def load(cls, path: str) -> "ShardResult":
+		"""Lee un parcial escrito con ``save``."""
+
+		with np.load(path) as data:
+			num_players, total_rounds, start_round, stop_round = (int(v) for v in data["meta"])
+			dice_per_turn, sums_only = (int(v) for v in data["turn"]) if "turn" in data.files else (1, 0)
+			return cls(
+				seed=int(str(data["seed"])),
+				num_players=num_players,
+				total_rounds=total_rounds,
+				start_round=start_round,
+				stop_round=stop_round,
+				group_outcomes=data["group_outcomes"].astype(np.int64),
+				face_probabilities=data["face_probabilities"] if "face_probabilities" in data.files else None,
+				dice_per_turn=dice_per_turn,
+				sums_only=bool(sums_only),
+				group_face_counts=(
+					data["group_face_counts"].astype(np.int64) if "group_face_counts" in data.files else None
+				),
+			)
+
+
+def parse_shard(spec: str) -> Tuple[int, int]:
+	"""Interpreta una especificación ``"i/N"`` (``i`` empieza en 0).
+
+	Raises:
+		ValueError: Si el formato es inválido o ``i`` no está en ``[0, N)``.
+	"""
+
+	try:
+		index_text, count_text = spec.split("/")
+		index, count = int(index_text), int(count_text)
+	except ValueError as exc:
+		raise ValueError(f"Shard inválido {spec!r}: se espera el formato i/N") from exc
+	if count <= 0 or not 0 <= index < count:
+		raise ValueError(f"Shard inválido {spec!r}: i debe estar entre 0 y N-1")
+	return index, count
+
+
+def simulate_shard(
+	num_players: int,
+	num_rounds: int,
+	shard_index: int,
+	shard_count: int,
+	*,
+	seed: int,
+	batch_size: int = 100_000,
+	threads: int = 1,
+	face_weights: Sequence[float] | Sequence[Sequence[float]] | None = None,
+	dice_per_turn: int = 1,
+	sums_only: bool = False,
+) -> ShardResult:
+	"""Simula sólo el tramo de rondas que corresponde a ``shard_index`` de ``shard_count``.
+
+	Refactorización: Introduce Jump-Ahead Stream aplicado a nodos. Cada shard salta
+	directamente a su rango del flujo de la semilla raíz, así que los tramos no se
+	solapan y su fusión reproduce exactamente ``simulate_dice_game`` con esa semilla.
+
+	Args:
+		num_players: Número de jugadores a simular.
+		num_rounds: Rondas totales de la simulación completa.
+		shard_index: Índice del fragmento, en ``[0, shard_count)``.
+		shard_count: Cantidad total de fragmentos.
+		seed: Semilla raíz, obligatoria para que todos los nodos compartan el flujo.
+		batch_size: Tamaño máximo de lote.
+		threads: Hilos locales usados dentro del nodo.
+		face_weights: Pesos de dados cargados, como en ``simulate_dice_game``; todos
+			los shards deben usar los mismos.
+		dice_per_turn: Dados por jugador y ronda, como en ``simulate_dice_game``.
+		sums_only: Muestrea sólo la suma de cada turno, como en ``simulate_dice_game``.
+
+	Returns:
+		``ShardResult`` con los acumuladores del tramo.
+
+	Raises:
+		ValueError: Si falta la semilla o los parámetros son inválidos.
+	"""
+
+	_validate_inputs(num_players, num_rounds, batch_size)
+	if seed is None:
+		raise ValueError("La simulación por shards requiere una semilla explícita")
+	if shard_count <= 0 or not 0 <= shard_index < shard_count:
+		raise ValueError("El índice de shard debe estar entre 0 y N-1")
+
+	_validate_turn(num_players, dice_per_turn)
+	alias_table, face_probabilities = _turn_tables(face_weights, num_players, dice_per_turn, sums_only)
+
+	start_round = shard_index * num_rounds // shard_count
+	stop_round = (shard_index + 1) * num_rounds // shard_count
+	groups = _accumulate_parallel(
+		_seed_sequence(seed),
+		start_round,
+		stop_round,
+		num_players,
+		batch_size,
+		max(1, threads),
+		alias_table,
+		num_rounds,
+		dice_per_turn,
+		not sums_only,
+	)
+	return ShardResult(
+		seed=seed,
+		num_players=num_players,
+		total_rounds=num_rounds,
+		start_round=start_round,
+		stop_round=stop_round,
+		group_outcomes=groups.outcomes,
+		face_probabilities=face_probabilities,
+		dice_per_turn=dice_per_turn,
+		sums_only=sums_only,
+		group_face_counts=groups.face_counts,
+	)
+
+
+def merge_shards(shards: List[ShardResult], *, confidence: bool = False) -> GameStatistics:
+	"""Fusiona parciales en el ``GameStatistics`` final.
+
+	La validación trabaja sobre rangos de rondas y no sobre índices de shard, por lo
+	que se pueden mezclar parciales de particiones distintas mientras cubran
+	``[0, total_rounds)`` exactamente una vez. Los parciales guardan siempre los
+	grupos de *batch means*, así que ``confidence`` (como en ``simulate_dice_game``)
+	puede pedirse recién al fusionar.
+
+	Raises:
+		ValueError: Si no hay parciales, si difieren en semilla, jugadores, rondas,
+			pesos de los dados o modo de turno, o si los rangos se solapan o dejan huecos.
+	"""
+
+	if not shards:
+		raise ValueError("No se recibieron shards para fusionar")
+	reference = shards[0]
+	for shard in shards[1:]:
+		if (shard.seed, shard.num_players, shard.total_rounds) != (
+			reference.seed,
+			reference.num_players,
+			reference.total_rounds,
+		):
+			raise ValueError("Los shards pertenecen a simulaciones distintas (semilla, jugadores o rondas)")
+		if (shard.face_probabilities is None) != (reference.face_probabilities is None) or (
+			shard.face_probabilities is not None
+			and not np.array_equal(shard.face_probabilities, reference.face_probabilities)
+		):
+			raise ValueError("Los shards usan pesos de dados distintos")
+		if (shard.dice_per_turn, shard.sums_only) != (reference.dice_per_turn, reference.sums_only):
+			raise ValueError("Los shards usan distintos dados por turno o modo de sumas")
+
+	expected_start = 0
+	for shard in sorted(shards, key=lambda item: (item.start_round, item.stop_round)):
+		if shard.start_round < expected_start:
+			raise ValueError(
+				f"Shard duplicado o solapado en las rondas [{shard.start_round}, {shard.stop_round})"
+			)
+		if shard.start_round > expected_start:
+			raise ValueError(f"Faltan las rondas [{expected_start}, {shard.start_round})")
+		expected_start = shard.stop_round
+	if expected_start != reference.total_rounds:
+		raise ValueError(f"Faltan las rondas [{expected_start}, {reference.total_rounds})")
+
+	groups = _BatchGroups.empty(
+		reference.total_rounds,
+		reference.num_players,
+		reference.dice_per_turn,
+		not reference.sums_only,
+		_uses_marginals(reference.num_players, reference.dice_per_turn, reference.sums_only),
+	)
+	for shard in shards:
+		if shard.group_outcomes.shape != groups.outcomes.shape:
+			raise ValueError("Los acumuladores del shard no tienen el formato esperado para su configuración")
+		groups.outcomes += shard.group_outcomes
+		if groups.face_counts is not None:
+			groups.face_counts += shard.group_face_counts
+	return _game_statistics_from_groups(reference.total_rounds, groups, reference.face_probabilities, confidence)
+
+
+def _build_player_stats(
+	totals: np.ndarray,
+	frequencies: np.ndarray,
+	face_probabilities: np.ndarray | None = None,
+) -> List[PlayerStats]:
+	"""Convierte datos agregados en instancias ``PlayerStats``.
+
+	Refactorización: Extract Function + Encapsulate Collection.
+
+	Args:
+		totals: Vector con la suma de puntos por jugador.
+		frequencies: Matriz de frecuencias de caras por jugador.
+		face_probabilities: Probabilidades configuradas por jugador (dados cargados), si las hay.
+
+	Returns:
+		Lista ordenada de jugadores con sus estadísticas.
+	"""
+
+	return [
+		PlayerStats.from_arrays(
+			player_idx + 1,
+			frequencies[player_idx],
+			totals[player_idx],
+			None if face_probabilities is None else face_probabilities[player_idx],
+		)
+		for player_idx in range(frequencies.shape[0])
+	]
+
+
+def simulate_probabilities(
+	num_players: int,
+	num_rounds: int,
+	*,
+	batch_size: int = 100_000,
+	seed: int | None = None,
+	method: str = "simulated",
+	face_weights: Sequence[float] | Sequence[Sequence[float]] | None = None,
+) -> Dict[int, Dict[int, float]]:
+	"""Calcula la distribución de probabilidades observada para cada jugador.
+
+	Refactorización: Replace Data with Object al reutilizar los objetos "PlayerStats".
+
+	Args:
+		num_players: Número de jugadores a simular.
+		num_rounds: Número de rondas en cada simulación.
+		batch_size: Tamaño del lote para ejecutar la simulación por bloques.
+		seed: Semilla opcional para obtener resultados reproducibles.
+		method: ``"simulated"`` (Monte Carlo) o ``"exact"`` (distribución teórica del dado).
+		face_weights: Pesos opcionales de dados cargados (ver ``simulate_dice_game``).
+
+	Returns:
+		Un diccionario keyed por `player_id` cuyo valor es otro diccionario `{cara: probabilidad}`.
+
+	Raises:
+		ValueError: Si ``method`` no es ``"simulated"`` ni ``"exact"``.
+	"""
+
+	if method == "exact":
+		_validate_inputs(num_players, num_rounds, batch_size)
+		probabilities = (
+			np.full((num_players, 6), 1 / 6)
+			if face_weights is None
+			else _normalize_face_weights(face_weights, num_players)
+		)
+		return {
+			player_idx + 1: {face: float(probabilities[player_idx, face - 1]) for face in range(1, 7)}
+			for player_idx in range(num_players)
+		}
+	if method != "simulated":
+		raise ValueError("method debe ser 'simulated' o 'exact'")
+
+	stats = simulate_dice_game(
+		num_players, num_rounds, batch_size=batch_size, seed=seed, face_weights=face_weights
+	)
+	return {player.player_id: player.probability_distribution() for player in stats.players}
+
+
+_EXACT_TAIL_MASS = 1e-18  # Masa máxima descartada por cola en cada convolución.
+_FFT_NOISE_FLOOR = 1e-14  # Valores relativos al pico que la FFT no distingue de cero.
+_DIRECT_CONVOLUTION_LIMIT = 64
+
+
+def _convolve_pmf(left: np.ndarray, right: np.ndarray) -> np.ndarray:
+	"""Convoluciona dos PMFs: directa si alguna es corta, por FFT en otro caso."""
+
+	if min(len(left), len(right)) <= _DIRECT_CONVOLUTION_LIMIT:
+		return np.convolve(left, right)
+	size = len(left) + len(right) - 1
+	fft_size = 1 << (size - 1).bit_length()
+	result = np.fft.irfft(np.fft.rfft(left, fft_size) * np.fft.rfft(right, fft_size), fft_size)[:size]
+	# El redondeo de la FFT deja ruido de ~1e-16 relativo al pico (incluso negativo) en las colas.
+	result[result < _FFT_NOISE_FLOOR * result.max()] = 0.0
+	return result
+
+
+def _trim_pmf(offset: int, pmf: np.ndarray) -> Tuple[int, np.ndarray]:
+	"""Recorta las colas cuya masa acumulada no supera ``_EXACT_TAIL_MASS``."""
+
+	total = pmf.sum()
+	low = int(np.searchsorted(np.cumsum(pmf), _EXACT_TAIL_MASS * total, side="right"))
+	high = int(np.searchsorted(np.cumsum(pmf[::-1]), _EXACT_TAIL_MASS * total, side="right"))
+	return offset + low, pmf[low:len(pmf) - high]
+
+
+def exact_total_pmf(num_rounds: int, face_probabilities: np.ndarray | None = None) -> Tuple[int, np.ndarray]:
+	"""Calcula la PMF del puntaje total de un jugador tras ``num_rounds`` rondas.
+
+	Refactorización: Replace Simulation with Calculation. La PMF del total es la
+	convolución ``num_rounds``-ésima de la del dado; se obtiene con exponenciación
+	por cuadrados (O(log N) convoluciones por FFT) recortando en cada paso las colas
+	de masa despreciable, de modo que el arreglo crece como O(sqrt(N)) y no O(N).
+	Sólo se descartan valores menores a 1e-14 veces el pico, por lo que el error
+	absoluto total queda por debajo de ~1e-13.
+
+	Args:
+		num_rounds: Rondas jugadas (N > 0).
+		face_probabilities: Probabilidades de las caras 1-6; por defecto dado justo.
+
+	Returns:
+		Tupla ``(offset, pmf)`` donde ``pmf[i]`` es P(total = offset + i).
+	"""
+
+	if num_rounds <= 0:
+		raise ValueError("Las rondas deben ser mayores a cero")
+	base = np.full(6, 1 / 6) if face_probabilities is None else np.asarray(face_probabilities, dtype=np.float64)
+
+	result_offset, result = 0, np.ones(1)
+	power_offset, power = 1, base
+	remaining = num_rounds
+	while remaining:
+		if remaining & 1:
+			result_offset, result = _trim_pmf(result_offset + power_offset, _convolve_pmf(result, power))
+		remaining >>= 1
+		if remaining:
+			power_offset, power = _trim_pmf(2 * power_offset, _convolve_pmf(power, power))
+	return result_offset, result / result.sum()
+
 
 @dataclass
-class GameStatistics:
-	"""Agrupa el resultado completo de una simulación."""
+class ExactGameDistribution:
+	"""Resultado exacto (numéricamente) de un juego de ``num_rounds`` rondas.
 
-	total_rounds: int
-	players: List[PlayerStats]
-	winner: PlayerStats
+	``total_pmfs[k, i]`` es la probabilidad de que el jugador ``k + 1`` termine con
+	``support_offset + i`` puntos. ``win_probabilities`` considera victorias sin empate;
+	``reported_winner_probabilities`` aplica la misma regla que ``simulate_dice_game``
+	(ante empate gana el jugador de menor id).
+	"""
 
-	def to_dict(self) -> Dict[str, object]:
-		"""Serializa la estadística del juego a un diccionario estándar."""
+	num_players: int
+	num_rounds: int
+	support_offset: int
+	total_pmfs: np.ndarray
+	win_probabilities: Dict[int, float]
+	reported_winner_probabilities: Dict[int, float]
+	tie_probability: float
+	expected_totals: Dict[int, float]
+	expected_max_total: float
 
-		return {
-			"total_rounds": self.total_rounds,
-			"players": [
-				{
-					"player_id": p.player_id,
-					"total_points": p.total_points,
-					"frequencies": p.frequencies,
-					"most_common_value": p.most_common_value,
-				}
-				for p in self.players
-			],
-			"winner": {
-				"player_id": self.winner.player_id,
-				"total_points": self.winner.total_points,
-			},
-		}
+	def total_probability(self, player_id: int, total: int) -> float:
+		"""Probabilidad de que ``player_id`` termine exactamente con ``total`` puntos."""
 
+		index = total - self.support_offset
+		if not 0 <= index < self.total_pmfs.shape[1]:
+			return 0.0
+		return float(self.total_pmfs[player_id - 1, index])
 
-def _validate_inputs(num_players: int, num_rounds: int, batch_size: int) -> None:
-	"""Valida los parámetros de entrada de la simulación.
 
-	Refactorización: Introduce Parameter Validation.
+def _exact_from_face_probabilities(
+	num_players: int,
+	num_rounds: int,
+	face_probabilities: List[np.ndarray | None],
+) -> ExactGameDistribution:
+	"""Combina las PMFs de los jugadores en probabilidades de victoria y empate."""
+
+	cache: Dict[object, Tuple[int, np.ndarray]] = {}
+	pmfs = []
+	for faces in face_probabilities:
+		key = None if faces is None else tuple(np.asarray(faces, dtype=np.float64))
+		if key not in cache:  # Jugadores con el mismo dado comparten la PMF.
+			cache[key] = exact_total_pmf(num_rounds, faces)
+		pmfs.append(cache[key])
+	support_offset = min(offset for offset, _ in pmfs)
+	length = max(offset + len(pmf) for offset, pmf in pmfs) - support_offset
+	total_pmfs = np.zeros((num_players, length))
+	for idx, (offset, pmf) in enumerate(pmfs):
+		total_pmfs[idx, offset - support_offset:offset - support_offset + len(pmf)] = pmf
+
+	cdf = np.cumsum(total_pmfs, axis=1)
+	cdf_below = cdf - total_pmfs  # P(X < t)
+	support = support_offset + np.arange(length)
+
+	win_probabilities: Dict[int, float] = {}
+	reported: Dict[int, float] = {}
+	for idx in range(num_players):
+		others_below = np.prod(np.delete(cdf_below, idx, axis=0), axis=0)
+		win_probabilities[idx + 1] = float(np.dot(total_pmfs[idx], others_below))
+		tie_break = np.prod(cdf_below[:idx], axis=0) * np.prod(cdf[idx + 1:], axis=0)
+		reported[idx + 1] = float(np.dot(total_pmfs[idx], tie_break))
+
+	max_cdf = np.prod(cdf, axis=0)
+	max_pmf = np.diff(max_cdf, prepend=0.0)
+	return ExactGameDistribution(
+		num_players=num_players,
+		num_rounds=num_rounds,
+		support_offset=support_offset,
+		total_pmfs=total_pmfs,
+		win_probabilities=win_probabilities,
+		reported_winner_probabilities=reported,
+		tie_probability=max(0.0, 1.0 - sum(win_probabilities.values())),
+		expected_totals={idx + 1: float(np.dot(total_pmfs[idx], support)) for idx in range(num_players)},
+		expected_max_total=float(np.dot(max_pmf, support)),
+	)
+
+
+def exact_game_distribution(
+	num_players: int,
+	num_rounds: int,
+	*,
+	face_weights: Sequence[float] | Sequence[Sequence[float]] | None = None,
+) -> ExactGameDistribution:
+	"""Alternativa exacta a la simulación: PMFs de totales, victorias, empates y esperanzas.
+
+	Responde en milisegundos incluso para N = 10**7 rondas, donde Monte Carlo
+	necesitaría millones de juegos para estimar las mismas probabilidades.
 
 	Args:
-		num_players: Número de jugadores a simular (1-4).
-		num_rounds: Cantidad total de rondas por jugador.
-		batch_size: Tamaño de lote para la simulación.
+		num_players: Número de jugadores (1-4).
+		num_rounds: Rondas por jugador.
+		face_weights: Pesos opcionales de dados cargados (ver ``simulate_dice_game``).
 
-	Raises:
-		ValueError: Si algún parámetro queda fuera de los límites aceptados.
+	Returns:
+		Instancia ``ExactGameDistribution``.
 	"""
 
-	if not 1 <= num_players <= 4:
-		raise ValueError("El número de jugadores debe estar entre 1 y 4")
-	if num_rounds <= 0:
-		raise ValueError("Las rondas deben ser mayores a cero")
-	if batch_size <= 0:
-		raise ValueError("El tamaño de lote debe ser mayor a cero")
+	_validate_inputs(num_players, num_rounds, 1)
+	if face_weights is None:
+		return _exact_from_face_probabilities(num_players, num_rounds, [None] * num_players)
+	probabilities = _normalize_face_weights(face_weights, num_players)
+	return _exact_from_face_probabilities(num_players, num_rounds, list(probabilities))
 
 
-@profile
-def simulate_dice_game(
+VARIANCE_REDUCTION_MODES = ("plain", "stratified", "antithetic", "control")
+_FAIR_ROLL_MEAN = 3.5
+_FAIR_ROLL_VARIANCE = 35 / 12
+
+
+@dataclass
+class GameOutcomeEstimate:
+	"""Estimación Monte Carlo de probabilidades de victoria y puntaje medio por jugador.
+
+	Los intervalos salen de ``BATCH_MEANS_GROUPS`` réplicas independientes. Los
+	factores de reducción comparan la varianza lograda con la que tendría el
+	muestreo i.i.d. con las mismas partidas (``inf`` si la estimación es exacta).
+	"""
+
+	mode: str
+	num_games: int
+	num_rounds: int
+	win_probabilities: Dict[int, ConfidenceInterval]
+	mean_totals: Dict[int, ConfidenceInterval]
+	win_variance_reduction: Dict[int, float]
+	mean_variance_reduction: Dict[int, float]
+
+	@property
+	def total_rolls(self) -> int:
+		return self.num_games * self.num_rounds * len(self.win_probabilities)
+
+	def rolls_for_precision(self, target_std_error: float) -> Dict[int, int]:
+		"""Tiradas que este modo necesitaría para llevar el error estándar de la
+		probabilidad de victoria de cada jugador a ``target_std_error``."""
+
+		if target_std_error <= 0:
+			raise ValueError("El error estándar objetivo debe ser mayor a cero")
+		return {
+			player_id: int(np.ceil(self.total_rolls * (interval.std_error / target_std_error) ** 2))
+			for player_id, interval in self.win_probabilities.items()
+		}
+
+
+def _variance_reduced_totals(
+	rng: np.random.Generator,
+	mode: str,
+	replicates: int,
+	games: int,
+	num_players: int,
+	rounds: int,
+) -> np.ndarray:
+	"""Suma ``rounds`` rondas para ``(replicates, games, num_players)`` partidas.
+
+	Cada partida, vista por separado, sigue siendo una secuencia i.i.d. de dados
+	justos; los modos sólo acoplan partidas distintas de una misma réplica.
+	"""
+
+	if mode == "stratified":
+		# Asignación balanceada: en cada ronda las caras se reparten en partes iguales
+		# entre las partidas de la réplica; el desplazamiento aleatorio mantiene la
+		# marginal uniforme cuando ``games`` no es múltiplo de 6.
+		faces = np.broadcast_to(np.arange(games) % 6, (rounds, replicates, num_players, games)).copy()
+		rng.permuted(faces, axis=-1, out=faces)
+		faces += rng.integers(0, 6, (rounds, replicates, num_players, 1))
+		faces %= 6
+		return faces.sum(axis=0).transpose(0, 2, 1) + rounds
+	if mode == "antithetic":
+		half = rng.integers(1, 7, (rounds, replicates, games // 2, num_players)).sum(axis=0)
+		return np.concatenate((half, 7 * rounds - half), axis=1)
+	return rng.integers(1, 7, (rounds, replicates, games, num_players)).sum(axis=0)
+
+
+def estimate_game_outcomes(
 	num_players: int,
 	num_rounds: int,
+	num_games: int,
 	*,
+	mode: str = "plain",
 	batch_size: int = 100_000,
 	seed: int | None = None,
-) -> GameStatistics:
-	"""Simula un juego de dados vectorizado usando lotes.
+) -> GameOutcomeEstimate:
+	"""Estima por simulación la probabilidad de victoria y el puntaje medio con dados justos.
 
-	Refactorización: Introduce Batch Processing + Vectorization.
+	Refactorización: Introduce Variance Reduction. Los modos disponibles son:
+
+	* ``"plain"``: partidas i.i.d. (referencia).
+	* ``"stratified"``: en cada ronda, cada cara sale exactamente en 1/6 de las
+	  partidas de la réplica (muestreo balanceado tipo hipercubo latino).
+	* ``"antithetic"``: cada partida se empareja con otra que usa ``7 - f`` en cada dado.
+	* ``"control"``: partidas i.i.d. corregidas con la variable de control
+	  ``total - 3.5 * rondas`` de cada jugador (esperanza conocida, cero).
+
+	Todos los estimadores son insesgados (el de control, salvo un término O(1/n)
+	por estimar el coeficiente de regresión).
 
 	Args:
-		num_players: Número de jugadores a simular.
-		num_rounds: Cantidad de rondas que ejecutará cada jugador.
-		batch_size: Tamaño máximo del bloque procesado en cada iteración.
+		num_players: Número de jugadores (1-4).
+		num_rounds: Rondas por partida.
+		num_games: Partidas mínimas a simular; se redondea hacia arriba para formar
+			``BATCH_MEANS_GROUPS`` réplicas iguales (pares en el modo antitético).
+		mode: Uno de ``VARIANCE_REDUCTION_MODES``.
+		batch_size: Tiradas máximas generadas por bloque.
 		seed: Semilla opcional para reproducibilidad.
 
 	Returns:
-		Instancia `GameStatistics` con los resultados consolidados.
+		``GameOutcomeEstimate`` con intervalos y factores de reducción de varianza.
+
+	Raises:
+		ValueError: Si el modo no existe o algún parámetro es inválido.
 	"""
 
 	_validate_inputs(num_players, num_rounds, batch_size)
+	if num_games <= 0:
+		raise ValueError("Las partidas deben ser mayores a cero")
+	if mode not in VARIANCE_REDUCTION_MODES:
+		raise ValueError(f"Modo desconocido {mode!r}; opciones: {', '.join(VARIANCE_REDUCTION_MODES)}")
+
+	replicates = BATCH_MEANS_GROUPS
+	games = -(-num_games // replicates)
+	if mode == "antithetic":
+		games += games % 2
+	rng = np.random.default_rng(_seed_sequence(seed))
+	chunk = max(1, batch_size // (replicates * games * num_players))
+	totals = np.zeros((replicates, games, num_players), dtype=np.int64)
+	for start in range(0, num_rounds, chunk):
+		totals += _variance_reduced_totals(
+			rng, mode, replicates, games, num_players, min(chunk, num_rounds - start)
+		)
 
-	rng = np.random.default_rng(seed)
-	totals = np.zeros(num_players, dtype=np.int64)
-	frequencies = np.zeros((num_players, 6), dtype=np.int64)
+	top = totals.max(axis=2, keepdims=True)
+	wins = ((totals == top) & ((totals == top).sum(axis=2, keepdims=True) == 1)).astype(np.float64)
+	means = totals.astype(np.float64)
+	if mode == "control":
+		controls = (totals - _FAIR_ROLL_MEAN * num_rounds).reshape(-1, num_players)
+		centered = controls - controls.mean(axis=0)
+		for values in (wins, means):
+			flat = values.reshape(-1, num_players)
+			beta = np.linalg.lstsq(centered, flat - flat.mean(axis=0), rcond=None)[0]
+			values -= (controls @ beta).reshape(values.shape)
+
+	win_groups, mean_groups = wins.mean(axis=1), means.mean(axis=1)
+	win_estimates, mean_estimates = win_groups.mean(axis=0), mean_groups.mean(axis=0)
+	win_se, win_low, win_high = _batch_means_intervals(win_estimates, win_groups)
+	mean_se, mean_low, mean_high = _batch_means_intervals(mean_estimates, mean_groups)
+
+	total_games = replicates * games
+	plain_win_variance = np.clip(win_estimates, 0, 1) * (1 - np.clip(win_estimates, 0, 1)) / total_games
+	plain_mean_variance = np.full(num_players, _FAIR_ROLL_VARIANCE * num_rounds / total_games)
+
+	def reduction(plain: float, achieved: float) -> float:
+		if achieved <= 1e-24:
+			return float("inf") if plain > 0 else 1.0
+		return float(plain / achieved)
+
+	players = range(num_players)
+	return GameOutcomeEstimate(
+		mode=mode,
+		num_games=total_games,
+		num_rounds=num_rounds,
+		win_probabilities={
+			idx + 1: _interval(win_estimates[idx], win_se[idx], win_low[idx], win_high[idx]) for idx in players
+		},
+		mean_totals={
+			idx + 1: _interval(mean_estimates[idx], mean_se[idx], mean_low[idx], mean_high[idx]) for idx in players
+		},
+		win_variance_reduction={idx + 1: reduction(plain_win_variance[idx], win_se[idx] ** 2) for idx in players},
+		mean_variance_reduction={idx + 1: reduction(plain_mean_variance[idx], mean_se[idx] ** 2) for idx in players},
+	)
+
+
+@dataclass(frozen=True)
+class GameRules:
+	"""Reglas declarativas de una variante del juego.
 
-	rounds_remaining = num_rounds
-	while rounds_remaining > 0:
-		current_batch = min(batch_size, rounds_remaining)
-		rolls = rng.integers(1, 7, size=(current_batch, num_players), endpoint=False)
-		totals += rolls.sum(axis=0)
-		batch_frequencies = (rolls[..., None] == FACES).sum(axis=0)
-		frequencies += batch_frequencies  # Refactorización: Replace Loop with Vectorized Operation.
-		rounds_remaining -= current_batch
+	Args:
+		max_rounds: Tope de rondas por partida.
+		target_score: Si se define, la partida termina al cierre de la ronda en que
+			algún jugador alcanza este puntaje.
+		match_bonus: Puntos extra para cada jugador cuyo dado coincide con el de al
+			menos otro jugador activo en la misma ronda.
+		elimination_interval: Cada ``K`` rondas se elimina al jugador activo con menor
+			puntaje (ante empate, el de mayor id); con un solo sobreviviente la partida termina.
+	"""
 
-	player_stats = _build_player_stats(totals, frequencies)
+	max_rounds: int
+	target_score: int | None = None
+	match_bonus: int = 0
+	elimination_interval: int | None = None
 
-	winner = max(player_stats, key=lambda p: p.total_points)
-	return GameStatistics(total_rounds=num_rounds, players=player_stats, winner=winner)
+	def validate(self) -> None:
+		"""Verifica que las reglas sean coherentes.
 
+		Raises:
+			ValueError: Si algún valor queda fuera de rango.
+		"""
 
-def _build_player_stats(totals: np.ndarray, frequencies: np.ndarray) -> List[PlayerStats]:
-	"""Convierte datos agregados en instancias ``PlayerStats``.
+		if self.max_rounds <= 0:
+			raise ValueError("Las rondas deben ser mayores a cero")
+		if self.target_score is not None and self.target_score <= 0:
+			raise ValueError("El puntaje objetivo debe ser mayor a cero")
+		if self.match_bonus < 0:
+			raise ValueError("El bonus por coincidencia no puede ser negativo")
+		if self.elimination_interval is not None and self.elimination_interval <= 0:
+			raise ValueError("El intervalo de eliminación debe ser mayor a cero")
 
-	Refactorización: Extract Function + Encapsulate Collection.
+
+@dataclass
+class VariantResults:
+	"""Resultados por partida de ``simulate_variant`` en forma de arreglos.
+
+	Todas las matrices tienen una fila por partida; ``winners`` y los índices de
+	columna siguen la convención ``player_id - 1``. ``elimination_rounds`` vale 0 para
+	quien no fue eliminado.
+	"""
+
+	rules: GameRules
+	final_scores: np.ndarray
+	rounds_played: np.ndarray
+	winners: np.ndarray
+	elimination_rounds: np.ndarray
+	bonus_points: np.ndarray
+	frequencies: np.ndarray
+
+	@property
+	def num_games(self) -> int:
+		"""Cantidad de partidas simuladas."""
+
+		return len(self.rounds_played)
+
+	def game_statistics(self, game_index: int) -> GameStatistics:
+		"""Devuelve una partida como ``GameStatistics`` (el ganador sigue las reglas de la variante)."""
+
+		stats = _build_game_statistics(
+			int(self.rounds_played[game_index]),
+			self.final_scores[game_index],
+			self.frequencies[game_index].astype(np.int64),
+		)
+		stats.winner = stats.players[int(self.winners[game_index])]
+		return stats
+
+	def metrics(self) -> Dict[str, object]:
+		"""Métricas propias de la variante agregadas sobre todas las partidas."""
+
+		num_players = self.final_scores.shape[1]
+		win_counts = np.bincount(self.winners, minlength=num_players)
+		eliminated = self.elimination_rounds > 0
+		metrics: Dict[str, object] = {
+			"games": self.num_games,
+			"win_rate": {idx + 1: float(win_counts[idx] / self.num_games) for idx in range(num_players)},
+			"mean_rounds": float(self.rounds_played.mean()),
+			"max_rounds_played": int(self.rounds_played.max()),
+			"mean_bonus_points": {
+				idx + 1: float(self.bonus_points[:, idx].mean()) for idx in range(num_players)
+			},
+			"elimination_rate": {idx + 1: float(eliminated[:, idx].mean()) for idx in range(num_players)},
+		}
+		if self.rules.target_score is not None:
+			metrics["target_reached_rate"] = float(
+				(self.final_scores.max(axis=1) >= self.rules.target_score).mean()
+			)
+		return metrics
+
+
+def _variant_batch(
+	bit_generator: np.random.PCG64,
+	num_games: int,
+	num_players: int,
+	rules: GameRules,
+	chunk_rounds: int,
+	alias_table: _AliasTable | None,
+) -> Tuple[np.ndarray, ...]:
+	"""Juega ``num_games`` partidas en paralelo, avanzando ``chunk_rounds`` rondas por vez.
+
+	Dentro de cada tramo los puntajes se obtienen con ``cumsum`` sobre el eje de
+	rondas y el momento de parada con ``argmax`` sobre la máscara "alcanzó el
+	objetivo"; las eliminaciones sólo ocurren en los bordes de tramo, que se alinean
+	con ``elimination_interval`` para que el conjunto de jugadores activos sea
+	constante dentro de cada tramo.
+	"""
+
+	games = np.arange(num_games)
+	scores = np.zeros((num_games, num_players), dtype=np.int64)
+	alive = np.ones((num_games, num_players), dtype=bool)
+	active = np.ones(num_games, dtype=bool)
+	rounds_played = np.zeros(num_games, dtype=np.int64)
+	elimination_rounds = np.zeros((num_games, num_players), dtype=np.int64)
+	bonus_points = np.zeros((num_games, num_players), dtype=np.int64)
+	frequencies = np.zeros((num_games, num_players, 6), dtype=np.int32)
+	# Valores distintos y negativos para que un jugador eliminado nunca "coincida".
+	dead_marker = -np.arange(1, num_players + 1)
+
+	played = 0
+	while played < rules.max_rounds and active.any():
+		chunk = min(chunk_rounds, rules.max_rounds - played)
+		if rules.elimination_interval is not None:
+			chunk = min(chunk, rules.elimination_interval - played % rules.elimination_interval)
+
+		rolls = _roll_dice(bit_generator, num_games * chunk, num_players, alias_table).reshape(
+			num_games, chunk, num_players
+		)
+		live = alive[:, None, :]
+		points = rolls * live
+		if rules.match_bonus:
+			visible = np.where(live, rolls, dead_marker)
+			matches = (visible[..., :, None] == visible[..., None, :]).sum(axis=-1) > 1
+			round_bonus = matches * rules.match_bonus
+			points += round_bonus
+		cumulative = scores[:, None, :] + np.cumsum(points, axis=1)
+
+		chunk_played = np.full(num_games, chunk, dtype=np.int64)
+		hit = np.zeros(num_games, dtype=bool)
+		if rules.target_score is not None:
+			reached = (cumulative >= rules.target_score).any(axis=2)
+			hit = reached.any(axis=1) & active
+			chunk_played = np.where(hit, reached.argmax(axis=1) + 1, chunk)
+		chunk_played = np.where(active, chunk_played, 0)
+
+		mask = (np.arange(chunk)[None, :] < chunk_played[:, None])[:, :, None] & live
+		frequencies += ((rolls[..., None] == FACES) & mask[..., None]).sum(axis=1, dtype=np.int32)
+		if rules.match_bonus:
+			bonus_points += (round_bonus * mask).sum(axis=1)
+		last_round = cumulative[games, np.maximum(chunk_played - 1, 0)]
+		scores = np.where((chunk_played > 0)[:, None], last_round, scores)
+		rounds_played += chunk_played
+		active &= ~hit
+		played += chunk
+
+		if (
+			rules.elimination_interval is not None
+			and played % rules.elimination_interval == 0
+			and played < rules.max_rounds
+		):
+			eligible = active & (alive.sum(axis=1) > 1)
+			ranked = np.where(alive, scores, np.iinfo(np.int64).max)[:, ::-1]
+			loser = num_players - 1 - ranked.argmin(axis=1)  # Empate: cae el de mayor id.
+			alive[games[eligible], loser[eligible]] = False
+			elimination_rounds[games[eligible], loser[eligible]] = played
+			# Sólo termina la partida que acaba de quedar con un sobreviviente.
+			active &= ~(eligible & (alive.sum(axis=1) == 1))
+
+	winners = np.where(alive, scores, -1).argmax(axis=1)
+	return scores, rounds_played, winners, elimination_rounds, bonus_points, frequencies
+
+
+def simulate_variant(
+	num_players: int,
+	num_games: int,
+	rules: GameRules,
+	*,
+	batch_size: int = 100_000,
+	seed: int | None = None,
+	face_weights: Sequence[float] | Sequence[Sequence[float]] | None = None,
+) -> VariantResults:
+	"""Simula muchas partidas de una variante con kernels vectorizados por lote.
+
+	Refactorización: Replace Interpreter Loop with Compiled Kernel. Las reglas se
+	traducen a operaciones sobre arreglos ``(partidas, rondas, jugadores)``: varias
+	partidas avanzan juntas en cada lote y ninguna ronda se procesa en Python.
 
 	Args:
-		totals: Vector con la suma de puntos por jugador.
-		frequencies: Matriz de frecuencias de caras por jugador.
+		num_players: Número de jugadores por partida (1-4).
+		num_games: Partidas independientes a simular.
+		rules: Reglas de la variante.
+		batch_size: Tiradas máximas por bloque (partidas × rondas × jugadores).
+		seed: Semilla opcional; fija el resultado para los mismos parámetros.
+		face_weights: Pesos opcionales de dados cargados (ver ``simulate_dice_game``).
 
 	Returns:
-		Lista ordenada de jugadores con sus estadísticas.
+		``VariantResults`` con una fila por partida.
 	"""
 
-	return [
-		PlayerStats.from_arrays(player_idx + 1, frequencies[player_idx], totals[player_idx])
-		for player_idx in range(frequencies.shape[0])
+	_validate_inputs(num_players, num_games, batch_size)
+	rules.validate()
+	alias_table = _alias_table_for(face_weights, num_players)
+	chunk_rounds = min(rules.max_rounds, rules.elimination_interval or rules.max_rounds, 1_024)
+	if rules.target_score is not None:
+		# Tramos apenas mayores que la duración esperada evitan tirar dados de partidas terminadas.
+		chunk_rounds = min(chunk_rounds, max(8, int(1.25 * rules.target_score / 3.5) + 1))
+	games_per_batch = max(1, batch_size // (chunk_rounds * num_players))
+	bit_generator = _stream_bit_generator(_seed_sequence(seed), 0, num_players)
+
+	parts = [
+		_variant_batch(
+			bit_generator,
+			min(games_per_batch, num_games - start),
+			num_players,
+			rules,
+			chunk_rounds,
+			alias_table,
+		)
+		for start in range(0, num_games, games_per_batch)
 	]
+	scores, rounds_played, winners, elimination_rounds, bonus_points, frequencies = (
+		np.concatenate(column) for column in zip(*parts)
+	)
+	return VariantResults(
+		rules=rules,
+		final_scores=scores,
+		rounds_played=rounds_played,
+		winners=winners,
+		elimination_rounds=elimination_rounds,
+		bonus_points=bonus_points,
+		frequencies=frequencies,
+	)
 
 
-def simulate_probabilities(
+SKETCH_BINS = 2_048
+
+
+def _regrid(counts: np.ndarray, origin: int, width: int, new_origin: int, new_width: int) -> np.ndarray:
+	"""Reubica conteos de casillas en una grilla más gruesa alineada (``new_width`` múltiplo de ``width``)."""
+
+	occupied = np.flatnonzero(counts)
+	targets = (origin + width * occupied - new_origin) // new_width
+	return np.bincount(targets, weights=counts[occupied], minlength=len(counts)).astype(np.int64)
+
+
+@dataclass
+class ScoreSketch:
+	"""Histograma de casillas fijas y rango adaptable para valores enteros en streaming.
+
+	Usa ``bins`` contadores sin importar cuántos valores reciba: cuando un valor
+	cae fuera del rango, el ancho de casilla se duplica (siempre potencia de 2) y
+	las casillas vecinas se fusionan. Dos bosquejos se combinan con ``merge``.
+
+	Garantías: ``count``, ``minimum``, ``maximum`` y ``mean`` son exactos. ``quantile(q)``
+	aproxima el menor valor con al menos ``q * count`` observaciones menores o iguales
+	con error menor a ``resolution`` (el ancho de casilla), y
+	``resolution < max(1, 2 * (maximum - minimum) / (bins - 1))``.
+	"""
+
+	bins: int = SKETCH_BINS
+	origin: int = 0
+	width: int = 1
+	counts: np.ndarray | None = None
+	count: int = 0
+	minimum: int = 0
+	maximum: int = 0
+	total: int = 0
+
+	@property
+	def resolution(self) -> int:
+		"""Cota del error (en puntos) de los cuantiles informados."""
+
+		return self.width
+
+	@property
+	def mean(self) -> float:
+		if not self.count:
+			raise ValueError("El bosquejo está vacío")
+		return self.total / self.count
+
+	def _cover(self, low: int, high: int, min_width: int = 1) -> None:
+		"""Amplía el rango para cubrir ``[low, high]`` duplicando el ancho si hace falta."""
+
+		width = max(self.width, min_width)
+		origin = (low // width) * width
+		while high >= origin + width * self.bins:
+			width *= 2
+			origin = (low // width) * width
+		if self.counts is None:
+			self.counts = np.zeros(self.bins, dtype=np.int64)
+		elif (origin, width) != (self.origin, self.width):
+			self.counts = _regrid(self.counts, self.origin, self.width, origin, width)
+		self.origin, self.width = origin, width
+
+	def update(self, values: Sequence[int] | np.ndarray) -> "ScoreSketch":
+		"""Agrega un lote de valores enteros (operación vectorizada)."""
+
+		values = np.asarray(values, dtype=np.int64).ravel()
+		if not values.size:
+			return self
+		low, high = int(values.min()), int(values.max())
+		if self.count:
+			low, high = min(low, self.minimum), max(high, self.maximum)
+		self._cover(low, high)
+		self.counts += np.bincount((values - self.origin) // self.width, minlength=self.bins)
+		self.count += int(values.size)
+		self.minimum, self.maximum = low, high
+		self.total += int(values.sum())
+		return self
+
+	def merge(self, other: "ScoreSketch") -> "ScoreSketch":
+		"""Combina otro bosquejo (p. ej. de otro hilo o proceso) en éste.
+
+		Raises:
+			ValueError: Si los bosquejos tienen distinta cantidad de casillas.
+		"""
+
+		if other.bins != self.bins:
+			raise ValueError("Sólo se pueden combinar bosquejos con la misma cantidad de casillas")
+		if not other.count:
+			return self
+		low, high = other.minimum, other.maximum
+		if self.count:
+			low, high = min(low, self.minimum), max(high, self.maximum)
+		self._cover(low, high, other.width)
+		self.counts += _regrid(other.counts, other.origin, other.width, self.origin, self.width)
+		self.count += other.count
+		self.minimum, self.maximum = low, high
+		self.total += other.total
+		return self
+
+	def quantile(self, q: float) -> float:
+		"""Cuantil ``q`` (entre 0 y 1), interpolado dentro de su casilla.
+
+		Raises:
+			ValueError: Si el bosquejo está vacío o ``q`` está fuera de [0, 1].
+		"""
+
+		if not self.count:
+			raise ValueError("El bosquejo está vacío")
+		if not 0.0 <= q <= 1.0:
+			raise ValueError("El cuantil debe estar entre 0 y 1")
+		rank = max(0, int(np.ceil(q * self.count)) - 1)
+		cumulative = np.cumsum(self.counts)
+		index = int(np.searchsorted(cumulative, rank, side="right"))
+		before = int(cumulative[index - 1]) if index else 0
+		left = self.origin + self.width * index
+		value = left + (rank - before + 0.5) / self.counts[index] * self.width - 0.5
+		value = min(max(value, left, self.minimum), left + self.width - 1, self.maximum)
+		return float(value)
+
+	def quantiles(self, qs: Iterable[float]) -> Dict[float, float]:
+		"""Varios cuantiles a la vez, ``{q: valor}``."""
+
+		return {q: self.quantile(q) for q in qs}
+
+
+@dataclass
+class GameScoreSummary:
+	"""Resumen en memoria acotada de los puntajes finales de muchas partidas.
+
+	``margins`` registra, por partida, los puntos del ganador menos los del segundo
+	(``None`` con un único jugador).
+	"""
+
+	num_games: int
+	num_rounds: int
+	totals: List[ScoreSketch]
+	margins: ScoreSketch | None
+
+	def merge(self, other: "GameScoreSummary") -> "GameScoreSummary":
+		"""Combina el resumen de otro conjunto disjunto de partidas.
+
+		Raises:
+			ValueError: Si los resúmenes tienen distinta cantidad de rondas o jugadores.
+		"""
+
+		if (self.num_rounds, len(self.totals)) != (other.num_rounds, len(other.totals)):
+			raise ValueError("Sólo se pueden combinar resúmenes con igual cantidad de rondas y jugadores")
+		for mine, theirs in zip(self.totals, other.totals):
+			mine.merge(theirs)
+		if self.margins is not None:
+			self.margins.merge(other.margins)
+		self.num_games += other.num_games
+		return self
+
+	def report(self, qs: Sequence[float] = (0.5, 0.99)) -> Dict[str, object]:
+		"""Cuantiles, extremos y resolución de cada bosquejo en un diccionario serializable."""
+
+		def describe(sketch: ScoreSketch) -> Dict[str, object]:
+			summary: Dict[str, object] = {f"p{q * 100:g}": sketch.quantile(q) for q in qs}
+			summary.update(
+				min=sketch.minimum, max=sketch.maximum, mean=sketch.mean, resolution=sketch.resolution
+			)
+			return summary
+
+		result: Dict[str, object] = {
+			"num_games": self.num_games,
+			"num_rounds": self.num_rounds,
+			"totals": {idx + 1: describe(sketch) for idx, sketch in enumerate(self.totals)},
+		}
+		if self.margins is not None:
+			result["margins"] = describe(self.margins)
+		return result
+
+
+def _sketch_game_range(
+	seed_sequence: np.random.SeedSequence,
+	first_game: int,
+	stop_game: int,
+	num_players: int,
+	num_rounds: int,
+	batch_size: int,
+	alias_table: _AliasTable | None,
+	bins: int,
+) -> GameScoreSummary:
+	"""Simula las partidas ``[first_game, stop_game)`` y las vuelca en bosquejos."""
+
+	summary = GameScoreSummary(
+		num_games=stop_game - first_game,
+		num_rounds=num_rounds,
+		totals=[ScoreSketch(bins=bins) for _ in range(num_players)],
+		margins=ScoreSketch(bins=bins) if num_players > 1 else None,
+	)
+	bit_generator = _stream_bit_generator(seed_sequence, first_game * num_rounds, num_players)
+	games_per_chunk = max(1, batch_size // (num_rounds * num_players))
+	for start in range(first_game, stop_game, games_per_chunk):
+		games = min(games_per_chunk, stop_game - start)
+		if games == 1 and num_rounds * num_players > batch_size:
+			totals = np.zeros((1, num_players), dtype=np.int64)
+			for offset in range(0, num_rounds, max(1, batch_size // num_players)):
+				rounds = min(max(1, batch_size // num_players), num_rounds - offset)
+				totals += _roll_dice(bit_generator, rounds, num_players, alias_table).sum(axis=0)
+		else:
+			rolls = _roll_dice(bit_generator, games * num_rounds, num_players, alias_table)
+			totals = rolls.reshape(games, num_rounds, num_players).sum(axis=1)
+		for player_idx, sketch in enumerate(summary.totals):
+			sketch.update(totals[:, player_idx])
+		if summary.margins is not None:
+			top_two = np.partition(totals, -2, axis=1)[:, -2:]
+			summary.margins.update(top_two[:, 1] - top_two[:, 0])
+	return summary
+
+
+def sketch_game_scores(
 	num_players: int,
 	num_rounds: int,
+	num_games: int,
 	*,
 	batch_size: int = 100_000,
 	seed: int | None = None,
-) -> Dict[int, Dict[int, float]]:
-	"""Calcula la distribución de probabilidades observada para cada jugador.
+	face_weights: Sequence[float] | Sequence[Sequence[float]] | None = None,
+	workers: int = 1,
+	bins: int = SKETCH_BINS,
+) -> GameScoreSummary:
+	"""Juega ``num_games`` partidas de ``num_rounds`` rondas y resume sus puntajes finales.
 
-	Refactorización: Replace Data with Object al reutilizar los objetos "PlayerStats".
+	Refactorización: Replace Collection with Streaming Summary. En lugar de guardar
+	cada total en una lista, los lotes de partidas alimentan ``ScoreSketch`` por
+	jugador y uno de márgenes, así que la memoria no depende de ``num_games``.
+
+	La partida ``g`` usa las rondas ``[g * num_rounds, (g + 1) * num_rounds)`` del
+	flujo de la semilla (como ``rolls_for_rounds``), de modo que los datos no
+	dependen de ``batch_size`` ni de ``workers``; cada hilo resume un tramo
+	contiguo de partidas y los resúmenes se combinan al final.
 
 	Args:
-		num_players: Número de jugadores a simular.
-		num_rounds: Número de rondas en cada simulación.
-		batch_size: Tamaño del lote para ejecutar la simulación por bloques.
-		seed: Semilla opcional para obtener resultados reproducibles.
+		num_players: Número de jugadores (1-4).
+		num_rounds: Rondas por partida.
+		num_games: Partidas a jugar.
+		batch_size: Tiradas máximas por bloque.
+		seed: Semilla opcional.
+		face_weights: Pesos opcionales de dados cargados (ver ``simulate_dice_game``).
+		workers: Hilos que reparten las partidas.
+		bins: Casillas de cada bosquejo (define memoria y resolución).
 
 	Returns:
-		Un diccionario keyed por `player_id` cuyo valor es otro diccionario `{cara: probabilidad}`.
+		``GameScoreSummary`` con un bosquejo por jugador y uno de márgenes.
+
+	Raises:
+		ValueError: Si algún parámetro es inválido.
 	"""
 
-	stats = simulate_dice_game(num_players, num_rounds, batch_size=batch_size, seed=seed)
-	return {player.player_id: player.probability_distribution() for player in stats.players}
+	_validate_inputs(num_players, num_rounds, batch_size)
+	if num_games <= 0:
+		raise ValueError("Las partidas deben ser mayores a cero")
+	if workers <= 0:
+		raise ValueError("La cantidad de hilos debe ser mayor a cero")
+	if bins < 2:
+		raise ValueError("El bosquejo necesita al menos 2 casillas")
+
+	seed_sequence = _seed_sequence(seed)
+	alias_table = _alias_table_for(face_weights, num_players)
+	ranges = _split_rounds(0, num_games, workers)
+	with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+		parts = list(
+			executor.map(
+				lambda bounds: _sketch_game_range(
+					seed_sequence, bounds[0], bounds[1], num_players, num_rounds, batch_size, alias_table, bins
+				),
+				ranges,
+			)
+		)
+	summary = parts[0]
+	for part in parts[1:]:
+		summary.merge(part)
+	return summary
+
+
+EXPORT_FORMATS = ("npz", "csv", "jsonl")
+EXPORT_COLUMNS = (
+	"result",
+	"total_rounds",
+	"player_id",
+	"total_points",
+	*(f"freq_{face}" for face in range(1, 7)),
+)
+_JSONL_ROW_FORMAT = (
+	'{"result": %d, "total_rounds": %d, "player_id": %d, "total_points": %d, '
+	'"frequencies": [%d, %d, %d, %d, %d, %d]}'
+)
+
+
+def _infer_export_format(path: str, fmt: str | None) -> str:
+	"""Resuelve el formato de exportación a partir de ``fmt`` o de la extensión de ``path``."""
+
+	if fmt is None:
+		fmt = os.path.splitext(path)[1].lstrip(".").lower() or "jsonl"
+	if fmt not in EXPORT_FORMATS:
+		raise ValueError(f"Formato no soportado {fmt!r}; usa uno de {', '.join(EXPORT_FORMATS)}")
+	return fmt
+
+
+class ResultsWriter:
+	"""Escritor columnar en streaming para resultados de simulación.
+
+	Refactorización: Replace Temp with Buffer. Cada jugador de cada resultado se vuelca
+	como una fila entera (``EXPORT_COLUMNS``) en un búfer ``int64`` preasignado; al
+	llenarse, el bloque se escribe al disco de una vez (``np.savetxt`` para CSV y JSON
+	Lines, un miembro ``.npy`` por bloque dentro del ``.npz``). Así, un torneo con
+	millones de resultados nunca se materializa como una única cadena ni como
+	diccionarios intermedios.
+
+	Args:
+		path: Archivo de destino.
+		fmt: ``"npz"``, ``"csv"`` o ``"jsonl"``; por defecto se infiere de la extensión.
+		chunk_rows: Filas acumuladas antes de volcar un bloque.
+	"""
+
+	def __init__(self, path: str, fmt: str | None = None, *, chunk_rows: int = 65_536) -> None:
+		if chunk_rows <= 0:
+			raise ValueError("chunk_rows debe ser mayor a cero")
+		self.path = path
+		self.fmt = _infer_export_format(path, fmt)
+		self._buffer = np.empty((chunk_rows, len(EXPORT_COLUMNS)), dtype=np.int64)
+		self._filled = 0
+		self._next_result = 0
+		self._chunks_written = 0
+		if self.fmt == "npz":
+			self._archive = zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED)
+			self._write_npy("columns", np.array(EXPORT_COLUMNS))
+		else:
+			self._handle = open(path, "w", encoding="utf-8", newline="")
+			if self.fmt == "csv":
+				self._handle.write(",".join(EXPORT_COLUMNS) + "\n")
+
+	def __enter__(self) -> "ResultsWriter":
+		return self
+
+	def __exit__(self, *exc_info: object) -> None:
+		self.close()
+
+	def write(self, stats: GameStatistics) -> None:
+		"""Agrega un ``GameStatistics`` al archivo.
+
+		Usa ``stats.arrays`` si el resultado viene del motor; sólo los armados a mano
+		se reconstruyen desde sus ``PlayerStats``.
+		"""
+
+		totals, frequencies = stats.arrays if stats.arrays is not None else _statistics_arrays(stats)
+		self.write_arrays(stats.total_rounds, totals, frequencies)
+
+	def write_arrays(self, total_rounds: int, totals: np.ndarray, frequencies: np.ndarray) -> None:
+		"""Agrega un resultado directamente desde sus arreglos de totales y frecuencias.
+
+		Un resultado con más jugadores que ``chunk_rows`` se vuelca como bloque propio.
+		"""
+
+		num_players = len(totals)
+		if self._filled + num_players > len(self._buffer):
+			self._flush()
+		oversized = num_players > len(self._buffer)
+		if oversized:
+			rows = np.empty((num_players, len(EXPORT_COLUMNS)), dtype=np.int64)
+		else:
+			rows = self._buffer[self._filled:self._filled + num_players]
+		rows[:, 0] = self._next_result
+		rows[:, 1] = total_rounds
+		rows[:, 2] = np.arange(1, num_players + 1)
+		rows[:, 3] = totals
+		rows[:, 4:] = frequencies
+		self._next_result += 1
+		if oversized:
+			self._write_block(rows)
+		else:
+			self._filled += num_players
+
+	def close(self) -> None:
+		"""Vuelca el último bloque y cierra el archivo."""
+
+		self._flush()
+		if self.fmt == "npz":
+			self._archive.close()
+		else:
+			self._handle.close()
+
+	def _flush(self) -> None:
+		if self._filled == 0:
+			return
+		self._write_block(self._buffer[:self._filled])
+		self._filled = 0
+
+	def _write_block(self, block: np.ndarray) -> None:
+		if self.fmt == "npz":
+			self._write_npy(f"chunk_{self._chunks_written:06d}", block)
+		elif self.fmt == "csv":
+			np.savetxt(self._handle, block, fmt="%d", delimiter=",")
+		else:
+			np.savetxt(self._handle, block, fmt=_JSONL_ROW_FORMAT)
+		self._chunks_written += 1
+
+	def _write_npy(self, name: str, array: np.ndarray) -> None:
+		with self._archive.open(f"{name}.npy", "w", force_zip64=True) as member:
+			np.lib.format.write_array(member, np.ascontiguousarray(array))
+
+
+def _statistics_arrays(stats: GameStatistics) -> Tuple[np.ndarray, np.ndarray]:
+	"""Reconstruye los vectores ``(totals, frequencies)`` de un ``GameStatistics``."""
+
+	totals = np.fromiter((p.total_points for p in stats.players), dtype=np.int64, count=len(stats.players))
+	frequencies = np.array(
+		[[p.frequencies.get(face, 0) for face in range(1, 7)] for p in stats.players],
+		dtype=np.int64,
+	).reshape(len(stats.players), 6)
+	return totals, frequencies
+
+
+def write_results(
+	results: Iterable[GameStatistics],
+	path: str,
+	fmt: str | None = None,
+	*,
+	chunk_rows: int = 65_536,
+) -> int:
+	"""Exporta en streaming una secuencia (posiblemente un generador) de resultados.
+
+	Returns:
+		Cantidad de resultados escritos.
+	"""
+
+	count = 0
+	with ResultsWriter(path, fmt, chunk_rows=chunk_rows) as writer:
+		for stats in results:
+			writer.write(stats)
+			count += 1
+	return count
+
+
+def _read_export_table(path: str, fmt: str) -> np.ndarray:
+	"""Lee la tabla ``(filas, EXPORT_COLUMNS)`` de un archivo exportado."""
+
+	if fmt == "npz":
+		with np.load(path) as data:
+			chunks = sorted(name for name in data.files if name.startswith("chunk_"))
+			if not chunks:
+				return np.empty((0, len(EXPORT_COLUMNS)), dtype=np.int64)
+			return np.concatenate([data[name] for name in chunks])
+	if fmt == "csv":
+		return np.loadtxt(path, delimiter=",", skiprows=1, dtype=np.int64, ndmin=2).reshape(-1, len(EXPORT_COLUMNS))
+
+	rows = []
+	with open(path, encoding="utf-8") as handle:
+		for line in handle:
+			if line.strip():
+				record = json.loads(line)
+				rows.append(
+					[record["result"], record["total_rounds"], record["player_id"], record["total_points"]]
+					+ record["frequencies"]
+				)
+	return np.array(rows, dtype=np.int64).reshape(-1, len(EXPORT_COLUMNS))
+
+
+def load_results(path: str, fmt: str | None = None) -> List[GameStatistics]:
+	"""Carga un archivo escrito por ``ResultsWriter`` como lista de ``GameStatistics``."""
+
+	table = _read_export_table(path, _infer_export_format(path, fmt))
+	if len(table) == 0:
+		return []
+	table = table[np.lexsort((table[:, 2], table[:, 0]))]
+	starts = np.flatnonzero(np.diff(table[:, 0], prepend=table[0, 0] - 1))
+	return [
+		_build_game_statistics(int(group[0, 1]), group[:, 3], group[:, 4:])
+		for group in np.split(table, starts[1:])
+	]
+
+
+JOB_ENGINES = ("vectorized", "threaded", "exact")
+_JOB_FIELDS = {"id", "players", "rounds", "seed", "engine", "batch", "threads", "face_weights"}
+
+
+def run_job(spec: Dict[str, object]) -> Dict[str, object]:
+	"""Ejecuta una especificación de simulación y devuelve su resultado serializable.
+
+	Campos admitidos: ``players`` (4), ``rounds`` (obligatorio), ``seed``, ``engine``
+	(``"vectorized"``, ``"threaded"`` o ``"exact"``), ``batch``, ``threads``,
+	``face_weights`` e ``id`` (se copia tal cual a la salida).
+
+	Raises:
+		ValueError: Si la especificación tiene campos desconocidos o valores inválidos.
+	"""
+
+	unknown = set(spec) - _JOB_FIELDS
+	if unknown:
+		raise ValueError(f"Campos desconocidos: {', '.join(sorted(unknown))}")
+	if "rounds" not in spec:
+		raise ValueError("Falta el campo obligatorio 'rounds'")
+	engine = spec.get("engine", "vectorized")
+	num_players = int(spec.get("players", 4))
+	num_rounds = int(spec["rounds"])
+	batch_size = int(spec.get("batch", 100_000))
+	face_weights = spec.get("face_weights")
+
+	if engine == "exact":
+		exact = exact_game_distribution(num_players, num_rounds, face_weights=face_weights)
+		return {
+			"total_rounds": num_rounds,
+			"win_probabilities": exact.win_probabilities,
+			"reported_winner_probabilities": exact.reported_winner_probabilities,
+			"tie_probability": exact.tie_probability,
+			"expected_totals": exact.expected_totals,
+			"expected_max_total": exact.expected_max_total,
+		}
+	if engine == "threaded":
+		stats = simulate_dice_game_threaded(
+			num_players,
+			num_rounds,
+			threads=spec.get("threads"),
+			batch_size=batch_size,
+			seed=spec.get("seed"),
+			face_weights=face_weights,
+		)
+	elif engine == "vectorized":
+		stats = simulate_dice_game(
+			num_players, num_rounds, batch_size=batch_size, seed=spec.get("seed"), face_weights=face_weights
+		)
+	else:
+		raise ValueError(f"Motor desconocido {engine!r}; usa uno de {', '.join(JOB_ENGINES)}")
+	return stats.to_dict()
+
+
+def _timed_job(job_index: int, spec: object) -> Dict[str, object]:
+	"""Envuelve ``run_job`` con medición de tiempo y aislamiento de errores."""
+
+	record: Dict[str, object] = {"job": job_index}
+	if isinstance(spec, dict) and "id" in spec:
+		record["id"] = spec["id"]
+	start = time.perf_counter()
+	try:
+		if isinstance(spec, Exception):
+			raise spec
+		if not isinstance(spec, dict):
+			raise ValueError("Cada línea debe ser un objeto JSON")
+		record["engine"] = spec.get("engine", "vectorized")
+		record["result"] = run_job(spec)
+		record["status"] = "ok"
+	except Exception as exc:  # noqa: BLE001 - cada trabajo falla de forma aislada.
+		record["status"] = "error"
+		record["error"] = f"{type(exc).__name__}: {exc}"
+	record["seconds"] = time.perf_counter() - start
+	return record
+
+
+def _read_job_specs(lines: Iterable[str]) -> Iterator[object]:
+	"""Interpreta líneas JSON; una línea inválida se entrega como excepción para aislarla."""
+
+	for line in lines:
+		if not line.strip():
+			continue
+		try:
+			yield json.loads(line)
+		except json.JSONDecodeError as exc:
+			yield ValueError(f"JSON inválido: {exc}")
+
+
+def run_jobs(
+	specs: Iterable[object],
+	*,
+	workers: int | None = None,
+	ordered: bool = True,
+) -> Iterator[Dict[str, object]]:
+	"""Ejecuta muchas especificaciones en un único proceso con un pool de hilos compartido.
+
+	Refactorización: Replace Process per Job with Worker Pool. El intérprete y NumPy
+	se cargan una sola vez y los hilos del pool se reutilizan entre trabajos; como
+	los kernels liberan el GIL, varios trabajos avanzan en paralelo. Cada registro
+	incluye ``job`` (posición en la entrada), ``status``, ``seconds`` y ``result`` o
+	``error``; un fallo no afecta al resto.
+
+	Args:
+		specs: Especificaciones (diccionarios) en orden de entrada.
+		workers: Hilos del pool; por defecto ``os.cpu_count()``.
+		ordered: ``True`` para emitir en orden de entrada, ``False`` en orden de finalización.
+
+	Yields:
+		Un registro por trabajo.
+	"""
+
+	with ThreadPoolExecutor(max_workers=workers or os.cpu_count() or 1) as executor:
+		futures = [executor.submit(_timed_job, idx, spec) for idx, spec in enumerate(specs)]
+		for future in futures if ordered else as_completed(futures):
+			yield future.result()
 
 
 def benchmark_simulator(
@@ -228,6 +2832,168 @@ def benchmark_simulator(
 	return timer.repeat(repeat=repeat, number=number)
 
 
+def benchmark_threads(
+	num_players: int,
+	num_rounds: int,
+	*,
+	max_threads: int | None = None,
+	batch_size: int = 100_000,
+	repeat: int = 3,
+) -> List[Dict[str, float]]:
+	"""Compara la latencia del motor con hilos contra el camino secuencial.
+
+	Refactorización: Preserve Whole Object al reutilizar ``timeit`` igual que
+	``benchmark_simulator``.
+
+	Args:
+		num_players: Jugadores involucrados.
+		num_rounds: Rondas a simular por jugador.
+		max_threads: Mayor cantidad de hilos a medir (por defecto ``os.cpu_count()``).
+		batch_size: Tamaño de lote usado por cada hilo.
+		repeat: Repeticiones de ``timeit``; se reporta la mejor.
+
+	Returns:
+		Una fila por cantidad de hilos (1..``max_threads``) con ``threads``,
+		``seconds`` (mejor corrida) y ``speedup`` respecto de ``simulate_dice_game``.
+	"""
+
+	max_threads = max_threads if max_threads is not None else (os.cpu_count() or 1)
+	baseline = min(benchmark_simulator(num_players, num_rounds, batch_size=batch_size, repeat=repeat))
+	rows: List[Dict[str, float]] = []
+	for threads in range(1, max_threads + 1):
+		timer = timeit.Timer(
+			lambda: simulate_dice_game_threaded(
+				num_players, num_rounds, threads=threads, batch_size=batch_size
+			)
+		)
+		seconds = min(timer.repeat(repeat=repeat, number=1))
+		rows.append({"threads": threads, "seconds": seconds, "speedup": baseline / seconds})
+	return rows
+
+
+LATENCY_PERCENTILES = (50, 90, 99, 99.9)
+
+
+def _latency_percentiles(call: Callable[[], object], calls: int) -> Dict[str, float]:
+	"""Cronometra ``calls`` invocaciones una a una y resume la latencia en microsegundos."""
+
+	call()  # Calentamiento: primera recarga de búferes y cachés de NumPy.
+	samples = np.empty(calls)
+	clock = time.perf_counter_ns
+	for idx in range(calls):
+		begin = clock()
+		call()
+		samples[idx] = clock() - begin
+	samples /= 1_000
+	summary = {f"p{q:g}": float(value) for q, value in zip(LATENCY_PERCENTILES, np.percentile(samples, LATENCY_PERCENTILES))}
+	summary["mean"] = float(samples.mean())
+	summary["calls"] = calls
+	return summary
+
+
+def benchmark_latency(
+	num_players: int,
+	num_rounds: int,
+	*,
+	calls: int = 10_000,
+	baseline_calls: int = 200,
+	seed: int | None = None,
+) -> Dict[str, Dict[str, float]]:
+	"""Compara la latencia por llamada de ``SmallGameSimulator`` contra ``simulate_dice_game``.
+
+	Refactorización: Preserve Whole Object al reutilizar ambos motores tal cual; a
+	diferencia de ``benchmark_simulator`` mide cada llamada por separado para
+	reportar percentiles y no sólo el promedio.
+
+	Args:
+		num_players: Jugadores involucrados.
+		num_rounds: Rondas de cada partida (el caso de interés es 10-1000).
+		calls: Llamadas medidas del simulador reutilizable.
+		baseline_calls: Llamadas medidas de ``simulate_dice_game`` (mucho más lento).
+		seed: Semilla opcional de ambos motores.
+
+	Returns:
+		``{"simulate_dice_game": ..., "SmallGameSimulator": ...}`` con ``p50``, ``p90``,
+		``p99``, ``p99.9`` y ``mean`` en microsegundos y la cantidad de ``calls``.
+
+	Raises:
+		ValueError: Si algún parámetro es inválido.
+	"""
+
+	if calls <= 0 or baseline_calls <= 0:
+		raise ValueError("La cantidad de llamadas debe ser mayor a cero")
+	_validate_inputs(num_players, num_rounds, 1)
+	simulator = SmallGameSimulator(num_players, seed=seed)
+	return {
+		"simulate_dice_game": _latency_percentiles(
+			lambda: simulate_dice_game(num_players, num_rounds, seed=seed), baseline_calls
+		),
+		"SmallGameSimulator": _latency_percentiles(lambda: simulator.play(num_rounds), calls),
+	}
+
+
+def _traced_peak_bytes(num_players: int, num_rounds: int, batch_size: int) -> int:
+	"""Pico de memoria de una corrida bajo ``tracemalloc`` (NumPy registra sus búferes allí)."""
+
+	tracemalloc.start()
+	try:
+		simulate_dice_game(num_players, num_rounds, batch_size=batch_size)
+		_, peak_bytes = tracemalloc.get_traced_memory()
+	finally:
+		tracemalloc.stop()
+	return peak_bytes
+
+
+def measure_throughput(
+	num_players: int,
+	num_rounds: int,
+	*,
+	batch_size: int = 100_000,
+	repeat: int = 3,
+) -> Dict[str, float]:
+	"""Mide rendimiento y memoria pico de una configuración concreta.
+
+	Refactorización: Preserve Whole Object al reutilizar ``benchmark_simulator`` y
+	sumar una corrida extra bajo ``tracemalloc``. Esa corrida se hace en un proceso
+	hijo: ``tracemalloc`` es global al proceso, así que en un servidor compartido
+	(el laboratorio de Streamlit) contaría asignaciones de otras sesiones y las
+	frenaría a todas mientras está activo.
+
+	Args:
+		num_players: Jugadores involucrados.
+		num_rounds: Rondas a simular por jugador.
+		batch_size: Tamaño de lote a evaluar.
+		repeat: Repeticiones de ``timeit``; se reporta la mejor.
+
+	Returns:
+		Diccionario con ``num_players``, ``batch_size``, ``seconds``,
+		``rounds_per_second`` y ``peak_memory_mb``.
+	"""
+
+	_validate_inputs(num_players, num_rounds, batch_size)
+	seconds = min(benchmark_simulator(num_players, num_rounds, batch_size=batch_size, repeat=repeat))
+	child = subprocess.run(
+		[
+			sys.executable,
+			"-c",
+			"import CodigoRefactorizado as engine; "
+			f"print(engine._traced_peak_bytes({int(num_players)}, {int(num_rounds)}, {int(batch_size)}))",
+		],
+		cwd=os.path.dirname(os.path.abspath(__file__)),
+		capture_output=True,
+		text=True,
+		check=True,
+	)
+	peak_bytes = int(child.stdout.split()[-1])
+	return {
+		"num_players": num_players,
+		"batch_size": batch_size,
+		"seconds": seconds,
+		"rounds_per_second": num_rounds / seconds if seconds > 0 else float("inf"),
+		"peak_memory_mb": peak_bytes / (1024 * 1024),
+	}
+
+
 def profile_with_cprofile(num_players: int, num_rounds: int, *, batch_size: int = 100_000) -> str:
 	"""Ejecuta ``cProfile`` sobre la simulación y devuelve un resumen.
 
@@ -268,6 +3034,264 @@ class DiceGameTests(unittest.TestCase):
 		for distribution in probabilities.values():
 			self.assertAlmostEqual(sum(distribution.values()), 1.0, places=3)
 
+	def test_threaded_matches_sequential(self) -> None:
+		sequential = simulate_dice_game(3, 10_001, batch_size=4_096, seed=7)
+		for threads in (1, 2, 5):
+			threaded = simulate_dice_game_threaded(3, 10_001, threads=threads, batch_size=1_000, seed=7)
+			self.assertEqual(threaded.to_dict(), sequential.to_dict())
+
+	def test_shards_merge_matches_full_run(self) -> None:
+		expected = simulate_dice_game(2, 9_999, batch_size=1_000, seed=11)
+		with tempfile.TemporaryDirectory() as tmp:
+			paths = []
+			for index in range(3):  # Cada proceso hace de nodo independiente.
+				path = os.path.join(tmp, f"shard_{index}.npz")
+				subprocess.run(
+					[sys.executable, os.path.abspath(__file__), "--players", "2", "--rounds", "9999",
+					 "--seed", "11", "--batch", "700", "--shard", f"{index}/3", "--partial-output", path],
+					check=True,
+					capture_output=True,
+				)
+				paths.append(path)
+			shards = [ShardResult.load(path) for path in paths]
+		self.assertEqual(merge_shards(shards).to_dict(), expected.to_dict())
+		with self.assertRaises(ValueError):
+			merge_shards(shards[:1] + shards)
+		with self.assertRaises(ValueError):
+			merge_shards(shards[1:])
+		weights = [1, 1, 1, 1, 1, 5]
+		loaded = [simulate_shard(2, 9_999, index, 3, seed=11, face_weights=weights) for index in range(3)]
+		expected = simulate_dice_game(2, 9_999, seed=11, face_weights=weights)
+		self.assertEqual(merge_shards(loaded).to_dict(), expected.to_dict())
+		with self.assertRaises(ValueError):
+			merge_shards(shards[:2] + loaded[2:])
+
+	def test_throughput_traces_memory_in_a_child_process(self) -> None:
+		row = measure_throughput(2, 50_000, batch_size=20_000, repeat=1)
+		self.assertFalse(tracemalloc.is_tracing())
+		self.assertGreater(row["peak_memory_mb"] * 1024 * 1024, 20_000 * 2 * 8)  # Al menos las palabras de un lote.
+
+	def test_exact_engine_matches_enumeration(self) -> None:
+		exact = exact_game_distribution(2, 1)
+		self.assertAlmostEqual(exact.win_probabilities[1], 15 / 36)
+		self.assertAlmostEqual(exact.tie_probability, 6 / 36)
+		self.assertAlmostEqual(exact.reported_winner_probabilities[1], 21 / 36)
+		offset, pmf = exact_total_pmf(200)
+		direct = np.ones(1)
+		for _ in range(200):
+			direct = np.convolve(direct, np.full(6, 1 / 6))
+		np.testing.assert_allclose(pmf, direct[offset - 200:offset - 200 + len(pmf)], atol=1e-14)
+		large = exact_game_distribution(4, 10**7)
+		self.assertAlmostEqual(large.expected_totals[1], 3.5 * 10**7, delta=1e-3)
+		self.assertAlmostEqual(sum(large.reported_winner_probabilities.values()), 1.0, places=9)
+
+	def test_weighted_dice_follow_configured_weights(self) -> None:
+		weights = [[0, 0, 0, 0, 0, 1], [6, 5, 4, 3, 2, 1]]
+		stats = simulate_dice_game(2, 60_000, batch_size=7_000, seed=5, face_weights=weights)
+		self.assertEqual(stats.players[0].frequencies[6], 60_000)
+		for deviation in stats.players[1].deviation_from_weights().values():
+			self.assertLess(abs(deviation), 0.01)
+		exact = simulate_probabilities(2, 10, method="exact", face_weights=weights)
+		self.assertAlmostEqual(exact[2][1], 6 / 21)
+		with self.assertRaises(ValueError):
+			simulate_dice_game(2, 10, face_weights=[1, 1, 1])
+
+	def test_variant_rules_engine(self) -> None:
+		plain = simulate_variant(3, 50, GameRules(max_rounds=40), batch_size=500, seed=3)
+		self.assertTrue(np.all(plain.rounds_played == 40))
+		np.testing.assert_array_equal(plain.final_scores, (plain.frequencies * FACES).sum(axis=2))
+		np.testing.assert_array_equal(plain.winners, plain.final_scores.argmax(axis=1))
+
+		target = simulate_variant(4, 200, GameRules(max_rounds=500, target_score=30, match_bonus=2), seed=4)
+		self.assertTrue(np.all(target.final_scores.max(axis=1) >= 30))
+		self.assertTrue(np.all(target.rounds_played <= 30))
+		np.testing.assert_array_equal(
+			target.final_scores, (target.frequencies * FACES).sum(axis=2) + target.bonus_points
+		)
+		self.assertEqual(target.metrics()["target_reached_rate"], 1.0)
+
+		elimination = simulate_variant(4, 100, GameRules(max_rounds=10, elimination_interval=1), seed=5)
+		self.assertTrue(np.all(elimination.rounds_played == 3))
+		np.testing.assert_array_equal(np.sort(elimination.elimination_rounds, axis=1)[:, 1:], [[1, 2, 3]] * 100)
+		self.assertEqual(elimination.game_statistics(0).winner.player_id, elimination.winners[0] + 1)
+		solo = simulate_variant(1, 20, GameRules(max_rounds=10, elimination_interval=3), seed=6)
+		self.assertTrue(np.all(solo.rounds_played == 10))
+		self.assertFalse(solo.elimination_rounds.any())
+
+	def test_batch_means_confidence_intervals(self) -> None:
+		stats = simulate_dice_game(2, 64_000, batch_size=5_000, seed=21, confidence=True)
+		plain = simulate_dice_game(2, 64_000, batch_size=5_000, seed=21)
+		self.assertEqual(plain.to_dict(), stats.to_dict())
+		self.assertIsNone(plain.winner_margin)
+		self.assertIsNone(plain.players[0].confidence)
+		for player in stats.players:
+			confidence = player.confidence
+			self.assertTrue(confidence.mean_points_per_round.contains(3.5))
+			self.assertAlmostEqual(confidence.mean_points_per_round.estimate, player.total_points / 64_000)
+			hits = sum(interval.contains(1 / 6) for interval in confidence.face_probabilities.values())
+			self.assertGreaterEqual(hits, 4)
+			self.assertFalse(confidence.most_common_distinguishable)
+		self.assertGreater(stats.winner_margin.estimate, 0)
+		loaded = simulate_dice_game(1, 30_000, seed=2, face_weights=[1, 1, 1, 1, 1, 2], confidence=True)
+		self.assertTrue(loaded.players[0].confidence.most_common_distinguishable)
+
+	def test_job_runner_isolates_failures(self) -> None:
+		lines = [
+			'{"id": "a", "players": 2, "rounds": 500, "seed": 1}',
+			"{no es json",
+			'{"players": 9, "rounds": 10}',
+			'{"players": 3, "rounds": 50, "engine": "exact"}',
+		]
+		records = list(run_jobs(_read_job_specs(lines), workers=2))
+		self.assertEqual([r["job"] for r in records], [0, 1, 2, 3])
+		self.assertEqual([r["status"] for r in records], ["ok", "error", "error", "ok"])
+		self.assertEqual(records[0]["id"], "a")
+		self.assertEqual(records[0]["result"], simulate_dice_game(2, 500, seed=1).to_dict())
+		self.assertAlmostEqual(sum(records[3]["result"]["reported_winner_probabilities"].values()), 1.0)
+		json.dumps(records)
+
+	def test_random_access_matches_sequential_run(self) -> None:
+		full = rolls_for_rounds(3, 0, 20_000, seed=99)
+		for batch_size in (1, 777, 20_000):
+			stats = simulate_dice_game(3, 20_000, batch_size=batch_size, seed=99)
+			self.assertEqual([p.total_points for p in stats.players], full.sum(axis=0).tolist())
+		rng = np.random.default_rng(0)
+		for _ in range(5):
+			start = int(rng.integers(0, 19_000))
+			stop = start + int(rng.integers(1, 1_000))
+			np.testing.assert_array_equal(rolls_for_rounds(3, start, stop, seed=99), full[start:stop])
+		weights = [1, 2, 3, 4, 5, 6]
+		weighted = rolls_for_rounds(3, 0, 5_000, seed=4, face_weights=weights)
+		np.testing.assert_array_equal(rolls_for_rounds(3, 4_321, 4_400, seed=4, face_weights=weights), weighted[4_321:4_400])
+		far = rolls_for_rounds(4, 7_000_000_000, 7_000_000_100, seed=1)
+		self.assertEqual(far.shape, (100, 4))
+
+	def test_export_roundtrip(self) -> None:
+		results = [simulate_dice_game(players, 1_000, seed=players) for players in (1, 4, 2)]
+		with tempfile.TemporaryDirectory() as tmp:
+			for fmt in EXPORT_FORMATS:
+				path = os.path.join(tmp, f"results.{fmt}")
+				for chunk_rows in (4, 2):  # Con 2 filas, el resultado de 4 jugadores no entra en el búfer.
+					self.assertEqual(write_results(iter(results), path, chunk_rows=chunk_rows), len(results))
+					loaded = load_results(path)
+					self.assertEqual([r.to_dict() for r in loaded], [r.to_dict() for r in results])
+			# Sin ``arrays`` (resultado armado a mano) se reconstruyen desde los jugadores.
+			path = os.path.join(tmp, "manual.csv")
+			manual = [GameStatistics(total_rounds=r.total_rounds, players=r.players, winner=r.winner) for r in results]
+			write_results(manual, path)
+			self.assertEqual([r.to_dict() for r in load_results(path)], [r.to_dict() for r in results])
+
+	def test_joint_histogram_derives_round_outcomes(self) -> None:
+		# 9.999 rondas usa la proyección densa del histograma; 150, la dispersa (con uno o 32 grupos).
+		for rounds, confidence in ((9_999, False), (9_999, True), (150, False), (150, True)):
+			rolls = rolls_for_rounds(4, 0, rounds, seed=11, face_weights=[1, 1, 2, 2, 3, 3])
+			stats = simulate_dice_game(
+				4, rounds, batch_size=1_000, seed=11, face_weights=[1, 1, 2, 2, 3, 3], confidence=confidence
+			)
+			self.assertEqual([p.total_points for p in stats.players], rolls.sum(axis=0).tolist())
+			self.assertEqual(stats.players[2].frequencies, {f: int((rolls[:, 2] == f).sum()) for f in range(1, 7)})
+			top = rolls == rolls.max(axis=1, keepdims=True)
+			tied = top.sum(axis=1) > 1
+			self.assertEqual(stats.tied_rounds, int(tied.sum()))
+			self.assertEqual(stats.round_wins, {idx + 1: int((top[:, idx] & ~tied).sum()) for idx in range(4)})
+
+	def test_multiple_dice_per_turn(self) -> None:
+		full = simulate_dice_game(3, 30_000, batch_size=4_096, seed=8, dice_per_turn=3)
+		threaded = simulate_dice_game_threaded(3, 30_000, threads=3, seed=8, dice_per_turn=3)
+		self.assertEqual(full.to_dict(), threaded.to_dict())
+		fast = simulate_dice_game(3, 30_000, seed=8, dice_per_turn=3, sums_only=True)
+		expected = _dice_sum_probabilities(np.full((1, 6), 1 / 6), 3)[0]
+		for stats in (full, fast):
+			for player in stats.players:
+				sums = player.turn_sum_frequencies
+				self.assertEqual(sum(sums.values()), 30_000)
+				self.assertEqual(sum(total * count for total, count in sums.items()), player.total_points)
+				observed = np.array([sums.get(3 + idx, 0) for idx in range(16)]) / 30_000
+				np.testing.assert_allclose(observed, expected, atol=0.01)
+		self.assertEqual([sum(p.frequencies.values()) for p in full.players], [90_000] * 3)
+		self.assertEqual(sum(fast.players[0].frequencies.values()), 0)
+		self.assertIsNone(fast.players[0].most_common_value)
+		self.assertIsNone(fast.players[0].deviation_from_weights())
+		# Con sums_only o demasiadas casillas conjuntas se cuentan sumas por jugador, con el mismo resumen.
+		joint, marginal = (
+			_accumulate_rounds(
+				_seed_sequence(8), 0, 5_003, 3, 700, None, _BatchGroups.empty(5_003, 3, 3, True, flag)
+			).summary()
+			for flag in (False, True)
+		)
+		for name in ("turn_sums", "frequencies", "round_wins", "tied_rounds"):
+			np.testing.assert_array_equal(getattr(joint, name), getattr(marginal, name))
+		many = simulate_dice_game(4, 2_000, seed=8, dice_per_turn=4)
+		self.assertEqual(sum(many.round_wins.values()) + many.tied_rounds, 2_000)
+		with tempfile.TemporaryDirectory() as tmp:
+			for sums_only, expected in ((False, full), (True, fast)):
+				shards = []
+				for index in range(2):
+					path = os.path.join(tmp, f"shard_{index}.npz")
+					simulate_shard(3, 30_000, index, 2, seed=8, dice_per_turn=3, sums_only=sums_only).save(path)
+					shards.append(ShardResult.load(path))
+				self.assertEqual(merge_shards(shards).to_dict(), expected.to_dict())
+		with self.assertRaises(ValueError):
+			merge_shards([shards[0], simulate_shard(3, 30_000, 1, 2, seed=8, dice_per_turn=3)])
+
+	def test_small_simulator_continues_the_stream(self) -> None:
+		simulator = SmallGameSimulator(3, seed=7, buffer_rounds=50)
+		sizes = [10, 70, 5, 200, 1]
+		results = [simulator.play(rounds) for rounds in sizes]
+		rolls = rolls_for_rounds(3, 0, sum(sizes), seed=7)
+		starts = np.cumsum([0] + sizes)
+		for result, start, stop in zip(results, starts, starts[1:]):
+			np.testing.assert_array_equal(result.totals, rolls[start:stop].sum(axis=0))
+			np.testing.assert_array_equal(result.frequencies.sum(axis=1), [stop - start] * 3)
+			self.assertEqual(result.winner, int(result.totals.argmax()) + 1)
+		reference = simulate_dice_game(3, sum(sizes), seed=7, face_weights=[1, 1, 1, 1, 1, 5])
+		loaded = SmallGameSimulator(3, seed=7, face_weights=[1, 1, 1, 1, 1, 5]).play(sum(sizes))
+		self.assertEqual(loaded.totals.tolist(), [p.total_points for p in reference.players])
+		with self.assertRaises(ValueError):
+			simulator.play(0)
+
+	def test_trajectory_is_downsampled_and_exact(self) -> None:
+		rolls = rolls_for_rounds(2, 0, 1_003, seed=4)
+		deviation = np.cumsum(rolls - 3.5, axis=0)
+		for batch_size in (1, 97, 5_000):
+			trajectory = simulate_dice_game(2, 1_003, batch_size=batch_size, seed=4, trajectory_points=10).trajectory
+			self.assertLessEqual(len(trajectory.rounds), 10)
+			self.assertEqual(trajectory.rounds[-1], 1_003)
+			np.testing.assert_array_equal(trajectory.totals, rolls.cumsum(axis=0)[trajectory.rounds - 1])
+			starts = np.concatenate(([0], trajectory.rounds[:-1]))
+			for idx, (start, stop) in enumerate(zip(starts, trajectory.rounds)):
+				np.testing.assert_allclose(trajectory.deviation_low[idx], deviation[start:stop].min(axis=0))
+				np.testing.assert_allclose(trajectory.deviation_high[idx], deviation[start:stop].max(axis=0))
+			np.testing.assert_allclose(trajectory.probabilities.sum(axis=2), 1.0)
+		self.assertIsNone(simulate_dice_game(2, 10, seed=4).trajectory)
+		with self.assertRaises(ValueError):
+			simulate_dice_game(2, 10, trajectory_points=0)
+
+	def test_score_sketches_bound_quantile_error(self) -> None:
+		games, rounds = 2_000, 150
+		totals = rolls_for_rounds(3, 0, games * rounds, seed=5).reshape(games, rounds, 3).sum(axis=1)
+		ordered = np.sort(totals, axis=1)
+		margins = ordered[:, -1] - ordered[:, -2]
+		summary = sketch_game_scores(3, rounds, games, seed=5, workers=3, batch_size=1_000, bins=32)
+		for sketch, values in ((summary.totals[1], totals[:, 1]), (summary.margins, margins)):
+			self.assertEqual((sketch.count, sketch.minimum, sketch.maximum), (games, values.min(), values.max()))
+			self.assertLess(sketch.resolution, max(1, 2 * (values.max() - values.min()) / 31))
+			for q in (0.0, 0.5, 0.99, 1.0):
+				exact = np.quantile(values, q, method="inverted_cdf")
+				self.assertLess(abs(sketch.quantile(q) - exact), sketch.resolution)
+		self.assertEqual(len(summary.totals[0].counts), 32)
+
+	def test_variance_reduction_modes_are_unbiased(self) -> None:
+		exact = exact_game_distribution(2, 12)
+		for mode in VARIANCE_REDUCTION_MODES:
+			estimate = estimate_game_outcomes(2, 12, 12_000, mode=mode, seed=5)
+			for player_id, interval in estimate.win_probabilities.items():
+				self.assertLess(abs(interval.estimate - exact.win_probabilities[player_id]), 4 * interval.std_error)
+				self.assertAlmostEqual(estimate.mean_totals[player_id].estimate, 42.0, delta=0.5)
+			if mode != "plain":
+				self.assertGreater(min(estimate.win_variance_reduction.values()), 1.2)
+				self.assertGreater(min(estimate.mean_variance_reduction.values()), 10)
+
 
 def run_tests() -> None:
 	"""Ejecuta la batería de pruebas unitarias incluida en el módulo."""
@@ -276,6 +3300,35 @@ def run_tests() -> None:
 	unittest.TextTestRunner(verbosity=2).run(suite)
 
 
+def _emit_statistics(stats: GameStatistics, args: argparse.Namespace) -> None:
+	"""Exporta el resultado a ``--output`` o lo imprime como JSON válido por stdout."""
+
+	if args.output:
+		with ResultsWriter(args.output, args.format) as writer:
+			writer.write_arrays(stats.total_rounds, *stats.arrays)
+		print(f"Resultado exportado a {args.output}")
+	else:
+		print(json.dumps(stats.to_dict()))
+
+
+def _run_jobs_cli(args: argparse.Namespace) -> None:
+	"""Procesa ``--jobs`` escribiendo un registro JSON por línea en ``--output`` o stdout."""
+
+	source = sys.stdin if args.jobs == "-" else open(args.jobs, encoding="utf-8")
+	sink = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+	try:
+		for record in run_jobs(
+			_read_job_specs(source), workers=args.job_workers, ordered=args.job_order == "input"
+		):
+			sink.write(json.dumps(record) + "\n")
+			sink.flush()
+	finally:
+		if source is not sys.stdin:
+			source.close()
+		if sink is not sys.stdout:
+			sink.close()
+
+
 def main() -> None:
 	"""Punto de entrada de línea de comandos para la versión refactorizada."""
 
@@ -287,20 +3340,234 @@ def main() -> None:
 	parser.add_argument("--run-tests", action="store_true", help="Ejecuta los tests unitarios")
 	parser.add_argument("--profile", action="store_true", help="Ejecuta cProfile sobre la simulación")
 	parser.add_argument("--timeit", action="store_true", help="Ejecuta mediciones con timeit")
+	parser.add_argument("--threads", type=int, default=1, help="Hilos para el motor paralelo (1 = secuencial)")
+	parser.add_argument(
+		"--bench-threads",
+		type=int,
+		default=None,
+		metavar="N",
+		help="Compara la latencia con 1..N hilos contra el motor secuencial",
+	)
+	parser.add_argument(
+		"--bench-latency",
+		type=int,
+		default=None,
+		metavar="LLAMADAS",
+		help="Percentiles de latencia por llamada de SmallGameSimulator contra simulate_dice_game con --rounds rondas",
+	)
+	parser.add_argument(
+		"--shard",
+		default=None,
+		metavar="i/N",
+		help="Simula sólo el fragmento i (desde 0) de N y guarda el parcial (requiere --seed)",
+	)
+	parser.add_argument(
+		"--partial-output",
+		default=None,
+		help="Ruta del parcial generado con --shard (por defecto shard_<i>_of_<N>.npz)",
+	)
+	parser.add_argument(
+		"--merge",
+		nargs="+",
+		default=None,
+		metavar="PARCIAL",
+		help="Fusiona archivos parciales de --shard en el resultado final",
+	)
+	parser.add_argument(
+		"--face-weights",
+		action="append",
+		default=None,
+		metavar="w1,...,w6",
+		help="Pesos de un dado cargado; una vez para todos o una vez por jugador",
+	)
+	parser.add_argument(
+		"--jobs",
+		default=None,
+		metavar="ARCHIVO",
+		help="Ejecuta las especificaciones JSON Lines del archivo ('-' para stdin) en un pool compartido",
+	)
+	parser.add_argument("--job-workers", type=int, default=None, help="Hilos del pool de --jobs")
+	parser.add_argument(
+		"--job-order",
+		choices=("input", "completion"),
+		default="input",
+		help="Orden de salida de --jobs",
+	)
+	parser.add_argument(
+		"--audit-rounds",
+		default=None,
+		metavar="INICIO:FIN",
+		help="Imprime las tiradas exactas de esas rondas (requiere --seed) sin re-simular las anteriores",
+	)
+	parser.add_argument("--dice-per-turn", type=int, default=1, help="Dados por jugador en cada ronda (p. ej. 3 para 3d6)")
+	parser.add_argument(
+		"--sums-only",
+		action="store_true",
+		help="Con --dice-per-turn > 1, muestrea sólo la suma de cada turno (sin frecuencias por cara)",
+	)
+	parser.add_argument(
+		"--sketch-games",
+		type=int,
+		default=None,
+		metavar="N",
+		help="Juega N partidas de --rounds rondas e informa p50/p99/máximo de totales y márgenes",
+	)
+	parser.add_argument(
+		"--estimate-games",
+		type=int,
+		default=None,
+		metavar="N",
+		help="Estima probabilidad de victoria y puntaje medio con N partidas de --rounds rondas",
+	)
+	parser.add_argument(
+		"--variance-reduction",
+		choices=VARIANCE_REDUCTION_MODES,
+		default="plain",
+		help="Modo de muestreo de --estimate-games",
+	)
+	parser.add_argument("--output", default=None, help="Archivo donde exportar el resultado final")
+	parser.add_argument(
+		"--format",
+		choices=EXPORT_FORMATS,
+		default=None,
+		help="Formato de --output (por defecto se infiere de la extensión)",
+	)
 	args = parser.parse_args()
+	face_weights = None
+	if args.face_weights:
+		try:
+			face_weights = [[float(value) for value in spec.split(",")] for spec in args.face_weights]
+		except ValueError:
+			parser.error("--face-weights espera 6 números separados por comas")
+		if len(face_weights) == 1:
+			face_weights = face_weights[0]
 
 	if args.run_tests:
 		run_tests()
 		return
 
+	if args.jobs:
+		_run_jobs_cli(args)
+		return
+
+	if args.audit_rounds is not None:
+		if args.seed is None:
+			parser.error("--audit-rounds requiere --seed")
+		if args.dice_per_turn != 1:
+			parser.error("--audit-rounds sólo reproduce corridas de un dado por turno")
+		try:
+			start_text, stop_text = args.audit_rounds.split(":")
+			start_round, stop_round = int(start_text), int(stop_text)
+			rolls = rolls_for_rounds(
+				args.players, start_round, stop_round, seed=args.seed, face_weights=face_weights
+			)
+		except ValueError as exc:
+			parser.error(f"--audit-rounds inválido: {exc}")
+		for offset, row in enumerate(rolls.tolist()):
+			print(json.dumps({"round": start_round + offset, "rolls": row}))
+		return
+
+	if args.bench_latency is not None:
+		print(json.dumps(benchmark_latency(args.players, args.rounds, calls=args.bench_latency, seed=args.seed)))
+		return
+
+	if args.sketch_games is not None:
+		summary = sketch_game_scores(
+			args.players,
+			args.rounds,
+			args.sketch_games,
+			batch_size=args.batch,
+			seed=args.seed,
+			face_weights=face_weights,
+			workers=args.threads,
+		)
+		print(json.dumps(summary.report()))
+		return
+
+	if args.estimate_games is not None:
+		estimate = estimate_game_outcomes(
+			args.players,
+			args.rounds,
+			args.estimate_games,
+			mode=args.variance_reduction,
+			batch_size=args.batch,
+			seed=args.seed,
+		)
+		for player_id, interval in estimate.win_probabilities.items():
+			print(
+				f"Jugador {player_id}: P(victoria) = {interval.estimate:.5f} ± {interval.std_error:.5f} "
+				f"(reducción x{estimate.win_variance_reduction[player_id]:.2f}), "
+				f"puntaje medio = {estimate.mean_totals[player_id].estimate:.3f} "
+				f"(reducción x{estimate.mean_variance_reduction[player_id]:.2f})"
+			)
+		return
+
+	if args.merge:
+		try:
+			merged = merge_shards([ShardResult.load(path) for path in args.merge])
+		except ValueError as exc:
+			parser.error(f"--merge inválido: {exc}")
+		_emit_statistics(merged, args)
+		return
+
+	if args.shard is not None:
+		if args.seed is None:
+			parser.error("--shard requiere --seed para que todos los nodos compartan el flujo")
+		try:
+			shard_index, shard_count = parse_shard(args.shard)
+		except ValueError as exc:
+			parser.error(str(exc))
+		shard = simulate_shard(
+			args.players,
+			args.rounds,
+			shard_index,
+			shard_count,
+			seed=args.seed,
+			batch_size=args.batch,
+			threads=args.threads,
+			face_weights=face_weights,
+			dice_per_turn=args.dice_per_turn,
+			sums_only=args.sums_only,
+		)
+		path = args.partial_output or f"shard_{shard_index}_of_{shard_count}.npz"
+		shard.save(path)
+		print(f"Shard {shard_index}/{shard_count}: rondas [{shard.start_round}, {shard.stop_round}) -> {path}")
+		return
+
 	if args.profile:
 		print(profile_with_cprofile(args.players, args.rounds, batch_size=args.batch))
 
 	if args.timeit:
 		print(benchmark_simulator(args.players, args.rounds, batch_size=args.batch))
 
-	stats = simulate_dice_game(args.players, args.rounds, batch_size=args.batch, seed=args.seed)
-	print(stats.to_dict())
+	if args.bench_threads is not None:
+		for row in benchmark_threads(
+			args.players, args.rounds, max_threads=args.bench_threads, batch_size=args.batch
+		):
+			print(f"{row['threads']:>3} hilos: {row['seconds']:.4f} s (x{row['speedup']:.2f})")
+
+	if args.threads > 1:
+		stats = simulate_dice_game_threaded(
+			args.players,
+			args.rounds,
+			threads=args.threads,
+			batch_size=args.batch,
+			seed=args.seed,
+			face_weights=face_weights,
+			dice_per_turn=args.dice_per_turn,
+			sums_only=args.sums_only,
+		)
+	else:
+		stats = simulate_dice_game(
+			args.players,
+			args.rounds,
+			batch_size=args.batch,
+			seed=args.seed,
+			face_weights=face_weights,
+			dice_per_turn=args.dice_per_turn,
+			sums_only=args.sums_only,
+		)
+	_emit_statistics(stats, args)
 
 
 if __name__ == "__main__":
@@ -4,11 +4,24 @@ from __future__ import annotations
 
 import random
 import time
-from typing import Callable, Iterable, List, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 
 import streamlit as st
 
-from CodigoRefactorizado import GameStatistics, PlayerStats, simulate_dice_game
+from CodigoRefactorizado import (
+	GameStatistics,
+	PlayerStats,
+	measure_throughput,
+	profile_with_cprofile,
+	rolls_for_rounds,
+	simulate_dice_game,
+)
+
+
+LAB_BATCH_SIZES = [1_000, 10_000, 50_000, 100_000, 250_000, 500_000, 1_000_000]
+GAME_PLAYERS = 4
+HISTORY_LIMIT = 200
 
 
 ASCII_DICE = {
@@ -67,6 +80,7 @@ def _ensure_state() -> None:
 	st.session_state.setdefault("last_faces", [1, 1, 1, 1])
 	st.session_state.setdefault("finished", False)
 	st.session_state.setdefault("winner_info", None)
+	st.session_state.setdefault("game_seed", random.getrandbits(32))
 
 
 def _safe_rerun() -> None:
@@ -97,8 +111,13 @@ def _animate_roll(placeholders: Iterable[st.delta_generator.DeltaGenerator], fin
 		placeholder.markdown(_dice_art(final_faces[idx]))
 
 
-def _reset_game() -> None:
-	"""Restablece los contadores y últimas caras mostradas."""
+def _reset_game(seed: Optional[int] = None) -> None:
+	"""Restablece los contadores y últimas caras mostradas.
+
+	Args:
+		seed: Semilla de la nueva partida; ``None`` sortea una nueva. Repetir una
+			semilla reproduce exactamente la misma secuencia de rondas.
+	"""
 
 	st.session_state["scores"] = [0, 0, 0, 0]
 	st.session_state["round"] = 0
@@ -106,6 +125,36 @@ def _reset_game() -> None:
 	st.session_state["last_faces"] = [1, 1, 1, 1]
 	st.session_state["finished"] = False
 	st.session_state["winner_info"] = None
+	st.session_state["game_seed"] = random.getrandbits(32) if seed is None else seed
+
+
+def _play_rounds(count: int) -> List[int]:
+	"""Juega ``count`` rondas de la partida y actualiza el estado en bloque.
+
+	Refactorización: Replace Algorithm. Las caras salen de ``rolls_for_rounds`` con la
+	semilla de la partida: la ronda ``r`` es siempre la misma palabra del flujo, así que
+	jugar de a una o avanzar 10.000 de golpe produce la misma partida y una semilla
+	basta para repetirla. El historial conserva sólo las últimas ``HISTORY_LIMIT`` rondas.
+
+	Returns:
+		Las caras de la última ronda jugada, por jugador.
+	"""
+
+	start = st.session_state["round"]
+	rolls = rolls_for_rounds(GAME_PLAYERS, start, start + count, seed=st.session_state["game_seed"])
+	st.session_state["scores"] = [
+		score + int(points) for score, points in zip(st.session_state["scores"], rolls.sum(axis=0))
+	]
+	st.session_state["round"] = start + count
+	recientes = rolls[-HISTORY_LIMIT:]
+	primera = start + count - len(recientes) + 1
+	st.session_state["history"].extend(
+		{"Ronda": primera + offset, **{f"J{idx + 1}": int(face) for idx, face in enumerate(fila)}}
+		for offset, fila in enumerate(recientes)
+	)
+	del st.session_state["history"][:-HISTORY_LIMIT]
+	st.session_state["last_faces"] = [int(face) for face in rolls[-1]]
+	return st.session_state["last_faces"]
 
 
 def _render_scoreboard() -> None:
@@ -127,6 +176,8 @@ def _render_history() -> None:
 		return
 
 	st.subheader("Historial de rondas")
+	if st.session_state["round"] > len(st.session_state["history"]):
+		st.caption(f"Se muestran las últimas {len(st.session_state['history'])} de {st.session_state['round']:,} rondas.")
 	st.dataframe(st.session_state["history"], width="stretch")
 
 
@@ -145,17 +196,29 @@ def _render_game_view() -> None:
 
 	# FIX: Para evitar que el contador de ronda quede "una por detrás" mostramos el botón primero,
 	# procesamos la acción y luego pintamos el encabezado con el valor actualizado.
-	lanzar = st.button("Lanzar dados 🎲", disabled=st.session_state.get("finished", False))
-	if lanzar and not st.session_state.get("finished", False):
-		final_faces = [random.randint(1, 6) for _ in range(4)]
-		_animate_roll(placeholders, final_faces)
-		st.session_state["last_faces"] = final_faces
-		st.session_state["round"] += 1
-		for idx, face in enumerate(final_faces):
-			st.session_state["scores"][idx] += face
-		st.session_state["history"].append(
-			{"Ronda": st.session_state["round"], **{f"J{idx + 1}": face for idx, face in enumerate(final_faces)}}
+	finished = st.session_state.get("finished", False)
+	lanzar = st.button("Lanzar dados 🎲", disabled=finished)
+	col_rondas, col_avanzar = st.columns([2, 1], vertical_alignment="bottom")
+	rondas_bloque = col_rondas.number_input(
+		"Rondas a avanzar", min_value=1, max_value=1_000_000, value=10_000, step=1_000, disabled=finished,
+		help="Juega estas rondas de una vez con el motor vectorizado, sin animación.",
+	)
+	avanzar = col_avanzar.button("Avance rápido ⏩", disabled=finished)
+	if avanzar and not finished:
+		antes = list(st.session_state["scores"])
+		final_faces = _play_rounds(int(rondas_bloque))
+		for idx, placeholder in enumerate(placeholders):
+			placeholder.markdown(_dice_art(final_faces[idx]))
+		st.success(
+			f"Se jugaron {int(rondas_bloque):,} rondas. "
+			+ " | ".join(
+				f"Jugador {idx + 1}: +{score - antes[idx]:,} (total {score:,})"
+				for idx, score in enumerate(st.session_state["scores"])
+			)
 		)
+	elif lanzar and not finished:
+		final_faces = _play_rounds(1)
+		_animate_roll(placeholders, final_faces)
 		st.success(
 			" | ".join(
 				[
@@ -177,6 +240,7 @@ def _render_game_view() -> None:
 			if st.button("Reiniciar partida", type="secondary"):
 				_reset_game()
 				_safe_rerun()
+			st.caption(f"Semilla de la partida: {st.session_state['game_seed']}")
 		with c2:
 			if st.button("Finalizar juego", disabled=st.session_state.get("finished", False)):
 				# Determinar ganador y marcar estado finalizado
@@ -199,22 +263,32 @@ def _render_game_view() -> None:
 				+ f" (todos con {info['puntaje']} puntos)."
 			)
 
+	with st.expander("Repetir una partida"):
+		semilla = st.number_input("Semilla", min_value=0, max_value=2**32 - 1, value=st.session_state["game_seed"], step=1)
+		if st.button("Reiniciar con esta semilla"):
+			_reset_game(int(semilla))
+			_safe_rerun()
+
 	_render_scoreboard()
 	_render_history()
 
 
-def _formatear_probabilidades(jugador: PlayerStats) -> list[dict[str, float]]:
+def _formatear_probabilidades(jugador: PlayerStats) -> list[dict[str, object]]:
 	"""Transforma las probabilidades en una estructura tabular para Streamlit."""
 
 	distribucion = jugador.probability_distribution()
-	return [
-		{
+	filas = []
+	for face in range(1, 7):
+		fila: dict[str, object] = {
 			"cara": face,
 			"frecuencia": jugador.frequencies.get(face, 0),
 			"probabilidad": round(distribucion.get(face, 0.0), 5),
 		}
-		for face in range(1, 7)
-	]
+		if jugador.confidence is not None:
+			intervalo = jugador.confidence.face_probabilities[face]
+			fila["IC 95%"] = f"[{intervalo.low:.5f}, {intervalo.high:.5f}]"
+		filas.append(fila)
+	return filas
 
 
 def _mostrar_resultados(stats: GameStatistics) -> None:
@@ -227,12 +301,51 @@ def _mostrar_resultados(stats: GameStatistics) -> None:
 		f"Jugador {stats.winner.player_id}",
 		help=f"Total acumulado: {stats.winner.total_points}",
 	)
+	if stats.winner_margin is not None:
+		margen = stats.winner_margin
+		st.caption(
+			f"Margen sobre el segundo: {margen.estimate:,.0f} puntos "
+			f"(IC 95%: {margen.low:,.0f} a {margen.high:,.0f})."
+		)
+		if margen.low <= 0:
+			st.info("El margen del ganador no es estadísticamente distinto de cero: la victoria puede ser ruido.")
+	if stats.round_wins is not None:
+		ganadas = ", ".join(f"J{jugador}: {rondas:,}" for jugador, rondas in stats.round_wins.items())
+		st.caption(f"Rondas ganadas sin empate: {ganadas}. Rondas empatadas: {stats.tied_rounds:,}.")
+
+	trayectoria = stats.trajectory
+	if trayectoria is not None:
+		st.subheader("Desvío acumulado respecto de lo esperado")
+		desvios = [
+			{"ronda": int(ronda), "serie": f"J{jugador.player_id} {nombre}", "puntos": float(valores[idx, pos])}
+			for idx, ronda in enumerate(trayectoria.rounds)
+			for pos, jugador in enumerate(stats.players)
+			for nombre, valores in (("mín", trayectoria.deviation_low), ("máx", trayectoria.deviation_high))
+		]
+		st.line_chart(desvios, x="ronda", y="puntos", color="serie")
+		st.caption(
+			f"{len(trayectoria.rounds)} puntos; cada uno muestra el mínimo y el máximo del tramo de rondas que resume."
+		)
 
-	for jugador in stats.players:
+	for pos, jugador in enumerate(stats.players):
 		with st.expander(f"Jugador {jugador.player_id}"):
 			st.write(f"Puntos totales: {jugador.total_points}")
-			st.write(f"Valor más frecuente: {jugador.most_common_value}")
+			if jugador.most_common_value is not None:
+				st.write(f"Valor más frecuente: {jugador.most_common_value}")
+			if jugador.confidence is not None:
+				media = jugador.confidence.mean_points_per_round
+				st.write(f"Puntos por ronda: {media.estimate:.4f} ± {media.high - media.estimate:.4f} (IC 95%)")
+				if not jugador.confidence.most_common_distinguishable:
+					st.caption("El valor más frecuente no se distingue estadísticamente de la segunda cara.")
 			st.table(_formatear_probabilidades(jugador))
+			if trayectoria is not None:
+				primer_valor = stats.dice_per_turn
+				convergencia = [
+					{"ronda": int(ronda), "resultado": str(primer_valor + valor), "probabilidad": float(probabilidad)}
+					for idx, ronda in enumerate(trayectoria.rounds)
+					for valor, probabilidad in enumerate(trayectoria.probabilities[idx, pos])
+				]
+				st.line_chart(convergencia, x="ronda", y="probabilidad", color="resultado")
 
 
 def _render_simulator_view() -> None:
@@ -301,15 +414,139 @@ def _render_simulator_view() -> None:
 			int(num_rounds),
 			batch_size=int(batch_size),
 			seed=seed,
+			trajectory_points=200,
+			confidence=True,
 		)
 		_mostrar_resultados(stats)
 		st.success("Simulación completada. Explora las estadísticas en los desplegables.")
 
 	st.info(
-		"Para perfiles detallados, ejecuta los scripts de consola descritos en `readme.md`."
+		"Para medir el rendimiento en este servidor usa el **Laboratorio de rendimiento** del panel lateral."
 	)
 
 
+@st.cache_resource
+def _lab_executor() -> ThreadPoolExecutor:
+	"""Pool de un único hilo compartido por todas las sesiones para no solapar mediciones."""
+
+	return ThreadPoolExecutor(max_workers=1, thread_name_prefix="laboratorio")
+
+
+@st.cache_resource
+def _lab_jobs() -> Dict[Tuple[object, ...], Future]:
+	"""Caché de mediciones (en curso o terminadas) indexada por sus parámetros."""
+
+	return {}
+
+
+def _run_performance_lab(
+	num_rounds: int,
+	players: Tuple[int, ...],
+	batch_sizes: Tuple[int, ...],
+	repeat: int,
+	with_profile: bool,
+) -> Dict[str, object]:
+	"""Barre jugadores × tamaños de lote y, opcionalmente, perfila la mejor configuración."""
+
+	rows = [
+		measure_throughput(num_players, num_rounds, batch_size=batch_size, repeat=repeat)
+		for num_players in players
+		for batch_size in batch_sizes
+	]
+	best = max(
+		(row for row in rows if row["num_players"] == max(players)),
+		key=lambda row: row["rounds_per_second"],
+	)
+	profile_report = None
+	if with_profile:
+		profile_report = profile_with_cprofile(
+			int(best["num_players"]), num_rounds, batch_size=int(best["batch_size"])
+		)
+	return {"rows": rows, "profile": profile_report}
+
+
+def _mostrar_laboratorio(resultado: Dict[str, object]) -> None:
+	"""Grafica rendimiento y memoria por tamaño de lote y recomienda el mejor lote medido."""
+
+	rows = resultado["rows"]
+	tabla = [
+		{
+			"jugadores": f"{int(row['num_players'])} jugador(es)",
+			"batch_size": int(row["batch_size"]),
+			"rondas/s": round(row["rounds_per_second"]),
+			"memoria pico (MB)": round(row["peak_memory_mb"], 3),
+			"segundos": round(row["seconds"], 5),
+		}
+		for row in rows
+	]
+
+	st.subheader("Rendimiento según tamaño de lote")
+	st.line_chart(tabla, x="batch_size", y="rondas/s", color="jugadores")
+	st.subheader("Memoria pico según tamaño de lote")
+	st.line_chart(tabla, x="batch_size", y="memoria pico (MB)", color="jugadores")
+	st.dataframe(tabla, width="stretch")
+
+	for num_players in sorted({int(row["num_players"]) for row in rows}):
+		mejor = max(
+			(row for row in rows if row["num_players"] == num_players),
+			key=lambda row: row["rounds_per_second"],
+		)
+		st.caption(
+			f"{num_players} jugador(es): lote medido más rápido = {int(mejor['batch_size']):,} "
+			f"({mejor['rounds_per_second']:,.0f} rondas/s, {mejor['peak_memory_mb']:.2f} MB)."
+		)
+
+	if resultado["profile"]:
+		with st.expander("Reporte de cProfile (mejor configuración)"):
+			st.code(resultado["profile"])
+
+
+def _render_performance_view() -> None:
+	"""Vista que mide ``batch_size`` y jugadores sobre el propio servidor, en segundo plano."""
+
+	st.title("Laboratorio de rendimiento")
+	st.markdown(
+		"""
+		Mide el simulador en este servidor para elegir el tamaño de lote a partir de datos reales.
+		Las mediciones corren en segundo plano y quedan en caché para los mismos parámetros.
+		"""
+	)
+
+	num_rounds = st.number_input(
+		"Rondas por medición", min_value=10_000, max_value=5_000_000, value=1_000_000, step=50_000
+	)
+	players = st.multiselect("Jugadores", options=[1, 2, 3, 4], default=[4])
+	batch_sizes = st.multiselect("Tamaños de lote", options=LAB_BATCH_SIZES, default=LAB_BATCH_SIZES[:5])
+	repeat = st.slider("Repeticiones de timeit", min_value=1, max_value=5, value=3)
+	with_profile = st.checkbox("Incluir cProfile de la mejor configuración", value=True)
+
+	if not players or not batch_sizes:
+		st.warning("Selecciona al menos un número de jugadores y un tamaño de lote.")
+		return
+
+	key = (int(num_rounds), tuple(sorted(players)), tuple(sorted(batch_sizes)), int(repeat), with_profile)
+	jobs = _lab_jobs()
+	if st.button("Medir en segundo plano") and key not in jobs:
+		jobs[key] = _lab_executor().submit(_run_performance_lab, *key)
+
+	job = jobs.get(key)
+	if job is None:
+		st.caption("Sin mediciones en caché para estos parámetros.")
+		return
+	if not job.done():
+		st.info("Midiendo en segundo plano… la página puede seguir usándose.")
+		if st.button("Actualizar estado"):
+			_safe_rerun()
+		return
+	if job.exception() is not None:
+		st.error(f"La medición falló: {job.exception()}")
+		if st.button("Descartar y reintentar"):
+			jobs.pop(key, None)
+			_safe_rerun()
+		return
+	_mostrar_laboratorio(job.result())
+
+
 def main() -> None:
 	"""Punto de entrada de Streamlit que alterna entre juego y simulador."""
 
@@ -319,6 +556,8 @@ def main() -> None:
 
 	if st.sidebar.button("Ir al simulador masivo"):
 		st.session_state["vista"] = "simulacion"
+	if st.sidebar.button("Laboratorio de rendimiento"):
+		st.session_state["vista"] = "rendimiento"
 	if st.sidebar.button("Volver al juego multijugador"):
 		st.session_state["vista"] = "juego"
 
@@ -328,6 +567,8 @@ def main() -> None:
 
 	if st.session_state["vista"] == "simulacion":
 		_render_simulator_view()
+	elif st.session_state["vista"] == "rendimiento":
+		_render_performance_view()
 	else:
 		_render_game_view()
 
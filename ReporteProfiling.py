@@ -0,0 +1,621 @@
+"""Generador de reportes comparativos de rendimiento (sin refactorizar vs refactorizado).
+
+Reemplaza el armado manual de ``Profiling.txt`` y de las tablas de ``readme.md``:
+ejecuta (o carga desde archivos ``.lprof``) ``line_profiler``, ``cProfile`` y
+``timeit`` sobre ``simular_juego_sin_refactor`` y ``simulate_dice_game``, calcula
+diferencias y *speedups* con su variabilidad y produce un reporte Markdown o HTML.
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import cProfile
+import html
+import math
+import os
+import pstats
+import statistics
+import subprocess
+import tempfile
+import timeit
+import unittest
+from types import SimpleNamespace
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Sequence, Tuple
+
+import CodigoRefactorizado
+import CodigoSinRefactorizar
+
+try:  # pragma: no cover - line_profiler es opcional para el reporte
+	import line_profiler
+except ImportError:  # pragma: no cover
+	line_profiler = None  # type: ignore[assignment]
+
+
+LEGACY_LINE_FUNCTIONS = ("simular_juego_sin_refactor",)
+REFACTORED_LINE_FUNCTIONS = ("simulate_dice_game", "_accumulate_rounds")
+
+
+@dataclass
+class TimingSummary:
+	"""Resumen de varias mediciones de una misma ejecución."""
+
+	samples: List[float]
+
+	@property
+	def mean(self) -> float:
+		return statistics.fmean(self.samples)
+
+	@property
+	def stdev(self) -> float:
+		return statistics.stdev(self.samples) if len(self.samples) > 1 else 0.0
+
+
+@dataclass
+class Speedup:
+	"""Cociente de tiempos medios con su error estándar propagado (primer orden)."""
+
+	value: float
+	std_error: float
+
+
+def speedup(slow: TimingSummary, fast: TimingSummary, *, slow_scale: float = 1.0, fast_scale: float = 1.0) -> Speedup:
+	"""Calcula ``(slow / slow_scale) / (fast / fast_scale)`` y su incertidumbre.
+
+	Los factores de escala permiten comparar corridas con distinta cantidad de rondas
+	(tiempo por ronda). El error estándar combina los coeficientes de variación de
+	ambas series: ``s * sqrt(cv_slow² / n_slow + cv_fast² / n_fast)``.
+	"""
+
+	value = (slow.mean / slow_scale) / (fast.mean / fast_scale)
+	relative = math.sqrt(
+		(slow.stdev / slow.mean) ** 2 / len(slow.samples) + (fast.stdev / fast.mean) ** 2 / len(fast.samples)
+	)
+	return Speedup(value=value, std_error=value * relative)
+
+
+@dataclass
+class LineRecord:
+	"""Tiempos por línea de una función perfilada con ``line_profiler``."""
+
+	function: str
+	filename: str
+	lines: List[Tuple[int, int, float, str]]  # (línea, hits, segundos, código)
+
+	@property
+	def total(self) -> float:
+		return sum(seconds for _, _, seconds, _ in self.lines)
+
+
+@dataclass
+class ReportSection:
+	"""Sección del reporte: párrafos y tablas (en orden) independientes del formato de salida."""
+
+	title: str
+	blocks: List[str | Tuple[List[str], List[List[str]]]] = field(default_factory=list)
+
+	def add_paragraph(self, text: str) -> None:
+		self.blocks.append(text)
+
+	def add_table(self, headers: List[str], rows: List[List[str]]) -> None:
+		self.blocks.append((headers, rows))
+
+
+def _source_lines(filename: str, source: str | None = None) -> List[str]:
+	"""Líneas del archivo perfilado ``filename``, tal como estaban al generar el perfil.
+
+	Args:
+		filename: Ruta registrada en el perfil (puede venir de otro sistema operativo).
+		source: ``None`` para el archivo actual, la ruta de una copia guardada del
+			archivo o una revisión de git de la que leerlo (``git show REV:archivo``).
+
+	Raises:
+		ValueError: Si no se encuentra el archivo o la revisión.
+	"""
+
+	local = filename.replace("\\", os.sep).replace("/", os.sep)
+	local = local if os.path.exists(local) else os.path.basename(local)
+	if source is not None and not os.path.isfile(source):
+		result = subprocess.run(
+			["git", "show", f"{source}:./{os.path.basename(local)}"],
+			cwd=os.path.dirname(os.path.abspath(local)),
+			capture_output=True,
+			text=True,
+		)
+		if result.returncode != 0:
+			raise ValueError(f"No se pudo leer {os.path.basename(local)} en la revisión {source!r}: {result.stderr.strip()}")
+		return result.stdout.splitlines()
+	path = source if source is not None else local
+	if not os.path.exists(path):
+		raise ValueError(f"No se encuentra el código fuente {path!r} del perfil")
+	with open(path, encoding="utf-8") as handle:
+		return handle.read().splitlines()
+
+
+def _check_function_span(source: List[str], first_lineno: int, function: str, linenos: List[int]) -> None:
+	"""Verifica que ``source`` sea el código con el que se midió ``function``.
+
+	``line_profiler`` guarda números de línea pero no el texto: si la función ya no
+	empieza en ``first_lineno`` (su ``def`` o su primer decorador) o las líneas medidas
+	caen fuera de su cuerpo, el perfil es de otra versión del archivo.
+
+	Raises:
+		ValueError: Si el perfil no corresponde a ``source``.
+	"""
+
+	for node in ast.walk(ast.parse("\n".join(source))):
+		if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.name == function:
+			starts = {node.lineno} | {decorator.lineno for decorator in node.decorator_list}
+			if first_lineno in starts and all(first_lineno <= lineno <= node.end_lineno for lineno in linenos):
+				return
+	raise ValueError(
+		f"El perfil de {function!r} (línea {first_lineno}) no corresponde al código fuente disponible; "
+		"indica la revisión o copia con la que se generó (--baseline-source) o vuelve a perfilar"
+	)
+
+
+def _line_records_from_stats(stats: object, source: str | None = None) -> List[LineRecord]:
+	"""Convierte un ``LineStats`` (cargado o recién medido) en ``LineRecord``.
+
+	Raises:
+		ValueError: Si el código fuente no corresponde al perfil (ver ``_check_function_span``).
+	"""
+
+	records = []
+	for (filename, first_lineno, function), timings in stats.timings.items():  # type: ignore[attr-defined]
+		code = _source_lines(filename, source)
+		_check_function_span(code, first_lineno, function, [lineno for lineno, _, _ in timings])
+		lines = [(lineno, hits, time * stats.unit, code[lineno - 1].strip()) for lineno, hits, time in timings]  # type: ignore[attr-defined]
+		records.append(LineRecord(function=function, filename=filename, lines=lines))
+	return records
+
+
+def load_line_profile(path: str, source: str | None = None) -> List[LineRecord]:
+	"""Lee un archivo ``.lprof`` generado por ``kernprof -l``.
+
+	El ``.lprof`` no guarda el código: el texto de cada línea se lee de ``source``
+	(copia guardada o revisión de git, ver ``_source_lines``) o del archivo actual.
+
+	Raises:
+		RuntimeError: Si ``line_profiler`` no está instalado.
+		ValueError: Si el código fuente ya no corresponde al perfil.
+	"""
+
+	if line_profiler is None:
+		raise RuntimeError("Instala line_profiler para leer archivos .lprof")
+	return _line_records_from_stats(line_profiler.load_stats(path), source)
+
+
+def run_line_profile(call: Callable[[], object], functions: Sequence[Callable[..., object]]) -> List[LineRecord]:
+	"""Ejecuta ``call`` con ``line_profiler`` activo sobre ``functions``."""
+
+	if line_profiler is None:
+		raise RuntimeError("Instala line_profiler para perfilar por línea")
+	profiler = line_profiler.LineProfiler(*functions)
+	profiler.runcall(call)
+	return _line_records_from_stats(profiler.get_stats())
+
+
+def run_cprofile(call: Callable[[], object], repeat: int) -> Dict[str, TimingSummary]:
+	"""Tiempo acumulado por función (``archivo:línea(nombre)``) sobre ``repeat`` corridas."""
+
+	samples: Dict[str, List[float]] = {}
+	for _ in range(repeat):
+		profiler = cProfile.Profile()
+		profiler.runcall(call)
+		for (filename, lineno, name), (_, _, _, cumtime, _) in pstats.Stats(profiler).stats.items():  # type: ignore[attr-defined]
+			key = f"{os.path.basename(filename)}:{lineno}({name})" if lineno else name
+			samples.setdefault(key, []).append(cumtime)
+	return {
+		key: TimingSummary(values + [0.0] * (repeat - len(values)))
+		for key, values in samples.items()
+	}
+
+
+def run_timeit(call: Callable[[], object], repeat: int) -> TimingSummary:
+	"""Mediciones independientes con ``timeit`` (una ejecución por repetición)."""
+
+	return TimingSummary(timeit.Timer(call).repeat(repeat=repeat, number=1))
+
+
+def _keyed_lines(record: LineRecord) -> Dict[Tuple[str, int], Tuple[int, float]]:
+	"""``(código, aparición) -> (hits, segundos)`` para emparejar líneas entre versiones."""
+
+	seen: Dict[str, int] = {}
+	result = {}
+	for _, hits, seconds, text in record.lines:
+		occurrence = seen.get(text, 0)
+		seen[text] = occurrence + 1
+		result[(text, occurrence)] = (hits, seconds)
+	return result
+
+
+def hit_mismatches(baseline: LineRecord, current: LineRecord) -> int:
+	"""Cantidad de líneas emparejadas cuya cantidad de hits difiere (cargas de trabajo distintas)."""
+
+	before, after = _keyed_lines(baseline), _keyed_lines(current)
+	return sum(1 for key in before if key in after and before[key][0] != after[key][0])
+
+
+def line_deltas(baseline: LineRecord, current: LineRecord) -> List[List[str]]:
+	"""Compara línea a línea dos perfiles de la misma función, en tiempo por hit.
+
+	Las líneas se emparejan por su texto (y orden de aparición), así que soportan
+	corrimientos de numeración; las que sólo existen en un lado se listan con "—".
+	Los perfiles pueden venir de corridas con distintas rondas, así que se compara el
+	tiempo por hit y no el total; si los hits difieren la fila se marca con ⚠.
+	"""
+
+	def per_hit(entry: Tuple[int, float] | None) -> float | None:
+		return None if entry is None or entry[0] == 0 else entry[1] / entry[0] * 1e6
+
+	before, after = _keyed_lines(baseline), _keyed_lines(current)
+	rows = []
+	for key in list(before) + [key for key in after if key not in before]:
+		old, new = before.get(key), after.get(key)
+		old_hit, new_hit = per_hit(old), per_hit(new)
+		hits = f"{'—' if old is None else old[0]} → {'—' if new is None else new[0]}"
+		if old is not None and new is not None and old[0] != new[0]:
+			hits += " ⚠"
+		old_time = "—" if old_hit is None else f"{old_hit:.3f}"
+		new_time = "—" if new_hit is None else f"{new_hit:.3f}"
+		delta = "—" if old_hit is None or new_hit is None else f"{new_hit - old_hit:+.3f}"
+		ratio = "—" if old_hit is None or not new_hit else f"×{old_hit / new_hit:.2f}"
+		rows.append([f"`{key[0] or '(sin código)'}`", hits, old_time, new_time, delta, ratio])
+	return rows
+
+
+def _line_table(record: LineRecord) -> Tuple[List[str], List[List[str]]]:
+	total = record.total or 1.0
+	rows = [
+		[
+			str(lineno),
+			str(hits),
+			f"{seconds:.6f}",
+			f"{seconds / hits * 1e6:.2f}" if hits else "—",
+			f"{seconds / total * 100:.1f}",
+			f"`{text}`" if text else "",
+		]
+		for lineno, hits, seconds, text in record.lines
+		if hits
+	]
+	return ["Línea", "Hits", "Tiempo (s)", "Por hit (µs)", "% Tiempo", "Código"], rows
+
+
+def build_report(
+	num_players: int = 4,
+	*,
+	legacy_rounds: int = 25,
+	rounds: int = 1_000_000,
+	batch_size: int = 100_000,
+	repeat: int = 3,
+	legacy_lprof: str | None = None,
+	refactored_lprof: str | None = None,
+	baseline_lprof: str | None = None,
+	baseline_source: str | None = None,
+	top: int = 10,
+) -> List[ReportSection]:
+	"""Mide ambas implementaciones y arma las secciones del reporte.
+
+	Args:
+		num_players: Jugadores de ambas simulaciones.
+		legacy_rounds: Rondas para la versión sin refactorizar (10 ms por tirada).
+		rounds: Rondas para la versión refactorizada.
+		batch_size: Tamaño de lote de la versión refactorizada.
+		repeat: Repeticiones de ``timeit`` y ``cProfile``.
+		legacy_lprof: ``.lprof`` existente de la versión sin refactorizar (en lugar de medir).
+		refactored_lprof: ``.lprof`` existente de la versión refactorizada (en lugar de medir).
+		baseline_lprof: ``.lprof`` previo de la versión refactorizada para comparar línea a línea.
+		baseline_source: Revisión de git o copia del archivo con la que se generó
+			``baseline_lprof``; por defecto se usa el archivo actual.
+		top: Funciones listadas por versión en la sección de ``cProfile``.
+
+	Returns:
+		Lista de ``ReportSection`` lista para ``render_markdown`` o ``render_html``.
+
+	Raises:
+		ValueError: Si algún ``.lprof`` no corresponde al código fuente indicado.
+	"""
+
+	def legacy_call() -> object:
+		return CodigoSinRefactorizar.simular_juego_sin_refactor(num_players, legacy_rounds)
+
+	def refactored_call() -> object:
+		return CodigoRefactorizado.simulate_dice_game(num_players, rounds, batch_size=batch_size)
+
+	config = ReportSection("Configuración")
+	config.add_paragraph(
+		f"Jugadores: {num_players}. Rondas sin refactor: {legacy_rounds:,}. "
+		f"Rondas refactorizado: {rounds:,} (lote {batch_size:,}). Repeticiones: {repeat}."
+	)
+	config.add_paragraph(
+		"Los *speedups* por ronda normalizan el tiempo, ya que ambas versiones "
+		"se miden con distinta cantidad de rondas."
+	)
+	sections = [config]
+
+	legacy_time = run_timeit(legacy_call, repeat)
+	refactored_time = run_timeit(refactored_call, repeat)
+	normalized = speedup(legacy_time, refactored_time, slow_scale=legacy_rounds, fast_scale=rounds)
+	timeit_section = ReportSection("timeit")
+	timeit_section.add_paragraph(
+		f"**Speedup por ronda ≈ ×{normalized.value:,.2f} ± {normalized.std_error:,.2f}** (error estándar)."
+	)
+	timeit_section.add_table(
+		["Versión", "Corridas (s)", "Media (s)", "Desvío (s)", "Por ronda (µs)"],
+		[
+			[
+				name,
+				", ".join(f"{value:.4f}" for value in summary.samples),
+				f"{summary.mean:.5f}",
+				f"{summary.stdev:.5f}",
+				f"{summary.mean / scale * 1e6:.3f}",
+			]
+			for name, summary, scale in (
+				("Sin refactor", legacy_time, legacy_rounds),
+				("Refactorizada", refactored_time, rounds),
+			)
+		],
+	)
+	sections.append(timeit_section)
+
+	legacy_profile = run_cprofile(legacy_call, repeat)
+	refactored_profile = run_cprofile(refactored_call, repeat)
+	entry_legacy = next(v for k, v in legacy_profile.items() if k.endswith("(simular_juego_sin_refactor)"))
+	entry_refactored = next(v for k, v in refactored_profile.items() if k.endswith("(simulate_dice_game)"))
+	entry_speedup = speedup(entry_legacy, entry_refactored, slow_scale=legacy_rounds, fast_scale=rounds)
+	cprofile_section = ReportSection("cProfile")
+	cprofile_section.add_paragraph(
+		f"Función principal por ronda: {entry_legacy.mean / legacy_rounds * 1e6:,.3f} µs → "
+		f"{entry_refactored.mean / rounds * 1e6:,.3f} µs. "
+		f"**Speedup por ronda ≈ ×{entry_speedup.value:,.2f} ± {entry_speedup.std_error:,.2f}**."
+	)
+	for name, profile in (("Sin refactor", legacy_profile), ("Refactorizada", refactored_profile)):
+		ranked = sorted(profile.items(), key=lambda item: item[1].mean, reverse=True)[:top]
+		cprofile_section.add_paragraph(f"{name}: {top} funciones con mayor tiempo acumulado.")
+		cprofile_section.add_table(
+			["Función", "Acumulado medio (s)", "Desvío (s)"],
+			[[f"`{key}`", f"{summary.mean:.5f}", f"{summary.stdev:.5f}"] for key, summary in ranked],
+		)
+	shared = sorted(set(legacy_profile) & set(refactored_profile))
+	if shared:
+		cprofile_section.add_paragraph("Funciones presentes en ambas versiones, por ronda simulada.")
+		rows = []
+		for key in shared:
+			slow, fast = legacy_profile[key], refactored_profile[key]
+			ratio = "—"
+			if slow.mean and fast.mean:
+				shared_speedup = speedup(slow, fast, slow_scale=legacy_rounds, fast_scale=rounds)
+				ratio = f"×{shared_speedup.value:,.2f} ± {shared_speedup.std_error:,.2f}"
+			rows.append(
+				[
+					f"`{key}`",
+					f"{slow.mean / legacy_rounds * 1e6:,.3f}",
+					f"{fast.mean / rounds * 1e6:,.3f}",
+					ratio,
+				]
+			)
+		cprofile_section.add_table(
+			["Función", "Sin refactor (µs/ronda)", "Refactorizada (µs/ronda)", "Speedup por ronda"], rows
+		)
+	sections.append(cprofile_section)
+
+	line_section = ReportSection("line_profiler")
+	sections.append(line_section)
+	if line_profiler is None:
+		line_section.add_paragraph("`line_profiler` no está instalado: se omite el análisis por línea.")
+		return sections
+
+	legacy_lines = (
+		load_line_profile(legacy_lprof)
+		if legacy_lprof
+		else run_line_profile(legacy_call, [getattr(CodigoSinRefactorizar, name) for name in LEGACY_LINE_FUNCTIONS])
+	)
+	refactored_lines = (
+		load_line_profile(refactored_lprof)
+		if refactored_lprof
+		else run_line_profile(
+			refactored_call, [getattr(CodigoRefactorizado, name) for name in REFACTORED_LINE_FUNCTIONS]
+		)
+	)
+	legacy_total = sum(record.total for record in legacy_lines)
+	refactored_total = sum(record.total for record in refactored_lines)
+	if legacy_lprof or refactored_lprof:
+		# Un .lprof no registra con cuántas rondas se generó: no hay cómo normalizarlo.
+		line_section.add_paragraph(
+			f"Tiempo total perfilado: {legacy_total:.4f} s (sin refactor) y {refactored_total:.4f} s "
+			"(refactorizada). No se comparan: al menos un perfil se cargó de un `.lprof` y se "
+			"desconocen sus rondas. Usa las secciones timeit y cProfile para el speedup."
+		)
+	else:
+		line_section.add_paragraph(
+			f"Tiempo perfilado por ronda: {legacy_total / legacy_rounds * 1e6:,.3f} µs → "
+			f"{refactored_total / rounds * 1e6:,.3f} µs "
+			f"(×{(legacy_total / legacy_rounds) / (refactored_total / rounds):,.2f}; una sola corrida "
+			"con el costo de instrumentación de line_profiler, sin estimación de varianza)."
+		)
+	for record in legacy_lines + refactored_lines:
+		source = os.path.basename(record.filename.replace("\\", "/"))
+		line_section.add_paragraph(f"`{record.function}` ({source}): {record.total:.5f} s.")
+		line_section.add_table(*_line_table(record))
+
+	if baseline_lprof:
+		delta_section = ReportSection("Comparación por línea contra el perfil base")
+		origin = f"`{baseline_source}`" if baseline_source else "el archivo actual"
+		delta_section.add_paragraph(
+			f"Base: `{baseline_lprof}` (código de {origin}). Las líneas se emparejan por su "
+			"código fuente; las que sólo existen en una versión se muestran con «—». Se compara "
+			"el tiempo por hit porque los perfiles pueden venir de cargas distintas; cada perfil es "
+			"una sola corrida, así que no hay estimación de varianza."
+		)
+		baseline = {record.function: record for record in load_line_profile(baseline_lprof, baseline_source)}
+		for record in refactored_lines:
+			if record.function in baseline:
+				delta_section.add_paragraph(f"`{record.function}`")
+				mismatched = hit_mismatches(baseline[record.function], record)
+				if mismatched:
+					delta_section.add_paragraph(
+						f"⚠ **Cargas distintas**: {mismatched} líneas tienen otra cantidad de hits (rondas o "
+						"lote distintos). El costo por hit de una línea vectorizada depende del tamaño de lote, "
+						"así que estas filas no son comparables; vuelve a perfilar con la misma carga."
+					)
+				delta_section.add_table(
+					["Código", "Hits (base → actual)", "Base (µs/hit)", "Actual (µs/hit)", "Δ (µs/hit)", "Speedup por hit"],
+					line_deltas(baseline[record.function], record),
+				)
+		sections.append(delta_section)
+	return sections
+
+
+def _escape_cell(text: str) -> str:
+	return text.replace("|", "\\|")
+
+
+def render_markdown(sections: Sequence[ReportSection]) -> str:
+	"""Convierte las secciones en Markdown (tablas con formato GitHub)."""
+
+	lines = ["# Reporte de profiling: sin refactorizar vs refactorizado", ""]
+	for section in sections:
+		lines += [f"## {section.title}", ""]
+		for block in section.blocks:
+			if isinstance(block, str):
+				lines += [block, ""]
+				continue
+			headers, rows = block
+			lines.append("| " + " | ".join(headers) + " |")
+			lines.append("|" + "---|" * len(headers))
+			lines += ["| " + " | ".join(_escape_cell(cell) for cell in row) + " |" for row in rows]
+			lines.append("")
+	return "\n".join(lines)
+
+
+def _inline_html(text: str) -> str:
+	"""Escapa el texto y traduce el Markdown mínimo usado (``código`` y **negrita**)."""
+
+	escaped = html.escape(text)
+	parts = escaped.split("`")
+	escaped = "".join(f"<code>{part}</code>" if idx % 2 else part for idx, part in enumerate(parts))
+	parts = escaped.split("**")
+	return "".join(f"<strong>{part}</strong>" if idx % 2 else part for idx, part in enumerate(parts))
+
+
+def render_html(sections: Sequence[ReportSection]) -> str:
+	"""Convierte las secciones en un documento HTML autocontenido."""
+
+	body = ["<h1>Reporte de profiling: sin refactorizar vs refactorizado</h1>"]
+	for section in sections:
+		body.append(f"<h2>{html.escape(section.title)}</h2>")
+		for block in section.blocks:
+			if isinstance(block, str):
+				body.append(f"<p>{_inline_html(block)}</p>")
+				continue
+			headers, rows = block
+			body.append("<table>")
+			body.append("<tr>" + "".join(f"<th>{html.escape(h)}</th>" for h in headers) + "</tr>")
+			body += ["<tr>" + "".join(f"<td>{_inline_html(cell)}</td>" for cell in row) + "</tr>" for row in rows]
+			body.append("</table>")
+	return (
+		"<!DOCTYPE html>\n<html lang=\"es\"><head><meta charset=\"utf-8\"><title>Reporte de profiling</title>"
+		"<style>body{font-family:sans-serif;margin:2em}table{border-collapse:collapse;margin:1em 0}"
+		"td,th{border:1px solid #ccc;padding:4px 8px;text-align:right}td:last-child{text-align:left}</style>"
+		"</head><body>\n" + "\n".join(body) + "\n</body></html>\n"
+	)
+
+
+class ProfilingReportTests(unittest.TestCase):
+	"""Pruebas del generador de reportes con corridas mínimas."""
+
+	def test_speedup_propagates_variance(self) -> None:
+		result = speedup(TimingSummary([10.0, 10.0]), TimingSummary([1.0, 1.0]), slow_scale=5, fast_scale=1)
+		self.assertAlmostEqual(result.value, 2.0)
+		self.assertEqual(result.std_error, 0.0)
+		noisy = speedup(TimingSummary([9.0, 11.0]), TimingSummary([1.0, 1.0]))
+		self.assertGreater(noisy.std_error, 0.0)
+
+	def test_stale_line_profile_is_rejected(self) -> None:
+		old = ["@profile", "def run():", "    x = 1", "    return x"]
+		with tempfile.TemporaryDirectory() as tmp:
+			current, snapshot = os.path.join(tmp, "modulo.py"), os.path.join(tmp, "base.py")
+			for path, lines in ((current, ["import os", ""] + old), (snapshot, old)):
+				with open(path, "w", encoding="utf-8") as handle:
+					handle.write("\n".join(lines))
+			# Perfil medido sobre ``old``: en el archivo actual la función se corrió dos líneas.
+			stats = SimpleNamespace(unit=1e-6, timings={(current, 1, "run"): [(3, 1, 10), (4, 1, 5)]})
+			with self.assertRaises(ValueError):
+				_line_records_from_stats(stats)
+			[record] = _line_records_from_stats(stats, snapshot)
+		self.assertEqual([text for _, _, _, text in record.lines], ["x = 1", "return x"])
+
+	def test_line_deltas_compare_per_hit_and_flag_workloads(self) -> None:
+		base = LineRecord("run", "modulo.py", [(3, 10, 0.01, "x = 1"), (4, 10, 0.02, "return x")])
+		same = LineRecord("run", "modulo.py", [(5, 10, 0.005, "x = 1"), (6, 10, 0.02, "return x")])
+		larger = LineRecord("run", "modulo.py", [(3, 40, 0.02, "x = 1"), (4, 10, 0.02, "return x")])
+		self.assertEqual(hit_mismatches(base, same), 0)
+		self.assertEqual(line_deltas(base, same)[0], ["`x = 1`", "10 → 10", "1000.000", "500.000", "-500.000", "×2.00"])
+		self.assertEqual(hit_mismatches(base, larger), 1)
+		self.assertEqual(line_deltas(base, larger)[0][1:3], ["10 → 40 ⚠", "1000.000"])
+		self.assertEqual(line_deltas(base, larger)[0][-1], "×2.00")
+
+	def test_report_renders_both_formats(self) -> None:
+		sections = build_report(2, legacy_rounds=2, rounds=20_000, batch_size=5_000, repeat=2)
+		self.assertEqual([s.title for s in sections][:3], ["Configuración", "timeit", "cProfile"])
+		markdown = render_markdown(sections)
+		self.assertIn("## timeit", markdown)
+		self.assertIn("Speedup por ronda", markdown)
+		self.assertIn("<table>", render_html(sections))
+
+
+def main() -> None:
+	"""Punto de entrada de línea de comandos del generador de reportes."""
+
+	parser = argparse.ArgumentParser(description="Reporte comparativo de profiling")
+	parser.add_argument("--players", type=int, default=4, help="Número de jugadores (1-4)")
+	parser.add_argument("--legacy-rounds", type=int, default=25, help="Rondas para la versión sin refactorizar")
+	parser.add_argument("--rounds", type=int, default=1_000_000, help="Rondas para la versión refactorizada")
+	parser.add_argument("--batch", type=int, default=100_000, help="Tamaño de lote de la versión refactorizada")
+	parser.add_argument("--repeat", type=int, default=3, help="Repeticiones de timeit y cProfile")
+	parser.add_argument("--legacy-lprof", default=None, help="Usa este .lprof en lugar de perfilar la versión sin refactorizar")
+	parser.add_argument("--refactored-lprof", default=None, help="Usa este .lprof en lugar de perfilar la versión refactorizada")
+	parser.add_argument("--baseline-lprof", default=None, help="Perfil previo de la versión refactorizada para comparar por línea")
+	parser.add_argument(
+		"--baseline-source",
+		default=None,
+		metavar="REV|ARCHIVO",
+		help="Revisión de git o copia del código con que se generó --baseline-lprof",
+	)
+	parser.add_argument("--format", choices=("md", "html"), default="md", help="Formato del reporte")
+	parser.add_argument("--output", default=None, help="Archivo de salida (por defecto stdout)")
+	parser.add_argument("--run-tests", action="store_true", help="Ejecuta los tests unitarios")
+	args = parser.parse_args()
+
+	if args.run_tests:
+		suite = unittest.defaultTestLoader.loadTestsFromTestCase(ProfilingReportTests)
+		unittest.TextTestRunner(verbosity=2).run(suite)
+		return
+
+	try:
+		sections = build_report(
+			args.players,
+			legacy_rounds=args.legacy_rounds,
+			rounds=args.rounds,
+			batch_size=args.batch,
+			repeat=args.repeat,
+			legacy_lprof=args.legacy_lprof,
+			refactored_lprof=args.refactored_lprof,
+			baseline_lprof=args.baseline_lprof,
+			baseline_source=args.baseline_source,
+		)
+	except ValueError as exc:
+		parser.error(str(exc))
+	report = render_html(sections) if args.format == "html" else render_markdown(sections)
+	if args.output:
+		with open(args.output, "w", encoding="utf-8") as handle:
+			handle.write(report)
+		print(f"Reporte escrito en {args.output}")
+	else:
+		print(report)
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,408 @@
+"""Batería de validación estadística a gran escala para el motor refactorizado.
+
+Complementa a ``DiceGameTests`` (que sólo verifica rangos y sumas con pocas miles de
+tiradas) con pruebas capaces de detectar sesgos sutiles en el kernel de tiradas o en
+los motores paralelos: bondad de ajuste chi-cuadrado por jugador, correlación serial
+de orden 1 e independencia entre pares de jugadores. Además cada bloque se acumula
+también con el motor con hilos (``count_round_outcomes``, el núcleo de
+``simulate_dice_game_threaded``) y sus tablas de caras y de pares, derivadas del
+histograma conjunto, deben coincidir celda a celda con el conteo directo de las
+tiradas de ``rolls_for_rounds``; esa verificación se informa aparte de las pruebas
+de hipótesis. Las tiradas se procesan por bloques de rondas repartidos entre todos los
+núcleos y bajo un presupuesto de tiempo.
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import os
+import time
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from itertools import combinations
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from CodigoRefactorizado import count_round_outcomes, rolls_for_rounds
+
+
+# Varianza de (2x - 7) para un dado justo: 4 * 35 / 12.
+_CENTERED_VARIANCE = 35 / 3
+# Hilos del motor de producción con los que se recuenta cada bloque.
+_ENGINE_THREADS = 2
+
+
+@dataclass
+class BlockStats:
+	"""Acumuladores de un bloque de rondas; se suman para obtener el total."""
+
+	rounds: int
+	frequencies: np.ndarray  # (jugadores, 6)
+	lag_products: np.ndarray  # (jugadores,) suma de (2x_t - 7)(2x_{t+1} - 7)
+	lag_pairs: int
+	pair_tables: np.ndarray  # (pares de jugadores, 36)
+	engine_mismatches: int  # Celdas en que el motor con hilos difiere del conteo directo.
+
+	def merge(self, other: "BlockStats") -> "BlockStats":
+		"""Combina dos acumuladores."""
+
+		return BlockStats(
+			rounds=self.rounds + other.rounds,
+			frequencies=self.frequencies + other.frequencies,
+			lag_products=self.lag_products + other.lag_products,
+			lag_pairs=self.lag_pairs + other.lag_pairs,
+			pair_tables=self.pair_tables + other.pair_tables,
+			engine_mismatches=self.engine_mismatches + other.engine_mismatches,
+		)
+
+
+@dataclass
+class HypothesisResult:
+	"""Resultado de una prueba de hipótesis individual."""
+
+	name: str
+	statistic: float
+	dof: int | None
+	p_value: float
+
+
+@dataclass
+class ValidationReport:
+	"""Resumen reproducible de una corrida de validación.
+
+	Repetir ``run_validation`` con la misma ``seed``, ``num_players``, ``block_rounds`` y
+	``max_rounds=rounds`` reprocesa exactamente las mismas tiradas.
+	"""
+
+	seed: int
+	num_players: int
+	rounds: int
+	block_rounds: int
+	workers: int
+	elapsed: float
+	tests: List[HypothesisResult] = field(default_factory=list)
+	engine_consistent: bool = True  # El motor con hilos coincide con el conteo directo.
+
+	@property
+	def rolls(self) -> int:
+		"""Cantidad total de dados evaluados."""
+
+		return self.rounds * self.num_players
+
+	def passed(self, alpha: float = 0.001) -> bool:
+		"""``True`` si el motor es consistente y ninguna prueba rechaza con Bonferroni sobre ``alpha``."""
+
+		return self.engine_consistent and all(test.p_value >= alpha / len(self.tests) for test in self.tests)
+
+	def to_text(self, alpha: float = 0.001) -> str:
+		"""Tabla legible con estadísticos y p-valores."""
+
+		lines = [
+			f"Semilla: {self.seed} | jugadores: {self.num_players} | rondas: {self.rounds:,} "
+			f"| dados: {self.rolls:,} | procesos: {self.workers} | {self.elapsed:.1f} s",
+		]
+		for test in self.tests:
+			dof = "" if test.dof is None else f" (gl={test.dof})"
+			lines.append(f"  {test.name:<32} estadístico={test.statistic:>12.4f}{dof:<9} p={test.p_value:.4g}")
+		lines.append("Motor con hilos = conteo directo: " + ("sí" if self.engine_consistent else "NO"))
+		lines.append("Resultado: " + ("OK" if self.passed(alpha) else "RECHAZADO") + f" (alpha={alpha}, Bonferroni)")
+		return "\n".join(lines)
+
+
+def chi2_sf(statistic: float, dof: int) -> float:
+	"""Función de supervivencia de la chi-cuadrado, P(X >= statistic).
+
+	Usa la gamma incompleta regularizada: serie para ``x < a + 1`` y fracción
+	continua de Lentz en otro caso (error relativo ~1e-14).
+	"""
+
+	if statistic <= 0:
+		return 1.0
+	a, x = dof / 2, statistic / 2
+	log_prefactor = a * math.log(x) - x - math.lgamma(a)
+	if x < a + 1:
+		term = total = 1 / a
+		denominator = a
+		for _ in range(10_000):
+			denominator += 1
+			term *= x / denominator
+			total += term
+			if abs(term) < abs(total) * 1e-15:
+				break
+		return max(0.0, 1.0 - total * math.exp(log_prefactor))
+
+	tiny = 1e-300
+	b = x + 1 - a
+	c = 1 / tiny
+	d = 1 / b
+	h = d
+	for step in range(1, 10_000):
+		an = -step * (step - a)
+		b += 2
+		d = an * d + b
+		d = tiny if abs(d) < tiny else d
+		c = b + an / c
+		c = tiny if abs(c) < tiny else c
+		d = 1 / d
+		delta = d * c
+		h *= delta
+		if abs(delta - 1) < 1e-15:
+			break
+	return min(1.0, h * math.exp(log_prefactor))
+
+
+def _engine_tables(seed: int, num_players: int, start_round: int, rounds: int) -> Tuple[np.ndarray, np.ndarray]:
+	"""Tablas de caras y de pares del bloque según los acumuladores del motor con hilos.
+
+	Recorre ``[start_round, start_round + rounds)`` con ``count_round_outcomes`` en
+	``_ENGINE_THREADS`` hilos y lotes de un tercio del bloque, para que haya cortes de
+	lote, de hilo y de grupo dentro del bloque. Los pares salen de marginalizar el
+	histograma conjunto.
+
+	Returns:
+		Frecuencias ``(jugadores, 6)`` y tablas de pares ``(pares, 36)``.
+	"""
+
+	counts = count_round_outcomes(
+		num_players,
+		start_round,
+		start_round + rounds,
+		seed=seed,
+		batch_size=max(1, rounds // 3),
+		threads=_ENGINE_THREADS,
+	)
+	joint = counts.joint.reshape((6,) * num_players)
+	pairs = list(combinations(range(num_players), 2))
+	pair_tables = np.zeros((len(pairs), 36), dtype=np.int64)
+	for pair_idx, pair in enumerate(pairs):
+		others = tuple(axis for axis in range(num_players) if axis not in pair)
+		pair_tables[pair_idx] = joint.sum(axis=others).ravel()
+	return counts.frequencies, pair_tables
+
+
+def _block_stats(
+	seed: int,
+	num_players: int,
+	block_index: int,
+	block_rounds: int,
+	rounds: int | None = None,
+) -> BlockStats:
+	"""Genera y resume las tiradas del bloque ``block_index`` con el kernel de producción.
+
+	El bloque empieza en la ronda ``block_index * block_rounds`` y abarca ``rounds``
+	rondas (por defecto ``block_rounds``; el último bloque de una corrida puede ser
+	más corto). Las mismas rondas se recuentan con ``_engine_tables`` y las celdas
+	que difieren se informan en ``engine_mismatches``.
+	"""
+
+	rounds = block_rounds if rounds is None else rounds
+	start_round = block_index * block_rounds
+	rolls = rolls_for_rounds(num_players, start_round, start_round + rounds, seed=seed)
+	codes = rolls - 1
+	frequencies = np.stack([np.bincount(codes[:, idx], minlength=6) for idx in range(num_players)])
+	centered = 2 * rolls - 7
+	lag_products = np.einsum("ij,ij->j", centered[:-1], centered[1:])
+	pairs = list(combinations(range(num_players), 2))
+	pair_tables = np.zeros((len(pairs), 36), dtype=np.int64)
+	for pair_idx, (left, right) in enumerate(pairs):
+		pair_tables[pair_idx] = np.bincount(codes[:, left] * 6 + codes[:, right], minlength=36)
+	engine_frequencies, engine_pairs = _engine_tables(seed, num_players, start_round, rounds)
+	return BlockStats(
+		rounds=rounds,
+		frequencies=frequencies,
+		lag_products=lag_products,
+		lag_pairs=rounds - 1,  # El par que cruza el borde del bloque se omite.
+		pair_tables=pair_tables,
+		engine_mismatches=int(
+			np.count_nonzero(engine_frequencies != frequencies) + np.count_nonzero(engine_pairs != pair_tables)
+		),
+	)
+
+
+def _worker(
+	seed: int,
+	num_players: int,
+	block_rounds: int,
+	first_block: int,
+	stride: int,
+	max_rounds: int,
+	deadline: float,
+) -> Dict[int, BlockStats]:
+	"""Procesa los bloques ``first_block, first_block + stride, ...`` hasta agotar tiempo o rondas.
+
+	El último bloque se recorta para no pasar de ``max_rounds``.
+	"""
+
+	results: Dict[int, BlockStats] = {}
+	block_index = first_block
+	while block_index * block_rounds < max_rounds and time.time() < deadline:
+		rounds = min(block_rounds, max_rounds - block_index * block_rounds)
+		results[block_index] = _block_stats(seed, num_players, block_index, block_rounds, rounds)
+		block_index += stride
+	return results
+
+
+def _evaluate(stats: BlockStats, num_players: int) -> List[HypothesisResult]:
+	"""Calcula estadísticos y p-valores sobre los acumuladores consolidados."""
+
+	tests: List[HypothesisResult] = []
+	expected = stats.rounds / 6
+	for idx in range(num_players):
+		chi2 = float(((stats.frequencies[idx] - expected) ** 2).sum() / expected)
+		tests.append(HypothesisResult(f"Chi-cuadrado caras J{idx + 1}", chi2, 5, chi2_sf(chi2, 5)))
+	for idx in range(num_players):
+		z_score = float(stats.lag_products[idx]) / (_CENTERED_VARIANCE * math.sqrt(stats.lag_pairs))
+		p_value = math.erfc(abs(z_score) / math.sqrt(2))
+		tests.append(HypothesisResult(f"Correlación serial lag-1 J{idx + 1}", z_score, None, p_value))
+	for pair_idx, (left, right) in enumerate(combinations(range(num_players), 2)):
+		table = stats.pair_tables[pair_idx].reshape(6, 6).astype(np.float64)
+		expected_table = np.outer(table.sum(axis=1), table.sum(axis=0)) / table.sum()
+		chi2 = float(((table - expected_table) ** 2 / expected_table).sum())
+		tests.append(HypothesisResult(f"Independencia J{left + 1}-J{right + 1}", chi2, 25, chi2_sf(chi2, 25)))
+	return tests
+
+
+def run_validation(
+	num_players: int = 4,
+	*,
+	max_rounds: int = 250_000_000,
+	time_budget: float = 60.0,
+	seed: int | None = None,
+	block_rounds: int = 1_000_000,
+	workers: int | None = None,
+) -> ValidationReport:
+	"""Ejecuta la batería completa en paralelo y dentro de un presupuesto de tiempo.
+
+	Los bloques de ``block_rounds`` rondas se reparten en forma intercalada entre
+	``workers`` procesos; cada uno salta con ``advance`` al inicio de su bloque, por
+	lo que el contenido de cada bloque sólo depende de la semilla. Si ``max_rounds``
+	no es múltiplo de ``block_rounds`` (o es menor) el último bloque se recorta, así
+	que nunca se evalúan más ni menos de ``max_rounds`` rondas. Al vencer el
+	presupuesto se conserva el mayor prefijo contiguo de bloques terminados, de modo
+	que el informe siempre describe las rondas ``[0, rounds)`` y es reproducible.
+
+	Args:
+		num_players: Jugadores simulados (1-4).
+		max_rounds: Rondas máximas a evaluar (4 jugadores × 2.5e8 = 1e9 dados).
+		time_budget: Segundos disponibles para generar bloques.
+		seed: Semilla; si es ``None`` se genera una y se informa en el reporte.
+		block_rounds: Rondas por bloque de trabajo.
+		workers: Procesos a utilizar; por defecto ``os.cpu_count()``.
+
+	Returns:
+		``ValidationReport`` con p-valores de cada prueba.
+	"""
+
+	if not 1 <= num_players <= 4:
+		raise ValueError("El número de jugadores debe estar entre 1 y 4")
+	if max_rounds <= 0 or block_rounds <= 0:
+		raise ValueError("Las rondas y el tamaño de bloque deben ser mayores a cero")
+	if time_budget <= 0:
+		raise ValueError("El presupuesto de tiempo debe ser mayor a cero")
+	seed = int(np.random.SeedSequence().entropy) if seed is None else seed
+	workers = workers or os.cpu_count() or 1
+	max_blocks = -(-max_rounds // block_rounds)
+
+	start = time.time()
+	deadline = start + time_budget
+	completed: Dict[int, BlockStats] = {}
+	with ProcessPoolExecutor(max_workers=workers) as executor:
+		futures = [
+			executor.submit(_worker, seed, num_players, block_rounds, worker_idx, workers, max_rounds, deadline)
+			for worker_idx in range(min(workers, max_blocks))
+		]
+		for future in futures:
+			completed.update(future.result())
+	elapsed = time.time() - start
+
+	prefix = 0
+	while prefix in completed:
+		prefix += 1
+	if prefix == 0:
+		raise RuntimeError("El presupuesto de tiempo no alcanzó para completar un bloque")
+	merged = completed[0]
+	for block_index in range(1, prefix):
+		merged = merged.merge(completed[block_index])
+
+	return ValidationReport(
+		seed=seed,
+		num_players=num_players,
+		rounds=merged.rounds,
+		block_rounds=block_rounds,
+		workers=workers,
+		elapsed=elapsed,
+		tests=_evaluate(merged, num_players),
+		# No es una prueba estadística: cualquier celda distinta es un error del motor.
+		engine_consistent=merged.engine_mismatches == 0,
+	)
+
+
+class StatisticalValidationTests(unittest.TestCase):
+	"""Pruebas rápidas de los estadísticos de la batería."""
+
+	def test_chi2_sf_known_values(self) -> None:
+		self.assertAlmostEqual(chi2_sf(11.0705, 5), 0.05, places=4)
+		self.assertAlmostEqual(chi2_sf(2.0, 2), math.exp(-1), places=12)
+		self.assertAlmostEqual(chi2_sf(37.6525, 25), 0.05, places=4)
+
+	def test_small_run_is_reproducible_and_passes(self) -> None:
+		first = run_validation(3, max_rounds=200_000, time_budget=30, seed=9, block_rounds=50_000, workers=2)
+		second = run_validation(3, max_rounds=200_000, time_budget=30, seed=9, block_rounds=50_000, workers=1)
+		self.assertEqual(first.rounds, 200_000)
+		self.assertEqual([t.statistic for t in first.tests], [t.statistic for t in second.tests])
+		self.assertTrue(first.passed())
+
+	def test_last_block_is_clipped_and_engine_matches(self) -> None:
+		report = run_validation(2, max_rounds=70_000, time_budget=30, seed=4, block_rounds=50_000, workers=1)
+		self.assertEqual(report.rounds, 70_000)
+		short = run_validation(2, max_rounds=30_000, time_budget=30, seed=4, block_rounds=50_000, workers=1)
+		self.assertEqual(short.rounds, 30_000)
+		self.assertTrue(report.engine_consistent)
+		self.assertEqual(len(report.tests), 2 + 2 + 1)
+		stats = _block_stats(4, 3, 1, 50_000, 20_000)
+		self.assertEqual((stats.rounds, stats.engine_mismatches), (20_000, 0))
+		report.engine_consistent = False
+		self.assertFalse(report.passed())
+
+	def test_detects_biased_frequencies(self) -> None:
+		stats = _block_stats(1, 2, 0, 600_000)
+		stats.frequencies[0] += np.array([2_000, 0, 0, 0, 0, -2_000])
+		self.assertLess(_evaluate(stats, 2)[0].p_value, 1e-6)
+
+
+def main() -> None:
+	"""Punto de entrada de línea de comandos de la batería estadística."""
+
+	parser = argparse.ArgumentParser(description="Validación estadística a gran escala del simulador")
+	parser.add_argument("--players", type=int, default=4, help="Número de jugadores (1-4)")
+	parser.add_argument("--rounds", type=int, default=250_000_000, help="Rondas máximas a evaluar")
+	parser.add_argument("--budget", type=float, default=60.0, help="Presupuesto de tiempo en segundos")
+	parser.add_argument("--seed", type=int, default=None, help="Semilla (se informa si se genera)")
+	parser.add_argument("--block", type=int, default=1_000_000, help="Rondas por bloque de trabajo")
+	parser.add_argument("--workers", type=int, default=None, help="Procesos (por defecto todos los núcleos)")
+	parser.add_argument("--alpha", type=float, default=0.001, help="Nivel de significación global")
+	parser.add_argument("--run-tests", action="store_true", help="Ejecuta los tests unitarios")
+	args = parser.parse_args()
+
+	if args.run_tests:
+		suite = unittest.defaultTestLoader.loadTestsFromTestCase(StatisticalValidationTests)
+		unittest.TextTestRunner(verbosity=2).run(suite)
+		return
+
+	report = run_validation(
+		args.players,
+		max_rounds=args.rounds,
+		time_budget=args.budget,
+		seed=args.seed,
+		block_rounds=args.block,
+		workers=args.workers,
+	)
+	print(report.to_text(args.alpha))
+	raise SystemExit(0 if report.passed(args.alpha) else 1)
+
+
+if __name__ == "__main__":
+	main()